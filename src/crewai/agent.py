@@ -14,14 +14,17 @@ from typing import (
     Union,
 )
 
-from pydantic import Field, InstanceOf, PrivateAttr, model_validator
+from pydantic import Field, InstanceOf, PrivateAttr, field_validator, model_validator
 
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
+from crewai.knowledge.batch_query import query_knowledge
 from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.knowledge_config import KnowledgeConfig
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.utils.knowledge_utils import extract_knowledge_context
+from crewai.knowledge.utils.query_rewrite_cache import get_query_rewrite_cache
 from crewai.lite_agent import LiteAgent, LiteAgentOutput
 from crewai.llm import BaseLLM
 from crewai.memory.contextual.contextual_memory import ContextualMemory
@@ -29,6 +32,7 @@ from crewai.security import Fingerprint
 from crewai.task import Task
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.tools.tool_output import ToolOutputStore
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.agent_utils import (
     get_tool_names,
@@ -60,6 +64,9 @@ from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
+PROMPT_CACHE_SIZE = 32
+"""Maximum number of task execution prompts memoized per agent."""
+
 
 class Agent(BaseAgent):
     """Represents an agent in a system.
@@ -139,6 +146,10 @@ class Agent(BaseAgent):
         default="%Y-%m-%d",
         description="Format string for date when inject_date is enabled.",
     )
+    prompt_caching: bool = Field(
+        default=False,
+        description="Lay out prompts with static content first and dynamic content (current date, memory, knowledge) last, and mark the static prefix for provider prompt caching when the LLM supports explicit cache markers.",
+    )
     code_execution_mode: Literal["safe", "unsafe"] = Field(
         default="safe",
         description="Mode for code execution: 'safe' (using Docker) or 'unsafe' (direct execution).",
@@ -178,6 +189,14 @@ class Agent(BaseAgent):
     guardrail_max_retries: int = Field(
         default=3, description="Maximum number of retries when guardrail fails"
     )
+    max_tool_output_tokens: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens of a tool output kept inline in the agent conversation. Larger outputs are stored aside and can be paged through with the read tool output tool. None keeps tool outputs unbounded.",
+    )
+    _tool_output_store: Optional[ToolOutputStore] = PrivateAttr(default=None)
+    _prompt_cache: Dict[Tuple[Any, ...], Dict[str, str]] = PrivateAttr(
+        default_factory=dict
+    )
 
     @model_validator(mode="before")
     def validate_from_repository(cls, v):
@@ -185,6 +204,13 @@ class Agent(BaseAgent):
             return load_agent_from_repository(from_repository) | v
         return v
 
+    @field_validator("max_tool_output_tokens")
+    @classmethod
+    def validate_max_tool_output_tokens(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v <= 0:
+            raise ValueError("max_tool_output_tokens must be a positive integer")
+        return v
+
     @model_validator(mode="after")
     def post_init_setup(self):
         self.agent_ops_agent_name = self.role
@@ -201,6 +227,11 @@ class Agent(BaseAgent):
         if self.allow_code_execution:
             self._validate_docker_installation()
 
+        if self.max_tool_output_tokens is not None:
+            self._tool_output_store = ToolOutputStore(
+                page_tokens=self.max_tool_output_tokens
+            )
+
         return self
 
     def _setup_agent_executor(self):
@@ -221,6 +252,8 @@ class Agent(BaseAgent):
                         sources=self.knowledge_sources,
                         embedder=self.embedder,
                         collection_name=self.role,
+                        ingestion_workers=self.knowledge_ingestion_workers,
+                        hybrid_search=self.knowledge_hybrid_search,
                     )
                     self.knowledge.add_sources()
         except (TypeError, ValueError) as e:
@@ -284,7 +317,8 @@ class Agent(BaseAgent):
                 else:
                     print(f"Error during reasoning process: {str(e)}")
 
-        self._inject_date_to_task(task)
+        if not self.prompt_caching:
+            self._inject_date_to_task(task)
 
         if self.tools_handler:
             self.tools_handler.last_used_tool = None
@@ -334,6 +368,7 @@ class Agent(BaseAgent):
                 self.crew._external_memory,
                 agent=self,
                 task=task,
+                timeout=self.crew.memory_retrieval_timeout,
             )
             memory = contextual_memory.build_context_for_task(task, context)
             if memory.strip() != "":
@@ -345,13 +380,18 @@ class Agent(BaseAgent):
                     task_id=str(task.id) if task else None,
                     memory_content=memory,
                     retrieval_time_ms=(time.time() - start_time) * 1000,
+                    store_retrieval_times_ms=contextual_memory.retrieval_times_ms,
                     source_type="agent",
                     from_agent=self,
                     from_task=task,
                 ),
             )
         knowledge_config = (
-            self.knowledge_config.model_dump() if self.knowledge_config else {}
+            self.knowledge_config.model_dump(
+                include={"results_limit", "score_threshold"}
+            )
+            if self.knowledge_config
+            else {}
         )
 
         if self.knowledge or (self.crew and self.crew.knowledge):
@@ -366,22 +406,19 @@ class Agent(BaseAgent):
                     task_prompt
                 )
                 if self.knowledge_search_query:
-                    # Quering agent specific knowledge
-                    if self.knowledge:
-                        agent_knowledge_snippets = self.knowledge.query(
-                            [self.knowledge_search_query], **knowledge_config
-                        )
-                        if agent_knowledge_snippets:
-                            self.agent_knowledge_context = extract_knowledge_context(
-                                agent_knowledge_snippets
-                            )
-                            if self.agent_knowledge_context:
-                                task_prompt += self.agent_knowledge_context
-
-                    # Quering crew specific knowledge
-                    knowledge_snippets = self.crew.query_knowledge(
-                        [self.knowledge_search_query], **knowledge_config
+                    # Querying agent and crew knowledge together
+                    agent_knowledge_snippets, knowledge_snippets = query_knowledge(
+                        [self.knowledge, self.crew.knowledge if self.crew else None],
+                        [self.knowledge_search_query],
+                        **knowledge_config,
                     )
+                    if agent_knowledge_snippets:
+                        self.agent_knowledge_context = extract_knowledge_context(
+                            agent_knowledge_snippets
+                        )
+                        if self.agent_knowledge_context:
+                            task_prompt += self.agent_knowledge_context
+
                     if knowledge_snippets:
                         self.crew_knowledge_context = extract_knowledge_context(
                             knowledge_snippets
@@ -424,6 +461,11 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
+        # With prompt caching the date goes last, after memory and knowledge,
+        # so it doesn't break the reusable prefix of the task prompt.
+        if self.prompt_caching and self.inject_date:
+            task_prompt += self._current_date_block()
+
         try:
             crewai_event_bus.emit(
                 self,
@@ -562,17 +604,16 @@ class Agent(BaseAgent):
             An instance of the CrewAgentExecutor class.
         """
         raw_tools: List[BaseTool] = tools or self.tools or []
+        if self._tool_output_store is not None:
+            tool_names = {tool.name for tool in raw_tools}
+            raw_tools = list(raw_tools) + [
+                tool
+                for tool in self.get_tool_output_tools()
+                if tool.name not in tool_names
+            ]
         parsed_tools = parse_tools(raw_tools)
 
-        prompt = Prompts(
-            agent=self,
-            has_tools=len(raw_tools) > 0,
-            i18n=self.i18n,
-            use_system_prompt=self.use_system_prompt,
-            system_template=self.system_template,
-            prompt_template=self.prompt_template,
-            response_template=self.response_template,
-        ).task_execution()
+        prompt = self._task_execution_prompt(has_tools=len(raw_tools) > 0)
 
         stop_words = [self.i18n.slice("observation")]
 
@@ -603,6 +644,40 @@ class Agent(BaseAgent):
             callbacks=[TokenCalcHandler(self._token_process)],
         )
 
+    def _task_execution_prompt(self, has_tools: bool) -> Dict[str, str]:
+        """Return the static task execution prompt, built once per configuration.
+
+        The prompt only depends on the agent's (interpolated) role, goal and
+        backstory, its templates and whether it has tools, so it is memoized on
+        those values. Changing any of them yields a new key and a fresh prompt,
+        while unchanged agents get a byte-identical prompt on every task.
+        """
+        key = (
+            self.role,
+            self.goal,
+            self.backstory,
+            has_tools,
+            self.use_system_prompt,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
+            id(self.i18n),
+            self.i18n.prompt_file,
+        )
+        if key not in self._prompt_cache:
+            if len(self._prompt_cache) >= PROMPT_CACHE_SIZE:
+                self._prompt_cache.pop(next(iter(self._prompt_cache)))
+            self._prompt_cache[key] = Prompts(
+                agent=self,
+                has_tools=has_tools,
+                i18n=self.i18n,
+                use_system_prompt=self.use_system_prompt,
+                system_template=self.system_template,
+                prompt_template=self.prompt_template,
+                response_template=self.response_template,
+            ).task_execution()
+        return dict(self._prompt_cache[key])
+
     def get_delegation_tools(self, agents: List[BaseAgent]):
         agent_tools = AgentTools(agents=agents)
         tools = agent_tools.tools()
@@ -613,6 +688,14 @@ class Agent(BaseAgent):
 
         return [AddImageTool()]
 
+    def get_tool_output_tools(self) -> Sequence[BaseTool]:
+        if self._tool_output_store is None:
+            return []
+
+        from crewai.tools.agent_tools.read_tool_output_tool import ReadToolOutputTool
+
+        return [ReadToolOutputTool(store=self._tool_output_store)]
+
     def get_code_execution_tools(self):
         try:
             from crewai_tools import CodeInterpreterTool  # type: ignore
@@ -676,33 +759,38 @@ class Agent(BaseAgent):
     def _inject_date_to_task(self, task):
         """Inject the current date into the task description if inject_date is enabled."""
         if self.inject_date:
-            from datetime import datetime
+            task.description += self._current_date_block()
 
-            try:
-                valid_format_codes = [
-                    "%Y",
-                    "%m",
-                    "%d",
-                    "%H",
-                    "%M",
-                    "%S",
-                    "%B",
-                    "%b",
-                    "%A",
-                    "%a",
-                ]
-                is_valid = any(code in self.date_format for code in valid_format_codes)
+    def _current_date_block(self) -> str:
+        """Render the current date line, or an empty string if the format is invalid."""
+        from datetime import datetime
+
+        try:
+            valid_format_codes = [
+                "%Y",
+                "%m",
+                "%d",
+                "%H",
+                "%M",
+                "%S",
+                "%B",
+                "%b",
+                "%A",
+                "%a",
+            ]
+            is_valid = any(code in self.date_format for code in valid_format_codes)
 
-                if not is_valid:
-                    raise ValueError(f"Invalid date format: {self.date_format}")
+            if not is_valid:
+                raise ValueError(f"Invalid date format: {self.date_format}")
 
-                current_date: str = datetime.now().strftime(self.date_format)
-                task.description += f"\n\nCurrent Date: {current_date}"
-            except Exception as e:
-                if hasattr(self, "_logger"):
-                    self._logger.log("warning", f"Failed to inject date: {str(e)}")
-                else:
-                    print(f"Warning: Failed to inject date: {str(e)}")
+            current_date: str = datetime.now().strftime(self.date_format)
+            return f"\n\nCurrent Date: {current_date}"
+        except Exception as e:
+            if hasattr(self, "_logger"):
+                self._logger.log("warning", f"Failed to inject date: {str(e)}")
+            else:
+                print(f"Warning: Failed to inject date: {str(e)}")
+            return ""
 
     def _validate_docker_installation(self) -> None:
         """Check if Docker is installed and running."""
@@ -748,6 +836,20 @@ class Agent(BaseAgent):
                 agent=self,
             ),
         )
+        config = self.knowledge_config or KnowledgeConfig()
+        if (
+            config.direct_query_max_length is not None
+            and len(task_prompt) <= config.direct_query_max_length
+        ):
+            crewai_event_bus.emit(
+                self,
+                event=KnowledgeQueryCompletedEvent(
+                    query=task_prompt,
+                    agent=self,
+                ),
+            )
+            return task_prompt
+
         query = self.i18n.slice("knowledge_search_query").format(
             task_prompt=task_prompt
         )
@@ -766,16 +868,26 @@ class Agent(BaseAgent):
             )
             return None
 
+        cache = (
+            get_query_rewrite_cache(persist=config.persist_search_query_cache)
+            if config.cache_search_query
+            else None
+        )
+        cache_key = cache.key(self.llm, rewriter_prompt, query) if cache else ""
         try:
-            rewritten_query = self.llm.call(
-                [
-                    {
-                        "role": "system",
-                        "content": rewriter_prompt,
-                    },
-                    {"role": "user", "content": query},
-                ]
-            )
+            rewritten_query = cache.get(cache_key) if cache else None
+            if rewritten_query is None:
+                rewritten_query = self.llm.call(
+                    [
+                        {
+                            "role": "system",
+                            "content": rewriter_prompt,
+                        },
+                        {"role": "user", "content": query},
+                    ]
+                )
+                if cache and isinstance(rewritten_query, str) and rewritten_query:
+                    cache.put(cache_key, rewritten_query)
             crewai_event_bus.emit(
                 self,
                 event=KnowledgeQueryCompletedEvent(
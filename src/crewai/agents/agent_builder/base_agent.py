@@ -55,6 +55,8 @@ class BaseAgent(ABC, BaseModel):
         max_tokens: Maximum number of tokens for the agent to generate in a response.
         knowledge_sources: Knowledge sources for the agent.
         knowledge_storage: Custom knowledge storage for the agent.
+        knowledge_ingestion_workers: Number of processes parsing the agent's knowledge source files in parallel.
+        knowledge_hybrid_search: Whether to search the agent's knowledge with both embeddings and a lexical index.
         security_config: Security configuration for the agent, including fingerprinting.
 
 
@@ -146,6 +148,15 @@ class BaseAgent(ABC, BaseModel):
         default=None,
         description="Custom knowledge storage for the agent.",
     )
+    knowledge_ingestion_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Number of processes parsing the agent's knowledge source files in parallel. None adds the sources one by one.",
+    )
+    knowledge_hybrid_search: bool = Field(
+        default=False,
+        description="Whether to search the agent's knowledge with both embeddings and a BM25 lexical index, to find exact identifiers.",
+    )
     security_config: SecurityConfig = Field(
         default_factory=SecurityConfig,
         description="Security configuration for the agent, including fingerprinting.",
@@ -1,11 +1,13 @@
+import random
 import time
 from typing import TYPE_CHECKING, Dict, List
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.memory import memory_context
 from crewai.utilities import I18N
 from crewai.utilities.converter import ConverterError
-from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
+from crewai.utilities.evaluators.task_evaluator import TaskEvaluation, TaskEvaluator
 from crewai.utilities.printer import Printer
 from crewai.events.event_listener import event_listener
 
@@ -25,6 +27,27 @@ class CrewAgentExecutorMixin:
     _i18n: I18N
     _printer: Printer = Printer()
 
+    def _create_memories(self, output) -> None:
+        """Save the output to short-term, long-term and external memory.
+
+        The saves are attributed to this executor's agent and task through a
+        memory context rather than by mutating the crew's memory instances.
+        When the crew has write-behind memory enabled, the saves (including the
+        long-term memory evaluation) are queued on its memory writer instead of
+        running before the next task can start.
+        """
+        writer = getattr(self.crew, "_memory_writer", None) if self.crew else None
+        with memory_context(agent=self.agent, task=self.task):
+            for create_memory in (
+                self._create_short_term_memory,
+                self._create_long_term_memory,
+                self._create_external_memory,
+            ):
+                if writer:
+                    writer.submit(create_memory, output)
+                else:
+                    create_memory(output)
+
     def _create_short_term_memory(self, output) -> None:
         """Create and save a short-term memory item if conditions are met."""
         if (
@@ -70,7 +93,12 @@ class CrewAgentExecutorMixin:
                 pass
 
     def _create_long_term_memory(self, output) -> None:
-        """Create and save long-term and entity memory items based on evaluation."""
+        """Create and save long-term and entity memory items based on evaluation.
+
+        Only a ``memory_evaluation_sample_rate`` share of the tasks is
+        evaluated. When the crew has an evaluation queue, the evaluation is
+        batched with other completed tasks and saved once it is ready.
+        """
         if (
             self.crew
             and self.crew._long_term_memory
@@ -78,39 +106,29 @@ class CrewAgentExecutorMixin:
             and self.task
             and self.agent
         ):
+            sample_rate = getattr(self.crew, "memory_evaluation_sample_rate", 1.0)
+            if sample_rate < 1.0 and random.random() >= sample_rate:
+                return
+
+            agent, task = self.agent, self.task
+            evaluation_queue = getattr(self.crew, "_ltm_evaluation_queue", None)
+            if evaluation_queue:
+                evaluation_queue.submit(
+                    agent,
+                    task,
+                    output.text,
+                    lambda evaluation: self._save_evaluation(agent, task, evaluation),
+                )
+                return
+
             try:
-                ltm_agent = TaskEvaluator(self.agent)
-                evaluation = ltm_agent.evaluate(self.task, output.text)
+                ltm_agent = TaskEvaluator(agent)
+                evaluation = ltm_agent.evaluate(task, output.text)
 
                 if isinstance(evaluation, ConverterError):
                     return
 
-                long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.agent.role,
-                    quality=evaluation.quality,
-                    datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
-                    metadata={
-                        "suggestions": evaluation.suggestions,
-                        "quality": evaluation.quality,
-                    },
-                )
-                self.crew._long_term_memory.save(long_term_memory)
-
-                entity_memories = [
-                    EntityMemoryItem(
-                        name=entity.name,
-                        type=entity.type,
-                        description=entity.description,
-                        relationships="\n".join(
-                            [f"- {r}" for r in entity.relationships]
-                        ),
-                    )
-                    for entity in evaluation.entities
-                ]
-                if entity_memories:
-                    self.crew._entity_memory.save(entity_memories)
+                self._save_evaluation(agent, task, evaluation)
             except AttributeError as e:
                 print(f"Missing attributes for long term memory: {e}")
                 pass
@@ -127,6 +145,35 @@ class CrewAgentExecutorMixin:
                 color="bold_yellow",
             )
 
+    def _save_evaluation(
+        self, agent: "BaseAgent", task: "Task", evaluation: TaskEvaluation
+    ) -> None:
+        """Save the long-term and entity memories of an evaluated task."""
+        long_term_memory = LongTermMemoryItem(
+            task=task.description,
+            agent=agent.role,
+            quality=evaluation.quality,
+            datetime=str(time.time()),
+            expected_output=task.expected_output,
+            metadata={
+                "suggestions": evaluation.suggestions,
+                "quality": evaluation.quality,
+            },
+        )
+        self.crew._long_term_memory.save(long_term_memory)
+
+        entity_memories = [
+            EntityMemoryItem(
+                name=entity.name,
+                type=entity.type,
+                description=entity.description,
+                relationships="\n".join([f"- {r}" for r in entity.relationships]),
+            )
+            for entity in evaluation.entities
+        ]
+        if entity_memories:
+            self.crew._entity_memory.save(entity_memories)
+
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
         event_listener.formatter.pause_live_updates()
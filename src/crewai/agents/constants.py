@@ -6,6 +6,7 @@ from typing import Final
 # crewai.agents.parser constants
 
 FINAL_ANSWER_ACTION: Final[str] = "Final Answer:"
+OBSERVATION_MARKER: Final[str] = "\nObservation"
 MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE: Final[str] = (
     "I did it wrong. Invalid Format: I missed the 'Action:' after 'Thought:'. I will do right next, and don't use a tool I have already used.\n"
 )
@@ -25,3 +26,6 @@ ACTION_REGEX: Final[re.Pattern[str]] = re.compile(
 ACTION_INPUT_ONLY_REGEX: Final[re.Pattern[str]] = re.compile(
     r"\s*Action\s*\d*\s*Input\s*\d*\s*:\s*(.*)", re.DOTALL
 )
+ACTION_INPUT_MARKER_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"Action\s*\d*\s*Input\s*\d*\s*:\s*"
+)
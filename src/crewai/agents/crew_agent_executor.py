@@ -160,9 +160,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
-        self._create_short_term_memory(formatted_answer)
-        self._create_long_term_memory(formatted_answer)
-        self._create_external_memory(formatted_answer)
+        self._create_memories(formatted_answer)
         return {"output": formatted_answer.output}
 
     def _invoke_loop(self) -> AgentFinish:
@@ -192,6 +190,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     callbacks=self.callbacks,
                     printer=self._printer,
                     from_task=self.task,
+                    from_agent=self.agent,
                 )
                 formatted_answer = process_llm_response(answer, self.use_stop_words)
 
@@ -5,15 +5,18 @@ the ReAct (Reasoning and Acting) format, converting them into structured
 AgentAction or AgentFinish objects.
 """
 
+import json
 from dataclasses import dataclass
 
 from json_repair import repair_json
 
 from crewai.agents.constants import (
+    ACTION_INPUT_MARKER_REGEX,
     ACTION_INPUT_REGEX,
     ACTION_REGEX,
     ACTION_INPUT_ONLY_REGEX,
     FINAL_ANSWER_ACTION,
+    OBSERVATION_MARKER,
     MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE,
     MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE,
     UNABLE_TO_REPAIR_JSON_RESULTS,
@@ -22,6 +25,8 @@ from crewai.utilities import I18N
 
 _I18N = I18N()
 
+_THOUGHT_END_MARKERS = ("\nAction", "\nFinal Answer")
+
 
 @dataclass
 class AgentAction:
@@ -43,6 +48,21 @@ class AgentFinish:
     text: str
 
 
+class StreamedResponse(str):
+    """Response text published by :class:`StreamParser`, carrying its thought.
+
+    :func:`parse` reuses the thought rather than searching the text again.
+    Any string operation returns a plain ``str``, whose thought is searched.
+    """
+
+    thought: str
+
+    def __new__(cls, text: str, thought: str) -> "StreamedResponse":
+        response = super().__new__(cls, text)
+        response.thought = thought
+        return response
+
+
 class OutputParserException(Exception):
     """Exception raised when output parsing fails.
 
@@ -89,12 +109,19 @@ def parse(text: str) -> AgentAction | AgentFinish:
     Raises:
         OutputParserException: If the text format is invalid.
     """
-    thought = _extract_thought(text)
-    includes_answer = FINAL_ANSWER_ACTION in text
-    action_match = ACTION_INPUT_REGEX.search(text)
+    if isinstance(text, StreamedResponse):
+        return _parse(text, text.thought)
+    return _parse(text, _extract_thought(text))
+
 
-    if includes_answer:
-        final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
+def _parse(text: str, thought: str) -> AgentAction | AgentFinish:
+    """Parse ``text`` whose thought has already been extracted."""
+
+    # The final answer is whatever follows its last marker, so a reverse
+    # search avoids both splitting the whole text and the action regex.
+    answer_index = text.rfind(FINAL_ANSWER_ACTION)
+    if answer_index != -1:
+        final_answer = text[answer_index + len(FINAL_ANSWER_ACTION) :].strip()
         # Check whether the final answer ends with triple backticks.
         if final_answer.endswith("```"):
             # Count occurrences of triple backticks in the final answer.
@@ -104,7 +131,8 @@ def parse(text: str) -> AgentAction | AgentFinish:
                 final_answer = final_answer[:-3].rstrip()
         return AgentFinish(thought=thought, output=final_answer, text=text)
 
-    elif action_match:
+    action_match = ACTION_INPUT_REGEX.search(text)
+    if action_match:
         action = action_match.group(1)
         clean_action = _clean_action(action)
 
@@ -142,12 +170,16 @@ def _extract_thought(text: str) -> str:
     Returns:
         The extracted thought string.
     """
-    thought_index = text.find("\nAction")
-    if thought_index == -1:
-        thought_index = text.find("\nFinal Answer")
-    if thought_index == -1:
-        return ""
-    thought = text[:thought_index].strip()
+    for marker in _THOUGHT_END_MARKERS:
+        thought_index = text.find(marker)
+        if thought_index != -1:
+            return _thought_before(text, thought_index)
+    return ""
+
+
+def _thought_before(text: str, index: int) -> str:
+    """Return the thought ending at ``index``, without triple backticks."""
+    thought = text[:index].strip()
     # Remove any triple backticks from the thought string
     thought = thought.replace("```", "").strip()
     return thought
@@ -183,13 +215,175 @@ def _safe_repair_json(tool_input: str) -> str:
     if tool_input.startswith("[") and tool_input.endswith("]"):
         return tool_input
 
-    # Before repair, handle common LLM issues:
-    # 1. Replace """ with " to avoid JSON parser errors
+    # Well-formed JSON needs no repair, only the normalized dump repair_json
+    # would return for it.
+    try:
+        result = json.dumps(json.loads(tool_input))
+    except ValueError:
+        # Before repair, handle common LLM issues:
+        # 1. Replace """ with " to avoid JSON parser errors
+        tool_input = tool_input.replace('"""', '"')
+        result = repair_json(tool_input, skip_json_loads=True)
 
-    tool_input = tool_input.replace('"""', '"')
-
-    result = repair_json(tool_input)
     if result in UNABLE_TO_REPAIR_JSON_RESULTS:
         return tool_input
 
     return str(result)
+
+
+class StreamParser:
+    """Incrementally watch a streamed ReAct response for a complete action.
+
+    Chunks are fed as they arrive. Once an ``Action Input`` holding a JSON
+    object or array has been closed, or an ``Observation`` follows the action
+    input, the rest of the generation is not needed and the stream can stop.
+    Responses containing a final answer are never considered complete early.
+    Only each new chunk plus a short tail of the previous ones is scanned, so
+    feeding a whole response is linear in its length. The end of the thought
+    is located during the same scan, and :meth:`publish` lets :func:`parse`
+    reuse it instead of searching the response again.
+    """
+
+    _TAIL_SIZE = 32
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._length = 0
+        self._tail = ""
+        self._end: int | None = None
+        self._seen_action = False
+        self._input_found = False
+        self._opened = False
+        self._plain_input = False
+        self._plain_input_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._has_final_answer = False
+        self._thought_ends: list[int | None] = [None] * len(_THOUGHT_END_MARKERS)
+        self.is_complete = False
+
+    @property
+    def text(self) -> str:
+        """The response received so far, cut where it became complete."""
+        text = "".join(self._chunks)
+        self._chunks = [text]
+        return text if self._end is None else text[: self._end]
+
+    @property
+    def thought(self) -> str:
+        """The thought of the received response, as :func:`parse` extracts it."""
+        text = self.text
+        for marker, index in zip(_THOUGHT_END_MARKERS, self._thought_ends):
+            if index is not None and index + len(marker) <= len(text):
+                return _thought_before(text, index)
+        return ""
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a streamed chunk.
+
+        Args:
+            chunk: The next piece of the LLM response.
+
+        Returns:
+            True once the response holds a complete action.
+        """
+        if self.is_complete or not chunk:
+            return self.is_complete
+
+        offset = self._length - len(self._tail)
+        window = self._tail + chunk
+        scan_from = len(self._tail)
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        self._tail = window[-self._TAIL_SIZE :]
+        self._find_thought_end(window, offset)
+
+        if self._has_final_answer or FINAL_ANSWER_ACTION in window:
+            self._has_final_answer = True
+            return False
+
+        if not self._input_found:
+            match = ACTION_INPUT_MARKER_REGEX.search(window)
+            if not match:
+                self._seen_action = self._seen_action or bool(
+                    ACTION_REGEX.search(window)
+                )
+                return False
+            self._seen_action = self._seen_action or bool(
+                ACTION_REGEX.search(window, 0, match.start())
+            )
+            if not self._seen_action:
+                return False
+            self._input_found = True
+            scan_from = match.end()
+
+        end = self._scan_action_input(window, scan_from, offset)
+        if end is not None:
+            self._end = offset + end
+            self.is_complete = True
+        return self.is_complete
+
+    def parse(self) -> AgentAction | AgentFinish:
+        """Parse the received response with :func:`parse`."""
+        return _parse(self.text, self.thought)
+
+    def publish(self) -> StreamedResponse:
+        """Return the received response along with its thought.
+
+        The agent loop parsing the LLM response then reuses the thought
+        rather than searching for it again.
+        """
+        return StreamedResponse(self.text, self.thought)
+
+    def _find_thought_end(self, window: str, offset: int) -> None:
+        """Record the first position of each marker ending the thought."""
+        if self._thought_ends[0] is not None:
+            return
+        for position, marker in enumerate(_THOUGHT_END_MARKERS):
+            if self._thought_ends[position] is None:
+                index = window.find(marker)
+                if index != -1:
+                    self._thought_ends[position] = offset + index
+
+    def _scan_action_input(
+        self, window: str, position: int, offset: int
+    ) -> int | None:
+        """Advance over the action input, returning its end within ``window``.
+
+        ``offset`` is the position of ``window`` within the whole response.
+        """
+        while not self._plain_input and position < len(window):
+            char = window[position]
+            if not self._opened:
+                if char in "{[":
+                    self._opened = True
+                    self._depth = 1
+                elif not (char.isspace() or char == "*"):
+                    self._plain_input = True
+                    self._plain_input_start = offset + position
+                    break
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    return position + 1
+            position += 1
+
+        if self._plain_input:
+            observation = window.find(
+                OBSERVATION_MARKER, max(self._plain_input_start - offset, 0)
+            )
+            if observation != -1:
+                return observation
+        return None
@@ -21,6 +21,7 @@ from .kickoff_flow import kickoff_flow
 from .organization.main import OrganizationCommand
 from .plot_flow import plot_flow
 from .replay_from_task import replay_task_command
+from .compact_memories_command import compact_memories_command
 from .reset_memories_command import reset_memories_command
 from .run_crew import run_crew
 from .tools.main import ToolCommand
@@ -181,6 +182,61 @@ def reset_memories(
         click.echo(f"An error occurred while resetting memories: {e}", err=True)
 
 
+@crewai.group()
+def memory():
+    """Crew memory related commands."""
+    pass
+
+
+@memory.command(name="compact")
+@click.option(
+    "--ttl-days",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Remove memories older than this many days",
+)
+@click.option(
+    "--max-entries",
+    type=click.IntRange(min=0),
+    help="Maximum number of memories kept per store",
+)
+@click.option(
+    "--half-life-days",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Days after which the retention score of a memory is halved",
+)
+@click.option(
+    "--min-score",
+    type=click.FloatRange(min=0),
+    help="Remove memories whose decayed retention score is below this value",
+)
+@click.option(
+    "--similarity-threshold",
+    type=click.FloatRange(min=0, max=1),
+    help="Cosine similarity above which memories are merged as near-duplicates",
+)
+@click.option("--no-dedupe", is_flag=True, help="Do not merge duplicate memories")
+def memory_compact(
+    ttl_days: Optional[float],
+    max_entries: Optional[int],
+    half_life_days: Optional[float],
+    min_score: Optional[float],
+    similarity_threshold: Optional[float],
+    no_dedupe: bool,
+) -> None:
+    """Compact the crew short-term, long-term and entity memories."""
+    overrides = {
+        "ttl_days": ttl_days,
+        "max_entries": max_entries,
+        "recency_half_life_days": half_life_days,
+        "min_retention_score": min_score,
+        "similarity_threshold": similarity_threshold,
+    }
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+    if no_dedupe:
+        overrides["deduplicate"] = False
+    compact_memories_command(overrides)
+
+
 @crewai.command()
 @click.option(
     "-n",
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+import click
+
+from crewai.cli.utils import get_crews
+from crewai.memory.retention import MemoryRetentionPolicy
+
+
+def compact_memories_command(policy_overrides: Dict[str, Any]) -> None:
+    """
+    Compact the crew memories.
+
+    Args:
+      policy_overrides (Dict[str, Any]): Retention policy fields overriding the
+        crew's own `memory_retention` policy.
+    """
+
+    try:
+        crews = get_crews()
+        if not crews:
+            raise ValueError("No crew found.")
+        for crew in crews:
+            policy = crew.memory_retention or MemoryRetentionPolicy()
+            policy = MemoryRetentionPolicy.model_validate(
+                {**policy.model_dump(), **policy_overrides}
+            )
+            removed = crew.compact_memories(policy)
+            crew_name = crew.name if crew.name else crew.id
+            if not removed:
+                click.echo(f"[Crew ({crew_name})] No memories to compact.")
+                continue
+            details = ", ".join(
+                f"{memory_type}: {count}" for memory_type, count in removed.items()
+            )
+            click.echo(
+                f"[Crew ({crew_name})] Memory compaction has been completed, removed entries ({details})."
+            )
+
+    except Exception as e:
+        click.echo(f"An unexpected error occurred: {e}", err=True)
@@ -1,6 +1,8 @@
 import asyncio
 import json
 import re
+import threading
+import time
 import uuid
 import warnings
 from concurrent.futures import Future
@@ -46,7 +48,11 @@ from crewai.llm import LLM, BaseLLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.long_term.evaluation_queue import LongTermMemoryEvaluationQueue
+from crewai.memory.memory_writer import MemoryWriter
+from crewai.memory.retention import MemoryRetentionPolicy
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.memory.storage.in_memory_vector_storage import InMemoryVectorStorage
 from crewai.process import Process
 from crewai.security import Fingerprint, SecurityConfig
 from crewai.task import Task
@@ -102,6 +108,8 @@ class Crew(FlowTrackable, BaseModel):
         manager_llm: The language model that will run manager agent.
         manager_agent: Custom agent that will be used as manager.
         memory: Whether the crew should use memory to store memories of it's execution.
+        memory_retrieval_timeout: Maximum number of seconds memory retrieval may take before each task.
+        memory_write_behind: Whether memories are saved in the background and flushed when the kickoff finishes.
         cache: Whether the crew should use a cache to store the results of the tools execution.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
@@ -128,6 +136,11 @@ class Crew(FlowTrackable, BaseModel):
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
     _external_memory: Optional[InstanceOf[ExternalMemory]] = PrivateAttr()
+    _memory_writer: Optional[MemoryWriter] = PrivateAttr(default=None)
+    _ltm_evaluation_queue: Optional[LongTermMemoryEvaluationQueue] = PrivateAttr(
+        default=None
+    )
+    _last_memory_compaction: Optional[float] = PrivateAttr(default=None)
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -164,6 +177,38 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="An Instance of the ExternalMemory to be used by the Crew",
     )
+    memory_retrieval_timeout: Optional[float] = Field(
+        default=None,
+        description="Maximum number of seconds to wait for memory retrieval before each task. Memory stores that have not answered in time are left out of the context. None waits for all stores.",
+    )
+    memory_write_behind: bool = Field(
+        default=False,
+        description="Whether agent memories are saved by a background writer instead of before the next task starts. Pending saves are flushed when the kickoff finishes.",
+    )
+    memory_evaluation_batch_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="When set, completed tasks are evaluated for long-term memory in the background, in batches of up to this many tasks per LLM call. Pending evaluations are flushed when the kickoff finishes.",
+    )
+    memory_evaluation_sample_rate: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        description="Share of completed tasks that are evaluated for long-term and entity memory.",
+    )
+    memory_retention: Optional[MemoryRetentionPolicy] = Field(
+        default=None,
+        description="Retention policy applied when compacting the crew's short-term, long-term and entity memories.",
+    )
+    long_term_memory_max_entries_per_task: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of the latest memories the default long-term memory keeps for each task. None keeps them all.",
+    )
+    memory_in_process: bool = Field(
+        default=False,
+        description="Whether the default short-term and entity memories keep their embeddings in an in-process vector store instead of an on-disk ChromaDB collection.",
+    )
     embedder: Optional[dict] = Field(
         default=None,
         description="Configuration for the embedder to be used for the crew.",
@@ -172,6 +217,10 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Metrics for the LLM usage during all tasks execution.",
     )
+    agent_usage_metrics: Dict[str, UsageMetrics] = Field(
+        default_factory=dict,
+        description="Metrics for the LLM usage of each agent, keyed by agent id.",
+    )
     manager_llm: Optional[Union[str, InstanceOf[BaseLLM], Any]] = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -242,6 +291,15 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Knowledge for the crew.",
     )
+    knowledge_ingestion_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Number of processes parsing the crew's knowledge source files in parallel. None adds the sources one by one.",
+    )
+    knowledge_hybrid_search: bool = Field(
+        default=False,
+        description="Whether to search the crew's knowledge with both embeddings and a BM25 lexical index, to find exact identifiers.",
+    )
     security_config: SecurityConfig = Field(
         default_factory=SecurityConfig,
         description="Security configuration for the crew, including fingerprinting.",
@@ -301,15 +359,25 @@ class Crew(FlowTrackable, BaseModel):
         return self
 
     def _initialize_default_memories(self):
-        self._long_term_memory = self._long_term_memory or LongTermMemory()
+        self._long_term_memory = self._long_term_memory or LongTermMemory(
+            max_entries_per_task=self.long_term_memory_max_entries_per_task
+        )
         self._short_term_memory = self._short_term_memory or ShortTermMemory(
             crew=self,
             embedder_config=self.embedder,
+            storage=self._in_process_memory_storage("short_term"),
         )
         self._entity_memory = self.entity_memory or EntityMemory(
-            crew=self, embedder_config=self.embedder
+            crew=self,
+            embedder_config=self.embedder,
+            storage=self._in_process_memory_storage("entities"),
         )
 
+    def _in_process_memory_storage(self, type: str) -> Optional[InMemoryVectorStorage]:
+        if not self.memory_in_process:
+            return None
+        return InMemoryVectorStorage(type=type, embedder_config=self.embedder, crew=self)
+
     @model_validator(mode="after")
     def create_crew_memory(self) -> "Crew":
         """Initialize private memory attributes."""
@@ -325,6 +393,14 @@ class Crew(FlowTrackable, BaseModel):
         if self.memory:
             self._initialize_default_memories()
 
+        if self.memory_write_behind:
+            self._memory_writer = MemoryWriter()
+
+        if self.memory_evaluation_batch_size:
+            self._ltm_evaluation_queue = LongTermMemoryEvaluationQueue(
+                batch_size=self.memory_evaluation_batch_size
+            )
+
         return self
 
     @model_validator(mode="after")
@@ -339,6 +415,8 @@ class Crew(FlowTrackable, BaseModel):
                         sources=self.knowledge_sources,
                         embedder=self.embedder,
                         collection_name="crew",
+                        ingestion_workers=self.knowledge_ingestion_workers,
+                        hybrid_search=self.knowledge_hybrid_search,
                     )
                     self.knowledge.add_sources()
 
@@ -680,6 +758,9 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            self._flush_memory_writes()
+            self._close_memory_writers()
+            self._schedule_memory_compaction()
             detach(token)
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
@@ -947,6 +1028,9 @@ class Crew(FlowTrackable, BaseModel):
         ):
             tools = self._add_multimodal_tools(agent, tools)
 
+        if agent and getattr(agent, "max_tool_output_tokens", None):
+            tools = self._add_tool_output_tools(agent, tools)
+
         # Return a List[BaseTool] which is compatible with both Task.execute_sync and Task.execute_async
         return cast(List[BaseTool], tools)
 
@@ -996,6 +1080,15 @@ class Crew(FlowTrackable, BaseModel):
             return self._merge_tools(tools, cast(List[BaseTool], multimodal_tools))
         return cast(List[BaseTool], tools)
 
+    def _add_tool_output_tools(
+        self, agent: BaseAgent, tools: Union[List[Tool], List[BaseTool]]
+    ) -> List[BaseTool]:
+        if hasattr(agent, "get_tool_output_tools"):
+            tool_output_tools = agent.get_tool_output_tools()
+            # Cast tool_output_tools to the expected type for _merge_tools
+            return self._merge_tools(tools, cast(List[BaseTool], tool_output_tools))
+        return cast(List[BaseTool], tools)
+
     def _add_code_execution_tools(
         self, agent: BaseAgent, tools: Union[List[Tool], List[BaseTool]]
     ) -> List[BaseTool]:
@@ -1207,6 +1300,8 @@ class Crew(FlowTrackable, BaseModel):
             "_long_term_memory",
             "_entity_memory",
             "_external_memory",
+            "_memory_writer",
+            "_ltm_evaluation_queue",
             "agents",
             "tasks",
             "knowledge_sources",
@@ -1294,13 +1389,16 @@ class Crew(FlowTrackable, BaseModel):
     def calculate_usage_metrics(self) -> UsageMetrics:
         """Calculates and returns the usage metrics."""
         total_usage_metrics = UsageMetrics()
-        for agent in self.agents:
+        agent_usage_metrics: Dict[str, UsageMetrics] = {}
+        agents = list(self.agents)
+        if self.manager_agent:
+            agents.append(self.manager_agent)
+        for agent in agents:
             if hasattr(agent, "_token_process"):
                 token_sum = agent._token_process.get_summary()
                 total_usage_metrics.add_usage_metrics(token_sum)
-        if self.manager_agent and hasattr(self.manager_agent, "_token_process"):
-            token_sum = self.manager_agent._token_process.get_summary()
-            total_usage_metrics.add_usage_metrics(token_sum)
+                agent_usage_metrics[str(agent.id)] = token_sum
+        self.agent_usage_metrics = agent_usage_metrics
         self.usage_metrics = total_usage_metrics
         return total_usage_metrics
 
@@ -1382,6 +1480,9 @@ class Crew(FlowTrackable, BaseModel):
                 f"Invalid command type. Must be one of: {', '.join(sorted(VALID_TYPES))}"
             )
 
+        # Let queued background saves land before wiping the storage
+        self._flush_memory_writes()
+
         try:
             if command_type == "all":
                 self._reset_all_memories()
@@ -1441,6 +1542,88 @@ class Crew(FlowTrackable, BaseModel):
                 f"[Crew ({self.name if self.name else self.id})] Failed to reset {name} memory: {str(e)}"
             ) from e
 
+    def compact_memories(
+        self, policy: Optional[MemoryRetentionPolicy] = None
+    ) -> Dict[str, int]:
+        """Apply a retention policy to the crew's short-term, long-term and entity memories.
+
+        Args:
+            policy: Policy to apply. Defaults to the crew's ``memory_retention``
+                policy, or to the default policy when none is set.
+
+        Returns:
+            Number of removed entries keyed by memory type. Memories whose
+            storage does not support retention are left out.
+        """
+        self._flush_memory_writes()
+        return self._apply_memory_retention(
+            policy or self.memory_retention or MemoryRetentionPolicy()
+        )
+
+    def _flush_memory_writes(self) -> None:
+        """Wait for queued evaluations and background memory saves to land."""
+        # Background saves queue evaluations, so the writer is flushed first,
+        # until neither of them has anything left
+        writer, evaluation_queue = self._memory_writer, self._ltm_evaluation_queue
+        while True:
+            if writer:
+                writer.flush()
+            if evaluation_queue:
+                evaluation_queue.flush()
+            if not (
+                (writer and writer.pending)
+                or (evaluation_queue and evaluation_queue.pending)
+            ):
+                return
+
+    def _close_memory_writers(self) -> None:
+        """Stop the background memory threads, restarted by the next submission."""
+        if self._memory_writer:
+            self._memory_writer.close()
+        if self._ltm_evaluation_queue:
+            self._ltm_evaluation_queue.close()
+
+    def _apply_memory_retention(self, policy: MemoryRetentionPolicy) -> Dict[str, int]:
+        memory_systems = self._get_memory_systems()
+        removed: Dict[str, int] = {}
+        for memory_type in ("short", "entity", "long"):
+            config = memory_systems[memory_type]
+            system = config.get("system")
+            apply_retention = getattr(
+                getattr(system, "storage", None), "apply_retention", None
+            )
+            if apply_retention is None:
+                continue
+            removed[memory_type] = apply_retention(policy)
+            self._logger.log(
+                "info",
+                f"[Crew ({self.name if self.name else self.id})] {config.get('name')} memory compacted, {removed[memory_type]} entries removed",
+            )
+        return removed
+
+    def _schedule_memory_compaction(self) -> None:
+        """Compact memories in the background when the retention policy's interval has elapsed."""
+        policy = self.memory_retention
+        if policy is None or policy.compaction_interval_seconds is None:
+            return
+        now = time.monotonic()
+        if (
+            self._last_memory_compaction is not None
+            and now - self._last_memory_compaction < policy.compaction_interval_seconds
+        ):
+            return
+        self._last_memory_compaction = now
+
+        def compact() -> None:
+            try:
+                self._apply_memory_retention(policy)
+            except Exception as e:
+                self._logger.log("error", f"Failed to compact memories: {str(e)}")
+
+        threading.Thread(
+            target=compact, name="crewai-memory-compaction", daemon=True
+        ).start()
+
     def _get_memory_systems(self):
         """Get all available memory systems with their configuration.
 
@@ -57,6 +57,7 @@ from .types.knowledge_events import (
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
 )
+from .types.rag_events import RagDocumentsAddProgressEvent
 
 from .types.memory_events import (
     MemorySaveStartedEvent,
@@ -117,4 +118,5 @@ EventTypes = Union[
     MemoryQueryFailedEvent,
     MemoryRetrievalStartedEvent,
     MemoryRetrievalCompletedEvent,
+    RagDocumentsAddProgressEvent,
 ]
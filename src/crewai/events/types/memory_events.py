@@ -93,3 +93,4 @@ class MemoryRetrievalCompletedEvent(MemoryBaseEvent):
     task_id: Optional[str] = None
     memory_content: str
     retrieval_time_ms: float
+    store_retrieval_times_ms: Dict[str, float] = {}
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from crewai.events.base_events import BaseEvent
+
+
+class RagDocumentsAddProgressEvent(BaseEvent):
+    """Event emitted when a batch of documents is written to a vector store."""
+
+    type: str = "rag_documents_add_progress"
+    provider: str
+    collection_name: str
+    added: int
+    total: Optional[int] = None  # Unknown when documents are streamed
@@ -3,7 +3,6 @@ SQLite-based implementation of flow state persistence.
 """
 
 import json
-import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -11,14 +10,15 @@ from typing import Any, Dict, Optional, Union
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.utilities.sqlite import SQLiteConnectionPool
 
 
 class SQLiteFlowPersistence(FlowPersistence):
     """SQLite-based implementation of flow state persistence.
 
     This class provides a simple, file-based persistence implementation using SQLite.
-    It's suitable for development and testing, or for production use cases with
-    moderate performance requirements.
+    Connections are pooled and run in WAL mode, so flows persisting state from
+    several threads do not block each other's reads.
     """
 
     db_path: str
@@ -42,11 +42,12 @@ class SQLiteFlowPersistence(FlowPersistence):
             raise ValueError("Database path must be provided")
 
         self.db_path = path  # Now mypy knows this is str
+        self._pool = SQLiteConnectionPool(self.db_path)
         self.init_db()
 
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.connection() as conn:
             conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS flow_states (
@@ -89,7 +90,7 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.connection() as conn:
             conn.execute(
                 """
             INSERT INTO flow_states (
@@ -116,7 +117,7 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.connection() as conn:
             cursor = conn.execute(
                 """
             SELECT state_json
@@ -0,0 +1,113 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.storage.knowledge_storage import (
+    KnowledgeStorage,
+    primed_query_embeddings,
+)
+
+
+def query_knowledge(
+    knowledge: Sequence[Optional[Knowledge]],
+    queries: List[str],
+    results_limit: int = 3,
+    score_threshold: float = 0.35,
+) -> List[List[Dict[str, Any]]]:
+    """Search several knowledge bases with several queries at once.
+
+    The queries are embedded once for all the storages sharing an embedder,
+    and the knowledge bases are searched concurrently, each with a single
+    request for all the queries. A chunk found in several knowledge bases is
+    only kept in the one where it is the most relevant.
+
+    Args:
+        knowledge: Knowledge bases to search, such as the agent's and the
+            crew's. None entries are skipped.
+        queries: Queries to search for.
+        results_limit: Number of results of each knowledge base.
+        score_threshold: Minimum score of the results.
+
+    Returns:
+        The results of each knowledge base, in the order given, best first.
+    """
+    present = [
+        (index, base) for index, base in enumerate(knowledge) if base is not None
+    ]
+    embeddings = _embed_queries(
+        [base for _, base in present], queries, results_limit, score_threshold
+    )
+
+    def search(base: Knowledge) -> List[Dict[str, Any]]:
+        results = base.query(
+            queries, results_limit=results_limit, score_threshold=score_threshold
+        )
+        return list(results) if isinstance(results, list) else []
+
+    with primed_query_embeddings(embeddings):
+        if len(present) > 1:
+            with ThreadPoolExecutor(max_workers=len(present)) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, search, base)
+                    for _, base in present
+                ]
+                found = [future.result() for future in futures]
+        else:
+            found = [search(base) for _, base in present]
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in knowledge]
+    for (index, _), base_results in zip(present, found):
+        results[index] = base_results
+    return _deduplicate(results)
+
+
+def _embed_queries(
+    knowledge: Sequence[Knowledge],
+    queries: List[str],
+    results_limit: int,
+    score_threshold: float,
+) -> Dict[Tuple[str, str], Any]:
+    """Embed the queries once for each embedder shared by several storages."""
+    groups: Dict[str, List[KnowledgeStorage]] = {}
+    for base in knowledge:
+        storage = getattr(base, "storage", None)
+        if isinstance(storage, KnowledgeStorage):
+            groups.setdefault(storage.embedding_key, []).append(storage)
+
+    embeddings: Dict[Tuple[str, str], Any] = {}
+    for key, storages in groups.items():
+        uncached = [
+            storage
+            for storage in storages
+            if not storage.search_is_cached(
+                queries, limit=results_limit, score_threshold=score_threshold
+            )
+        ]
+        # A single storage embeds its queries along with its search
+        if len(uncached) < 2:
+            continue
+        vectors = uncached[0].embedder(queries)
+        for text, vector in zip(queries, vectors):
+            embeddings[(key, text)] = vector
+    return embeddings
+
+
+def _deduplicate(
+    results: List[List[Dict[str, Any]]],
+) -> List[List[Dict[str, Any]]]:
+    owners: Dict[Any, Tuple[int, float]] = {}
+    for index, base_results in enumerate(results):
+        for result in base_results:
+            key = result.get("id") or result.get("context")
+            relevance = result.get("relevance", 0.0)
+            if key not in owners or relevance > owners[key][1]:
+                owners[key] = (index, relevance)
+    return [
+        [
+            result
+            for result in base_results
+            if owners[result.get("id") or result.get("context")][0] == index
+        ]
+        for index, base_results in enumerate(results)
+    ]
@@ -0,0 +1,293 @@
+"""Splitting knowledge sources into chunks along their structure.
+
+Text is split into sentences, which are packed into chunks that end on
+paragraph boundaries where possible. Tabular rows and JSON records are kept
+whole, repeating the table header in every chunk. Chunk sizes are measured
+with a length function, in characters by default or in tokens with
+``token_counter``. Text is streamed through the chunkers: boundaries are
+located by offsets into a small buffer and every segment is sliced out once.
+"""
+
+import re
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+LengthFunction = Callable[[str], int]
+
+# Bump when chunk boundaries change, so that ingested sources are re-chunked
+CHUNKING_VERSION = 3
+
+_BOUNDARY = re.compile(r"\n[ \t]*\n\s*|\n|(?<=[.!?])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def token_counter(encoding_name: str = "cl100k_base") -> LengthFunction:
+    """Build a length function counting tokens with ``tiktoken``."""
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "tiktoken is not installed. Please install it with: pip install tiktoken"
+        )
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+class TextChunker:
+    """Packs sentences into chunks, preferring to end them on paragraphs.
+
+    Sentences longer than ``chunk_size`` are split between words, and words
+    longer than it are cut. Consecutive chunks share up to ``chunk_overlap``
+    of whole trailing sentences.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        chunk_overlap: int = 0,
+        length_function: Optional[LengthFunction] = None,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = max(chunk_overlap, 0)
+        self.length = length_function or len
+
+    def chunk(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Chunk the concatenation of ``pieces``, such as pages or blocks."""
+        return self._pack(self._segments(pieces))
+
+    def _segments(self, pieces: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+        """Yield sentences with whether they end a paragraph."""
+        # Text without any boundary is flushed once it outgrows this
+        max_pending = 8 * self.chunk_size
+        buffer = ""
+        for piece in pieces:
+            buffer = buffer + piece if buffer else piece
+            start = 0
+            for match in _BOUNDARY.finditer(buffer):
+                end = match.end()
+                # A boundary at the end may continue in the next piece
+                if end == len(buffer):
+                    break
+                ends_paragraph = match.group().count("\n") > 1
+                yield from self._fit(buffer[start:end], ends_paragraph)
+                start = end
+            buffer = buffer[start:]
+            if len(buffer) > max_pending:
+                *complete, last = self._fit(buffer, False)
+                yield from complete
+                # A buffer fitting in a chunk is emitted whole, to stay bounded
+                if complete:
+                    buffer = last[0]
+                else:
+                    yield last
+                    buffer = ""
+        if buffer:
+            yield from self._fit(buffer, True)
+
+    def _fit(self, text: str, ends_paragraph: bool) -> Iterator[Tuple[str, bool]]:
+        """Split a sentence longer than a chunk between words."""
+        if self.length(text) <= self.chunk_size:
+            yield text, ends_paragraph
+            return
+
+        start = previous = used = 0
+        for end in _word_ends(text):
+            size = self.length(text[previous:end])
+            if used + size > self.chunk_size and previous > start:
+                yield text[start:previous], False
+                start, used = previous, 0
+            # Cut words that do not fit in a chunk on their own
+            while size > self.chunk_size:
+                cut = self._cut_point(text, start, end)
+                yield text[start:cut], False
+                start = cut
+                size = self.length(text[start:end])
+            used += size
+            previous = end
+        if start < len(text):
+            yield text[start:], ends_paragraph
+
+    def _cut_point(self, text: str, start: int, end: int) -> int:
+        """Largest offset such that ``text[start:offset]`` fits in a chunk."""
+        low, high = start + 1, end
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.length(text[start:middle]) <= self.chunk_size:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _pack(self, segments: Iterable[Tuple[str, bool]]) -> Iterator[str]:
+        current: List[Tuple[str, int, bool]] = []
+        length = 0
+        for text, ends_paragraph in segments:
+            size = self.length(text)
+            while current and length + size > self.chunk_size:
+                cut = self._cut_index(current)
+                emitted, rest = current[:cut], current[cut:]
+                chunk = "".join(segment for segment, _, _ in emitted).strip()
+                if chunk:
+                    yield chunk
+                carried = self._overlap(emitted)
+                current = carried + rest
+                length = sum(segment_size for _, segment_size, _ in current)
+                if carried and length + size > self.chunk_size:
+                    current = rest
+                    length -= sum(segment_size for _, segment_size, _ in carried)
+            current.append((text, size, ends_paragraph))
+            length += size
+
+        chunk = "".join(segment for segment, _, _ in current).strip()
+        if chunk:
+            yield chunk
+
+    def _cut_index(self, segments: List[Tuple[str, int, bool]]) -> int:
+        """End the chunk on its last paragraph if that keeps it half full."""
+        total = 0
+        cut = len(segments)
+        for index, (_, size, ends_paragraph) in enumerate(segments, start=1):
+            total += size
+            if ends_paragraph and total * 2 >= self.chunk_size:
+                cut = index
+        return cut
+
+    def _overlap(
+        self, segments: List[Tuple[str, int, bool]]
+    ) -> List[Tuple[str, int, bool]]:
+        """Trailing segments fitting in ``chunk_overlap``, never the whole chunk."""
+        carried: List[Tuple[str, int, bool]] = []
+        total = 0
+        for segment in reversed(segments[1:]):
+            total += segment[1]
+            if total > self.chunk_overlap:
+                break
+            carried.append(segment)
+        carried.reverse()
+        return carried
+
+
+class RecordChunker:
+    """Packs whole records, such as table rows, into chunks.
+
+    With ``repeat_header``, the first record is the header and starts every
+    chunk. Records longer than a chunk are split by a ``TextChunker``.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        length_function: Optional[LengthFunction] = None,
+        repeat_header: bool = False,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        self.chunk_size = chunk_size
+        self.length = length_function or len
+        self.repeat_header = repeat_header
+
+    def chunk(self, records: Iterable[str]) -> Iterator[str]:
+        """Chunk ``records``, each ending with its own separator."""
+        rows = iter(records)
+        header = next(rows, "") if self.repeat_header else ""
+        header_size = self.length(header) if header else 0
+        if header_size * 2 > self.chunk_size:
+            # Headers taking most of the budget are only kept in the first chunk
+            rows = _prepend(header, rows)
+            header, header_size = "", 0
+        budget = self.chunk_size - header_size
+
+        current: List[str] = []
+        length = 0
+        empty = True
+        for record in rows:
+            empty = False
+            size = self.length(record)
+            if current and length + size > budget:
+                yield (header + "".join(current)).rstrip()
+                current, length = [], 0
+            if size > budget:
+                for piece in TextChunker(budget, 0, self.length).chunk([record]):
+                    yield header + piece
+                continue
+            current.append(record)
+            length += size
+        if current or (empty and header.strip()):
+            yield (header + "".join(current)).rstrip()
+
+
+def _word_ends(text: str) -> Iterator[int]:
+    end = 0
+    for match in _WHITESPACE.finditer(text):
+        end = match.end()
+        yield end
+    if end < len(text):
+        yield len(text)
+
+
+def _prepend(first: str, rest: Iterator[str]) -> Iterator[str]:
+    if first:
+        yield first
+    yield from rest
+
+
+def iter_json_records(
+    data: Any,
+    max_length: int,
+    render: Callable[[Any], Iterable[str]],
+    length_function: Optional[LengthFunction] = None,
+    path: str = "",
+) -> Iterator[str]:
+    """Yield the records of a JSON document, each labelled with its path.
+
+    Containers whose rendering fits in ``max_length`` are kept whole, larger
+    ones are split into their items, e.g. ``users[3].address``. ``render``
+    yields the text of a value piece by piece, and is stopped once the text
+    outgrows ``max_length``, so large containers are not rendered in full at
+    every level of the document.
+    """
+    length = length_function or len
+    label = f"{path}:\n" if path else ""
+    if not isinstance(data, (dict, list)) or not data:
+        yield f"{label}{''.join(render(data))}\n"
+        return
+
+    text = _render_within(render(data), max_length, length)
+    if text is not None and length(f"{label}{text}\n") <= max_length:
+        yield f"{label}{text}\n"
+        return
+
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for key, value in items:
+        if isinstance(data, dict):
+            child_path = f"{path}.{key}" if path else str(key)
+        else:
+            child_path = f"{path}[{key}]"
+        yield from iter_json_records(
+            value, max_length, render, length_function, child_path
+        )
+
+
+def _render_within(
+    pieces: Iterable[str], max_length: int, length: LengthFunction
+) -> Optional[str]:
+    """Join ``pieces``, or return None as soon as they outgrow ``max_length``.
+
+    The length is measured each time the number of characters doubles, so
+    that token counts are not recomputed for every piece.
+    """
+    parts: List[str] = []
+    characters = 0
+    measured_at = max_length
+    for piece in pieces:
+        parts.append(piece)
+        characters += len(piece)
+        if characters > measured_at:
+            if length("".join(parts)) > max_length:
+                return None
+            measured_at = characters * 2
+    return "".join(parts)
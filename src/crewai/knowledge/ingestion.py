@@ -0,0 +1,139 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple
+
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+
+
+@dataclass
+class IngestionStats:
+    """Throughput of a knowledge ingestion run.
+
+    Rates are measured over the wall-clock time of the whole run, as the
+    parsing and embedding stages overlap. ``documents`` counts the files parsed
+    by the worker processes, while ``chunks`` and ``embeddings`` also count the
+    sources added one by one, as long as their ``add()`` saves its chunks with
+    ``_add_chunks``, which all the built-in sources do.
+    """
+
+    documents: int = 0
+    chunks: int = 0
+    embeddings: int = 0
+    parse_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self._rate(self.documents)
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self._rate(self.chunks)
+
+    @property
+    def embeddings_per_second(self) -> float:
+        return self._rate(self.embeddings)
+
+    def _rate(self, count: int) -> float:
+        return count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def _parse_file(source: BaseKnowledgeSource, path: Path) -> Tuple[List[str], float]:
+    """Read and chunk a single file, in a worker process.
+
+    The chunks of the file are returned at once, so a file is held in memory
+    as its whole chunk list until it is embedded.
+    """
+    start = time.perf_counter()
+    chunks = list(source._chunk_file(path))  # type: ignore[attr-defined]
+    return chunks, time.perf_counter() - start
+
+
+class KnowledgeIngestionRunner:
+    """
+    Adds knowledge sources by parsing their files in a pool of processes.
+
+    Files of sources that stream them (text, PDF, CSV, JSON and Excel) are
+    read and chunked by ``workers`` processes, while the current process embeds
+    and upserts the chunks in batches as they come in. At most
+    ``max_pending_files`` parsed files wait to be embedded, which bounds memory
+    use by a number of files: a very large file is held in memory as its whole
+    chunk list, so lower ``max_pending_files`` when ingesting such files. Other
+    sources are added one by one, as ``Knowledge.add_sources`` does.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending_files: Optional[int] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending_files = max_pending_files or 2 * self.workers
+        self.executor_factory = executor_factory or (
+            lambda workers: ProcessPoolExecutor(max_workers=workers)
+        )
+
+    def run(self, sources: Sequence[BaseKnowledgeSource]) -> IngestionStats:
+        """Add the sources to their storage.
+
+        Returns:
+            The throughput of the parallel parsing and embedding stages.
+        """
+        stats = IngestionStats()
+        start = time.perf_counter()
+        work = [
+            # Workers get a copy without the storage, which is not picklable
+            (index, source.model_copy(update={"storage": None}), path)
+            for index, source in enumerate(sources)
+            for path in source._streamed_file_paths()
+        ]
+        parallel = {index for index, _, _ in work}
+
+        with self.executor_factory(self.workers) as executor:
+            pending: Deque[Tuple[int, Future]] = deque()
+            remaining = iter(work)
+
+            def refill() -> None:
+                while len(pending) < self.max_pending_files:
+                    item = next(remaining, None)
+                    if item is None:
+                        return
+                    index, source_copy, path = item
+                    future = executor.submit(_parse_file, source_copy, path)
+                    pending.append((index, future))
+
+            waited = 0.0
+
+            def parsed_chunks(index: int) -> Iterator[str]:
+                nonlocal waited
+                while pending and pending[0][0] == index:
+                    _, future = pending.popleft()
+                    wait_start = time.perf_counter()
+                    chunks, parse_seconds = future.result()
+                    waited += time.perf_counter() - wait_start
+                    refill()
+                    stats.documents += 1
+                    stats.chunks += len(chunks)
+                    stats.parse_seconds += parse_seconds
+                    yield from chunks
+
+            refill()
+            for index, source in enumerate(sources):
+                if index not in parallel:
+                    source.add()
+                    stats.chunks += source._added_chunks
+                    stats.embeddings += source._embedded_chunks
+                    continue
+                waited = 0.0
+                embed_start = time.perf_counter()
+                stats.embeddings += source._add_chunks(parsed_chunks(index))
+                stats.embed_seconds += time.perf_counter() - embed_start - waited
+
+        stats.elapsed_seconds = time.perf_counter() - start
+        return stats
@@ -1,9 +1,11 @@
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from crewai.knowledge.ingestion import IngestionStats, KnowledgeIngestionRunner
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
@@ -14,22 +16,40 @@ class Knowledge(BaseModel):
     Knowledge is a collection of sources and setup for the vector store to save and query relevant context.
     Args:
         sources: List[BaseKnowledgeSource] = Field(default_factory=list)
-        storage: Optional[KnowledgeStorage] = Field(default=None)
+        storage: Optional[BaseKnowledgeStorage] = Field(default=None)
         embedder: Optional[Dict[str, Any]] = None
+        ingestion_workers: Optional[int] = None
+        hybrid_search: bool = False
+        reranker: Optional[Callable] = None
     """
 
     sources: List[BaseKnowledgeSource] = Field(default_factory=list)
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    storage: Optional[KnowledgeStorage] = Field(default=None)
+    storage: Optional[BaseKnowledgeStorage] = Field(default=None)
     embedder: Optional[Dict[str, Any]] = None
     collection_name: Optional[str] = None
+    ingestion_workers: Optional[int] = Field(
+        default=None,
+        description="Number of processes parsing the source files in parallel when sources are added. None adds the sources one by one.",
+    )
+    hybrid_search: bool = Field(
+        default=False,
+        description="Whether to fuse vector search with a BM25 lexical index of the sources.",
+    )
+    reranker: Optional[Callable[[str, List[Dict[str, Any]]], List[Dict[str, Any]]]] = (
+        Field(
+            default=None,
+            description="Re-orders the results of hybrid search, given the query and the fused results.",
+        )
+    )
+    _ingestion_stats: Optional[IngestionStats] = PrivateAttr(default=None)
 
     def __init__(
         self,
         collection_name: str,
         sources: List[BaseKnowledgeSource],
         embedder: Optional[Dict[str, Any]] = None,
-        storage: Optional[KnowledgeStorage] = None,
+        storage: Optional[BaseKnowledgeStorage] = None,
         **data,
     ):
         super().__init__(**data)
@@ -37,17 +57,22 @@ class Knowledge(BaseModel):
             self.storage = storage
         else:
             self.storage = KnowledgeStorage(
-                embedder=embedder, collection_name=collection_name
+                embedder=embedder,
+                collection_name=collection_name,
+                hybrid_search=self.hybrid_search,
+                reranker=self.reranker,
             )
         self.sources = sources
-        self.storage.initialize_knowledge_storage()
+        if isinstance(self.storage, KnowledgeStorage):
+            self.storage.initialize_knowledge_storage()
 
     def query(
         self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
     ) -> List[Dict[str, Any]]:
         """
         Query across all knowledge sources to find the most relevant information.
-        Returns the top_k most relevant chunks.
+        Returns the top_k most relevant chunks. Several queries are embedded and
+        searched in a single request, and their results merged by relevance.
 
         Raises:
             ValueError: If storage is not initialized.
@@ -63,13 +88,47 @@ class Knowledge(BaseModel):
         return results
 
     def add_sources(self):
+        """
+        Add the sources to the storage.
+
+        Sources already ingested with the same content are skipped without being
+        re-chunked or re-embedded, and the chunks of deleted source files are
+        removed from the storage.
+        """
         try:
+            sources = []
             for source in self.sources:
                 source.storage = self.storage
-                source.add()
+                if not self._is_ingested(source):
+                    sources.append(source)
+            if self.ingestion_workers and sources:
+                runner = KnowledgeIngestionRunner(workers=self.ingestion_workers)
+                self._ingestion_stats = runner.run(sources)
+            else:
+                for source in sources:
+                    source.add()
+            if isinstance(self.storage, KnowledgeStorage):
+                self.storage.remove_deleted_sources()
+                self.storage.flush()
         except Exception as e:
             raise e
 
+    @property
+    def ingestion_stats(self) -> Optional[IngestionStats]:
+        """Throughput of the last parallel ingestion, if any."""
+        return self._ingestion_stats
+
+    def _is_ingested(self, source: BaseKnowledgeSource) -> bool:
+        if not isinstance(self.storage, KnowledgeStorage):
+            return False
+        source_key = source.ingestion_key()
+        fingerprint = source.ingestion_fingerprint()
+        return bool(
+            source_key
+            and fingerprint
+            and self.storage.is_ingested(source_key, fingerprint)
+        )
+
     def reset(self) -> None:
         if self.storage:
             self.storage.reset()
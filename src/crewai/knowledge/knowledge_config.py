@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +9,9 @@ class KnowledgeConfig(BaseModel):
     Args:
         results_limit (int): The number of relevant documents to return.
         score_threshold (float): The minimum score for a document to be considered relevant.
+        cache_search_query (bool): Whether to reuse the search query rewritten for an identical task prompt.
+        persist_search_query_cache (bool): Whether to keep the rewritten search queries across runs.
+        direct_query_max_length (Optional[int]): Task prompts up to this many characters are searched as is, without being rewritten.
     """
 
     results_limit: int = Field(default=3, description="The number of results to return")
@@ -14,3 +19,16 @@ class KnowledgeConfig(BaseModel):
         default=0.35,
         description="The minimum score for a result to be considered relevant",
     )
+    # Query rewriting options are used by the agent, not passed to the search
+    cache_search_query: bool = Field(
+        default=True,
+        description="Reuse the search query rewritten by the same LLM for an identical task prompt",
+    )
+    persist_search_query_cache: bool = Field(
+        default=False,
+        description="Store the rewritten search queries on disk so they are reused across runs",
+    )
+    direct_query_max_length: Optional[int] = Field(
+        default=None,
+        description="Search task prompts up to this many characters as is, without rewriting them",
+    )
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
@@ -21,9 +21,9 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     file_paths: Optional[Union[Path, List[Path], str, List[str]]] = Field(
         default_factory=list, description="The path to the file"
     )
-    content: Dict[Path, str] = Field(init=False, default_factory=dict)
-    storage: Optional[KnowledgeStorage] = Field(default=None)
+    storage: Optional[BaseKnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    _content: Optional[Dict[Path, str]] = PrivateAttr(default=None)
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -40,16 +40,79 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         return v
 
     def model_post_init(self, _):
-        """Post-initialization method to load content."""
+        """Post-initialization method to validate the paths.
+
+        Sources that stream their files through ``iter_file`` only read them
+        when they are added or their ``content`` is accessed, other sources
+        load their content right away.
+        """
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self._is_streaming():
+            self.content = self.load_content()
+
+    @property
+    def content(self) -> Dict[Path, str]:
+        """Content of the files, loaded with ``load_content`` on first access."""
+        if self._content is None:
+            self._content = self.load_content()
+        return self._content
+
+    @content.setter
+    def content(self, content: Dict[Path, str]) -> None:
+        self._content = content
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Yield the text of a file piece by piece. Overridden by streaming sources."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming its files"
+        )
+
+    def iter_documents(self) -> Iterator[str]:
+        """Yield the text of every file piece by piece, reading files lazily.
+
+        Sources that do not stream their files yield their loaded ``content``.
+        """
+        if not self._is_streaming():
+            yield from self.content.values()
+            return
+        for path in self._streamed_file_paths():
+            yield from self.iter_file(path)
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the chunks of every file, chunking each file separately."""
+        if not self._is_streaming():
+            for text in self.content.values():
+                yield from self._chunk_stream([text])
+            return
+        for path in self._streamed_file_paths():
+            yield from self._chunk_file(path)
+
+    def _chunk_file(self, path: Path) -> Iterator[str]:
+        """Chunk a single file. Overridden by sources with structured records."""
+        return self._chunk_stream(self.iter_file(path))
+
+    def add(self) -> None:
+        """
+        Stream the files to the knowledge source, chunk them, compute embeddings,
+        and save the embeddings. Sources that do not stream their files add the
+        chunks of their loaded ``content``.
+        """
+        self._add_chunks(self.iter_chunks())
+
+    def _is_streaming(self) -> bool:
+        return type(self).iter_file is not BaseFileKnowledgeSource.iter_file
+
+    def _streamed_file_paths(self) -> List[Path]:
+        if not self._is_streaming():
+            return []
+        return [self.convert_to_path(path) for path in self.safe_file_paths]
+
     def validate_content(self):
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -67,13 +130,6 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
-    def _save_documents(self):
-        """Save the documents to the storage."""
-        if self.storage:
-            self.storage.save(self.chunks)
-        else:
-            raise ValueError("No storage found to save documents.")
-
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
         return Path(KNOWLEDGE_DIRECTORY + "/" + path) if isinstance(path, str) else path
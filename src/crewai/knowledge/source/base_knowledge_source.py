@@ -1,24 +1,52 @@
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from crewai.knowledge.chunking import (
+    CHUNKING_VERSION,
+    LengthFunction,
+    TextChunker,
+    token_counter,
+)
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
+# Number of chunks handed to storages at once when the source is not synced
+_SAVE_BATCH_SIZE = 256
+
+
+def _file_digest(path: Path, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read block by block."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
 
 class BaseKnowledgeSource(BaseModel, ABC):
     """Abstract base class for knowledge sources."""
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
+    chunk_unit: Literal["characters", "tokens"] = Field(
+        default="characters",
+        description="Whether chunk_size and chunk_overlap count characters or tokens.",
+    )
     chunks: List[str] = Field(default_factory=list)
     chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    storage: Optional[KnowledgeStorage] = Field(default=None)
+    storage: Optional[BaseKnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    _added_chunks: int = PrivateAttr(default=0)
+    _embedded_chunks: int = PrivateAttr(default=0)
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -30,23 +58,146 @@ class BaseKnowledgeSource(BaseModel, ABC):
         """Process content, chunk it, compute embeddings, and save them."""
         pass
 
+    def iter_documents(self) -> Iterator[str]:
+        """Yield the text of the source piece by piece, such as pages or rows.
+
+        Sources implementing it are read lazily when they are added, without
+        holding their whole content in memory.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming its documents"
+        )
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the chunks of the text streamed by ``iter_documents``."""
+        return self._chunk_stream(self.iter_documents())
+
+    def ingestion_key(self) -> Optional[str]:
+        """Identify the source in the ingestion manifest of its storage.
+
+        Sources read from local files are identified by their class and paths.
+        Sources without a key are re-embedded every time they are added.
+        """
+        paths = self._local_file_paths()
+        if not paths:
+            return None
+        return f"{type(self).__name__}:" + "|".join(sorted(map(str, paths)))
+
+    def ingestion_fingerprint(self) -> Optional[str]:
+        """Hash of the source content and chunking settings.
+
+        For file sources, the path and content hash of every file. Content
+        hashes are kept in the ingestion manifest of the storage, and files
+        whose size and modification time did not change are not read again.
+        """
+        paths = self._local_file_paths()
+        if not paths:
+            return None
+        manifest = (
+            self.storage.manifest if isinstance(self.storage, KnowledgeStorage) else None
+        )
+        known = manifest.file_digests(map(str, paths)) if manifest else {}
+        computed: Dict[str, Tuple[int, int, str]] = {}
+        parts = []
+        for path in sorted(paths):
+            stat = path.stat()
+            entry = known.get(str(path))
+            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+                entry = (stat.st_size, stat.st_mtime_ns, _file_digest(path))
+                computed[str(path)] = entry
+            parts.append(f"{path}:{entry[2]}")
+        if manifest:
+            manifest.record_file_digests(computed)
+        return self._fingerprint(*parts)
+
+    def _fingerprint(self, *parts: str) -> str:
+        settings = (
+            f"{self.chunk_size}:{self.chunk_overlap}:{self.chunk_unit}:"
+            f"{CHUNKING_VERSION}"
+        )
+        fingerprint = hashlib.sha256(settings.encode())
+        for part in parts:
+            fingerprint.update(b"\0" + part.encode("utf-8"))
+        return fingerprint.hexdigest()
+
+    def _local_file_paths(self) -> Optional[List[Path]]:
+        """Resolved paths of the files the source reads, None if not file based."""
+        paths = getattr(self, "safe_file_paths", None)
+        if not paths or not all(isinstance(path, Path) for path in paths):
+            return None
+        return [path.resolve() for path in paths]
+
     def get_embeddings(self) -> List[np.ndarray]:
         """Return the list of embeddings for the chunks."""
         return self.chunk_embeddings
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        return list(self._chunk_stream([text]))
+
+    def _chunk_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Split the concatenation of ``pieces`` on sentences and paragraphs.
+
+        Only the text of the chunk being built is held in memory.
+        """
+        return TextChunker(
+            self.chunk_size, self.chunk_overlap, self._length_function()
+        ).chunk(pieces)
+
+    def _length_function(self) -> Optional[LengthFunction]:
+        """Measure of chunk sizes, None to count characters."""
+        return token_counter() if self.chunk_unit == "tokens" else None
+
+    def _streamed_file_paths(self) -> List[Path]:
+        """Files whose chunks ``iter_file`` yields independently of each other.
+
+        They can be parsed in parallel, see ``KnowledgeIngestionRunner``.
+        """
+        return []
+
+    def _add_chunks(self, chunks: Iterable[str]) -> int:
+        """Stream chunks to the storage without keeping them on the source.
+
+        Sources synced through the ingestion manifest are batched by
+        ``KnowledgeStorage.sync_documents``, other storages are given the
+        chunks in batches of their ``batch_size``.
+
+        The numbers of chunks added and embedded are kept until the next call,
+        so that ``KnowledgeIngestionRunner`` can count the sources it adds with
+        ``add()``.
+
+        Returns:
+            The number of chunks that were embedded.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        self._added_chunks = self._embedded_chunks = 0
+
+        def counted(chunks: Iterable[str]) -> Iterator[str]:
+            for chunk in chunks:
+                self._added_chunks += 1
+                yield chunk
+
+        source_key = self.ingestion_key()
+        if source_key and isinstance(self.storage, KnowledgeStorage):
+            self._embedded_chunks = self.storage.sync_documents(
+                source_key,
+                counted(chunks),
+                fingerprint=self.ingestion_fingerprint() or source_key,
+                file_paths=[str(path) for path in self._local_file_paths() or []],
+            )
+        else:
+            batch_size = getattr(self.storage, "batch_size", _SAVE_BATCH_SIZE)
+            stream = counted(chunks)
+            while documents := list(islice(stream, batch_size)):
+                self.storage.save(documents)
+                self._embedded_chunks += len(documents)
+        return self._embedded_chunks
 
     def _save_documents(self):
         """
         Save the documents to the storage.
         This method should be called after the chunks and embeddings are generated.
         """
-        if self.storage:
-            self.storage.save(self.chunks)
-        else:
-            raise ValueError("No storage found to save documents.")
+        self._add_chunks(self.chunks)
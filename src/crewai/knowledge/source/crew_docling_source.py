@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 try:
@@ -13,7 +13,7 @@ try:
 except ImportError:
     DOCLING_AVAILABLE = False
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
@@ -34,12 +34,12 @@ class CrewDoclingSource(BaseKnowledgeSource):
         super().__init__(*args, **kwargs)
 
     _logger: Logger = Logger(verbose=True)
+    _content: Optional[List["DoclingDocument"]] = PrivateAttr(default=None)
 
     file_path: Optional[List[Union[Path, str]]] = Field(default=None)
     file_paths: List[Union[Path, str]] = Field(default_factory=list)
     chunks: List[str] = Field(default_factory=list)
     safe_file_paths: List[Union[Path, str]] = Field(default_factory=list)
-    content: List["DoclingDocument"] = Field(default_factory=list)
     document_converter: "DocumentConverter" = Field(
         default_factory=lambda: DocumentConverter(
             allowed_formats=[
@@ -55,6 +55,17 @@ class CrewDoclingSource(BaseKnowledgeSource):
         )
     )
 
+    @property
+    def content(self) -> List["DoclingDocument"]:
+        """Converted documents, loaded on first access."""
+        if self._content is None:
+            self._content = self._load_content()
+        return self._content
+
+    @content.setter
+    def content(self, content: List["DoclingDocument"]) -> None:
+        self._content = content
+
     def model_post_init(self, _) -> None:
         if self.file_path:
             self._logger.log(
@@ -64,11 +75,15 @@ class CrewDoclingSource(BaseKnowledgeSource):
             )
             self.file_paths = self.file_path
         self.safe_file_paths = self.validate_content()
-        self.content = self._load_content()
 
     def _load_content(self) -> List["DoclingDocument"]:
+        return list(self._iter_docling_documents())
+
+    def _iter_docling_documents(self) -> Iterator["DoclingDocument"]:
+        """Convert the files lazily, one document at a time."""
         try:
-            return self._convert_source_to_docling_documents()
+            for result in self.document_converter.convert_all(self.safe_file_paths):
+                yield result.document
         except ConversionError as e:
             self._logger.log(
                 "error",
@@ -81,16 +96,15 @@ class CrewDoclingSource(BaseKnowledgeSource):
             raise e
 
     def add(self) -> None:
-        if self.content is None:
-            return
-        for doc in self.content:
-            new_chunks_iterable = self._chunk_doc(doc)
-            self.chunks.extend(list(new_chunks_iterable))
-        self._save_documents()
-
-    def _convert_source_to_docling_documents(self) -> List["DoclingDocument"]:
-        conv_results_iter = self.document_converter.convert_all(self.safe_file_paths)
-        return [result.document for result in conv_results_iter]
+        self._add_chunks(self.iter_chunks())
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the chunks of the documents, converting them as they are needed."""
+        documents: Iterable[DoclingDocument] = (
+            self._iter_docling_documents() if self._content is None else self._content
+        )
+        for doc in documents:
+            yield from self._chunk_doc(doc)
 
     def _chunk_doc(self, doc: "DoclingDocument") -> Iterator[str]:
         chunker = HierarchicalChunker()
@@ -1,7 +1,8 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator
 
+from crewai.knowledge.chunking import RecordChunker
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
@@ -10,31 +11,20 @@ class CSVKnowledgeSource(BaseFileKnowledgeSource):
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+        return {
+            file_path: "".join(self.iter_file(file_path))
+            for file_path in self.safe_file_paths
+        }
 
-    def add(self) -> None:
-        """
-        Add CSV file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Read a CSV file row by row."""
+        with open(path, "r", encoding="utf-8") as csvfile:
+            for row in csv.reader(csvfile):
+                yield " ".join(row) + "\n"
 
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def _chunk_file(self, path: Path) -> Iterator[str]:
+        """Chunk whole rows, starting every chunk with the header row."""
+        chunker = RecordChunker(
+            self.chunk_size, self._length_function(), repeat_header=True
+        )
+        return chunker.chunk(self.iter_file(path))
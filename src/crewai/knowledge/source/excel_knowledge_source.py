@@ -1,9 +1,12 @@
+import csv
+import io
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
+from crewai.knowledge.chunking import RecordChunker
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
@@ -24,8 +27,19 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
         default_factory=list, description="The path to the file"
     )
     chunks: List[str] = Field(default_factory=list)
-    content: Dict[Path, Dict[str, str]] = Field(default_factory=dict)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    _content: Optional[Dict[Path, Dict[str, str]]] = PrivateAttr(default=None)
+
+    @property
+    def content(self) -> Dict[Path, Dict[str, str]]:
+        """Sheets of the workbooks, loaded on first access."""
+        if self._content is None:
+            self._content = self._load_content()
+        return self._content
+
+    @content.setter
+    def content(self, content: Dict[Path, Dict[str, str]]) -> None:
+        self._content = content
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -98,7 +112,6 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             self.file_paths = self.file_path
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self._load_content()
 
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
@@ -112,20 +125,68 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             ImportError: If required dependencies are missing.
             FileNotFoundError: If the specified Excel file cannot be opened.
         """
-        pd = self._import_dependencies()
         content_dict = {}
         for file_path in self.safe_file_paths:
             file_path = self.convert_to_path(file_path)
-            with pd.ExcelFile(file_path) as xl:
-                sheet_dict = {
-                    str(sheet_name): str(
-                        pd.read_excel(xl, sheet_name).to_csv(index=False)
-                    )
-                    for sheet_name in xl.sheet_names
-                }
-            content_dict[file_path] = sheet_dict
+            content_dict[file_path] = dict(self._iter_sheets(file_path))
         return content_dict
 
+    def _iter_sheets(self, file_path: Path) -> Iterator[Tuple[str, str]]:
+        """Read a workbook one sheet at a time, as CSV content."""
+        pd = self._import_dependencies()
+        with pd.ExcelFile(file_path) as xl:
+            for sheet_name in xl.sheet_names:
+                yield (
+                    str(sheet_name),
+                    str(pd.read_excel(xl, sheet_name).to_csv(index=False)),
+                )
+
+    def _iter_sheet_rows(self, file_path: Path) -> Iterator[Iterator[str]]:
+        """Read a workbook one sheet at a time, as CSV lines, header first."""
+        pd = self._import_dependencies()
+        with pd.ExcelFile(file_path) as xl:
+            for sheet_name in xl.sheet_names:
+                sheet = pd.read_excel(xl, sheet_name)
+                yield self._sheet_rows(str(sheet_name), sheet)
+
+    @staticmethod
+    def _sheet_rows(sheet_name: str, sheet) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(sheet.columns)
+        yield f"Sheet: {sheet_name}\n{buffer.getvalue()}"
+        for row in sheet.itertuples(index=False):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(row)
+            yield buffer.getvalue()
+
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Yield the CSV content of a workbook sheet by sheet."""
+        for _, sheet in self._iter_sheets(path):
+            yield sheet + "\n"
+
+    def iter_documents(self) -> Iterator[str]:
+        """Yield the CSV content of every sheet, reading workbooks lazily."""
+        for file_path in self._streamed_file_paths():
+            yield from self.iter_file(file_path)
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the chunks of every workbook, chunking each one separately."""
+        for file_path in self._streamed_file_paths():
+            yield from self._chunk_file(file_path)
+
+    def _chunk_file(self, path: Path) -> Iterator[str]:
+        """Chunk whole rows, starting every chunk with the sheet and header row."""
+        chunker = RecordChunker(
+            self.chunk_size, self._length_function(), repeat_header=True
+        )
+        for rows in self._iter_sheet_rows(path):
+            yield from chunker.chunk(rows)
+
+    def _streamed_file_paths(self) -> List[Path]:
+        return [self.convert_to_path(path) for path in self.safe_file_paths]
+
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
         return Path(KNOWLEDGE_DIRECTORY + "/" + path) if isinstance(path, str) else path
@@ -144,26 +205,7 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
 
     def add(self) -> None:
         """
-        Add Excel file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        Stream the Excel sheets to the knowledge source, chunk them, compute
+        embeddings, and save the embeddings.
         """
-        # Convert dictionary values to a single string if content is a dictionary
-        # Updated to account for .xlsx workbooks with multiple tabs/sheets
-        content_str = ""
-        for value in self.content.values():
-            if isinstance(value, dict):
-                for sheet_value in value.values():
-                    content_str += str(sheet_value) + "\n"
-            else:
-                content_str += str(value) + "\n"
-
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_chunks(self.iter_chunks())
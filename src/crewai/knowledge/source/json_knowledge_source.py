@@ -1,7 +1,8 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator
 
+from crewai.knowledge.chunking import RecordChunker, iter_json_records
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
@@ -13,40 +14,40 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
         content: Dict[Path, str] = {}
         for path in self.safe_file_paths:
             path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-            content[path] = self._json_to_text(data)
+            content[path] = "".join(self.iter_file(path))
         return content
 
+    def iter_file(self, path: Path) -> Iterator[str]:
+        """Parse a JSON file and yield its text representation piece by piece."""
+        with open(path, "r", encoding="utf-8") as json_file:
+            data = json.load(json_file)
+        yield from self._iter_json_text(data)
+
+    def _chunk_file(self, path: Path) -> Iterator[str]:
+        """Chunk whole JSON records, each labelled with its path in the file."""
+        with open(path, "r", encoding="utf-8") as json_file:
+            data = json.load(json_file)
+        length_function = self._length_function()
+        records = iter_json_records(
+            data, self.chunk_size, self._iter_json_text, length_function
+        )
+        return RecordChunker(self.chunk_size, length_function).chunk(records)
+
     def _json_to_text(self, data: Any, level: int = 0) -> str:
         """Recursively convert JSON data to a text representation."""
-        text = ""
+        return "".join(self._iter_json_text(data, level))
+
+    def _iter_json_text(self, data: Any, level: int = 0) -> Iterator[str]:
         indent = "  " * level
         if isinstance(data, dict):
             for key, value in data.items():
-                text += f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
+                yield f"{indent}{key}: "
+                yield from self._iter_json_text(value, level + 1)
+                yield "\n"
         elif isinstance(data, list):
             for item in data:
-                text += f"{indent}- {self._json_to_text(item, level + 1)}\n"
+                yield f"{indent}- "
+                yield from self._iter_json_text(item, level + 1)
+                yield "\n"
         else:
-            text += f"{str(data)}"
-        return text
-
-    def add(self) -> None:
-        """
-        Add JSON file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+            yield str(data)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, Optional
 
 from pydantic import Field
 
@@ -20,15 +20,16 @@ class StringKnowledgeSource(BaseKnowledgeSource):
         if not isinstance(self.content, str):
             raise ValueError("StringKnowledgeSource only accepts string content")
 
+    def ingestion_key(self) -> Optional[str]:
+        """Identify the source by its content, as strings have no other identity."""
+        return f"{type(self).__name__}:{self.ingestion_fingerprint()}"
+
+    def ingestion_fingerprint(self) -> Optional[str]:
+        return self._fingerprint(self.content)
+
     def add(self) -> None:
         """Add string content to the knowledge source, chunk it, compute embeddings, and save them."""
-        new_chunks = self._chunk_text(self.content)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_chunks(self.iter_chunks())
+
+    def iter_documents(self) -> Iterator[str]:
+        yield self.content
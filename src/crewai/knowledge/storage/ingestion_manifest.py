@@ -0,0 +1,159 @@
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite import SQLiteConnectionPool
+
+
+@dataclass
+class IngestionRecord:
+    """What was ingested from a knowledge source into a collection."""
+
+    fingerprint: str
+    chunk_ids: List[str] = field(default_factory=list)
+    file_paths: List[str] = field(default_factory=list)
+
+
+class KnowledgeIngestionManifest:
+    """
+    SQLite manifest of the knowledge sources ingested into each collection.
+
+    Every source is recorded with a fingerprint of its content and the ids of
+    the chunks it was split into, so that a source is only re-embedded when
+    it changed and chunks that no source uses anymore can be removed. The
+    content hash of every ingested file is also kept along with its size and
+    modification time, so unchanged files are not read again to be
+    fingerprinted. The manifest lives next to the knowledge collections and
+    is removed with them when knowledge is reset, which is why connections
+    are not kept open.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or os.path.join(
+            db_storage_path(), KNOWLEDGE_DIRECTORY, "ingestion_manifest.db"
+        )
+        self._pool = SQLiteConnectionPool(self.db_path, max_idle=0)
+        self._initialized = False
+
+    def get(self, collection: str, source_key: str) -> Optional[IngestionRecord]:
+        """Return the record of a source, or None if it was never ingested."""
+        return self.records(collection, source_key).get(source_key)
+
+    def records(
+        self, collection: str, source_key: Optional[str] = None
+    ) -> Dict[str, IngestionRecord]:
+        """Return the records of a collection keyed by source."""
+        query = (
+            "SELECT source_key, fingerprint, chunk_ids, file_paths "
+            "FROM knowledge_ingestion_manifest WHERE collection = ?"
+        )
+        params = [collection]
+        if source_key is not None:
+            query += " AND source_key = ?"
+            params.append(source_key)
+        try:
+            with self._connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {
+            row[0]: IngestionRecord(row[1], json.loads(row[2]), json.loads(row[3]))
+            for row in rows
+        }
+
+    def record(self, collection: str, source_key: str, record: IngestionRecord) -> None:
+        """Save the record of a source, replacing the previous one."""
+        with self._connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO knowledge_ingestion_manifest
+                (collection, source_key, fingerprint, chunk_ids, file_paths, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    collection,
+                    source_key,
+                    record.fingerprint,
+                    json.dumps(record.chunk_ids),
+                    json.dumps(record.file_paths),
+                    time.time(),
+                ),
+            )
+
+    def remove(self, collection: str, source_keys: List[str]) -> None:
+        """Forget the given sources of a collection."""
+        if not source_keys:
+            return
+        with self._connection() as conn:
+            conn.executemany(
+                "DELETE FROM knowledge_ingestion_manifest "
+                "WHERE collection = ? AND source_key = ?",
+                [(collection, source_key) for source_key in source_keys],
+            )
+
+    def file_digests(self, paths: Iterable[str]) -> Dict[str, Tuple[int, int, str]]:
+        """Return the size, modification time and content hash of known files."""
+        paths = list(paths)
+        rows = []
+        try:
+            with self._connection() as conn:
+                # Stay below SQLite's limit on the number of query parameters
+                for start in range(0, len(paths), 500):
+                    batch = paths[start : start + 500]
+                    rows.extend(
+                        conn.execute(
+                            "SELECT path, size, mtime_ns, digest "
+                            "FROM knowledge_file_digests "
+                            f"WHERE path IN ({', '.join('?' * len(batch))})",
+                            batch,
+                        ).fetchall()
+                    )
+        except sqlite3.Error:
+            return {}
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def record_file_digests(self, digests: Dict[str, Tuple[int, int, str]]) -> None:
+        """Save the size, modification time and content hash of files."""
+        if not digests:
+            return
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO knowledge_file_digests "
+                "(path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                [(path, *digest) for path, digest in digests.items()],
+            )
+
+    def _connection(self):
+        if not self._initialized or not os.path.exists(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            with self._pool.connection() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS knowledge_ingestion_manifest (
+                        collection TEXT NOT NULL,
+                        source_key TEXT NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        chunk_ids TEXT NOT NULL,
+                        file_paths TEXT NOT NULL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (collection, source_key)
+                    )
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS knowledge_file_digests (
+                        path TEXT PRIMARY KEY,
+                        size INTEGER NOT NULL,
+                        mtime_ns INTEGER NOT NULL,
+                        digest TEXT NOT NULL
+                    )
+                    """
+                )
+            self._initialized = True
+        return self._pool.connection()
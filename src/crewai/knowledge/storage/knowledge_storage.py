@@ -1,8 +1,21 @@
+import contextvars
 import hashlib
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import chromadb
 import chromadb.errors
@@ -12,6 +25,15 @@ from chromadb.config import Settings
 import warnings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.ingestion_manifest import (
+    IngestionRecord,
+    KnowledgeIngestionManifest,
+)
+from crewai.knowledge.storage.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
+from crewai.rag.embeddings.cache import embedder_namespace
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
 from crewai.utilities.chromadb import sanitize_collection_name
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
@@ -19,12 +41,49 @@ from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
 from crewai.utilities.chromadb import create_persistent_client
 from crewai.utilities.logger_utils import suppress_logging
+from crewai.utilities.search_cache import SearchCache
+
+# Re-orders the fused results of a query, e.g. with a cross-encoder
+Reranker = Callable[[str, List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+_primed_query_embeddings: contextvars.ContextVar[
+    Optional[Dict[Tuple[str, str], Any]]
+] = contextvars.ContextVar("primed_query_embeddings", default=None)
+
+
+def _candidates(limit: int) -> int:
+    """Depth of the rankings fused by hybrid search, so either side contributes."""
+    return max(limit * 4, 20)
+
+
+@contextmanager
+def primed_query_embeddings(
+    embeddings: Dict[Tuple[str, str], Any],
+) -> Iterator[None]:
+    """Let storages reuse query embeddings computed for several of them.
+
+    Args:
+        embeddings: Vectors keyed by the ``embedding_key`` of the storages
+            and the query text.
+    """
+    token = _primed_query_embeddings.set(embeddings)
+    try:
+        yield
+    finally:
+        _primed_query_embeddings.reset(token)
 
 
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    With ``hybrid_search``, documents are also indexed in a BM25 lexical index
+    kept next to the collection, and queries fuse the vector and lexical
+    results with reciprocal rank fusion. This finds exact identifiers, such
+    as error codes or function names, that embeddings tend to miss. The score
+    threshold only applies to the vector results, as lexical matches have no
+    distance to compare it with.
     """
 
     collection: Optional[chromadb.Collection] = None
@@ -35,8 +94,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self,
         embedder: Optional[Dict[str, Any]] = None,
         collection_name: Optional[str] = None,
+        hybrid_search: bool = False,
+        reranker: Optional[Reranker] = None,
     ):
         self.collection_name = collection_name
+        self.hybrid_search = hybrid_search
+        self.reranker = reranker
+        self._search_cache = SearchCache()
+        self._manifest: Optional[KnowledgeIngestionManifest] = None
+        self._lexical_index: Optional[LexicalIndex] = None
         self._set_embedder_config(embedder)
 
     def search(
@@ -46,28 +112,187 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
     ) -> List[Dict[str, Any]]:
+        return self._search_cache.get_or_search(
+            query,
+            limit,
+            score_threshold,
+            filter,
+            lambda: self._query(query, limit, filter, score_threshold),
+        )
+
+    def search_is_cached(
+        self,
+        query: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> bool:
+        """Whether ``search`` would answer these arguments from its cache."""
+        return self._search_cache.contains(query, limit, score_threshold, filter)
+
+    @property
+    def embedding_key(self) -> str:
+        """Identifies the embedder, for sharing query embeddings across storages.
+
+        Configured providers and the default embedder are identified by their
+        model, while custom embedding functions are only shared by instance.
+        """
+        config = self._embedder_config
+        if not config or config.get("provider") != "custom":
+            return embedder_namespace(self.embedder, config)
+        return f"{type(self.embedder).__qualname__}@{id(self.embedder)}"
+
+    def _query(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        score_threshold: float,
+    ) -> List[Dict[str, Any]]:
+        """Search every query, merging their results by relevance.
+
+        With hybrid search, the fused rankings of the queries are fused again,
+        as their scores do not measure relevance.
+        """
+        candidates = limit if self._lexical_index is None else _candidates(limit)
+        rankings = self._vector_query(query, candidates, filter, score_threshold)
+        if self._lexical_index is not None:
+            rankings = [
+                self._fuse(text, dense, limit, filter)
+                for text, dense in zip(query, rankings)
+            ]
+            if len(rankings) > 1:
+                return self._fuse_queries(rankings, limit)
+        if len(rankings) == 1:
+            return rankings[0]
+
+        best: Dict[str, Dict[str, Any]] = {}
+        for ranking in rankings:
+            for result in ranking:
+                kept = best.get(result["id"])
+                if kept is None or result["relevance"] > kept["relevance"]:
+                    best[result["id"]] = result
+        merged = sorted(best.values(), key=lambda r: r["relevance"], reverse=True)
+        return merged[:limit]
+
+    def _fuse(
+        self,
+        text: str,
+        dense: List[Dict[str, Any]],
+        limit: int,
+        filter: Optional[dict],
+    ) -> List[Dict[str, Any]]:
+        """Fuse the vector results of a query with its lexical results.
+
+        The results are ranked by their fused ``score``, and keep the vector
+        ``relevance`` used to compare them with the results of other storages,
+        0 for the chunks only found by the lexical index.
+        """
+        by_id = {result["id"]: result for result in dense}
+        index: LexicalIndex = self._lexical_index  # type: ignore[assignment]
+        lexical = [doc_id for doc_id, _ in index.search(text, _candidates(limit))]
+        missing = [doc_id for doc_id in lexical if doc_id not in by_id]
+        if missing:
+            fetched = self.collection.get(  # type: ignore[union-attr]
+                ids=missing, where=filter, include=["documents", "metadatas"]
+            )
+            documents = fetched["documents"] or []
+            metadatas = fetched["metadatas"] or []
+            for doc_id, document, metadata in zip(
+                fetched["ids"], documents, metadatas
+            ):
+                by_id[doc_id] = {
+                    "id": doc_id,
+                    "metadata": metadata,
+                    "context": document,
+                }
+
+        fused = reciprocal_rank_fusion(
+            [
+                [result["id"] for result in dense],
+                [doc_id for doc_id in lexical if doc_id in by_id],
+            ]
+        )
+        results = [
+            {
+                **by_id[doc_id],
+                "score": score,
+                "relevance": by_id[doc_id].get("relevance", 0.0),
+            }
+            for doc_id, score in fused
+        ]
+        if self.reranker:
+            results = self.reranker(text, results)
+        return results[:limit]
+
+    @staticmethod
+    def _fuse_queries(
+        rankings: List[List[Dict[str, Any]]], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Fuse the hybrid rankings of several queries into one."""
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for ranking in rankings:
+            for result in ranking:
+                kept = by_id.get(result["id"])
+                if kept is None or result["relevance"] > kept["relevance"]:
+                    by_id[result["id"]] = result
+        fused = reciprocal_rank_fusion(
+            [[result["id"] for result in ranking] for ranking in rankings]
+        )
+        return [
+            {**by_id[doc_id], "score": score} for doc_id, score in fused[:limit]
+        ]
+
+    def _vector_query(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        score_threshold: float,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search the collection with each query, in a single request.
+
+        Queries embedded beforehand by ``primed_query_embeddings`` are not
+        embedded again.
+        """
+        primed = _primed_query_embeddings.get()
+        embeddings = [
+            primed.get((self.embedding_key, text)) if primed else None
+            for text in query
+        ]
         with suppress_logging(
             "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
         ):
-            if self.collection:
+            if not self.collection:
+                raise Exception("Collection not initialized")
+            if query and all(embedding is not None for embedding in embeddings):
                 fetched = self.collection.query(
-                    query_texts=query,
+                    query_embeddings=embeddings,  # type: ignore[arg-type]
                     n_results=limit,
                     where=filter,
                 )
-                results = []
-                for i in range(len(fetched["ids"][0])):  # type: ignore
-                    result = {
-                        "id": fetched["ids"][0][i],  # type: ignore
-                        "metadata": fetched["metadatas"][0][i],  # type: ignore
-                        "context": fetched["documents"][0][i],  # type: ignore
-                        "score": fetched["distances"][0][i],  # type: ignore
-                    }
-                    if result["score"] >= score_threshold:
-                        results.append(result)
-                return results
             else:
-                raise Exception("Collection not initialized")
+                fetched = self.collection.query(
+                    query_texts=query,
+                    n_results=limit,
+                    where=filter,
+                )
+
+        rankings = []
+        for q in range(len(query)):
+            results = []
+            for i in range(len(fetched["ids"][q])):  # type: ignore
+                result = {
+                    "id": fetched["ids"][q][i],  # type: ignore
+                    "metadata": fetched["metadatas"][q][i],  # type: ignore
+                    "context": fetched["documents"][q][i],  # type: ignore
+                    "score": fetched["distances"][q][i],  # type: ignore
+                }
+                if result["score"] >= score_threshold:
+                    result["relevance"] = 1.0 / (1.0 + result["score"])
+                    results.append(result)
+            rankings.append(results)
+        return rankings
 
     def initialize_knowledge_storage(self):
         # Suppress deprecation warnings from chromadb, which are not relevant to us
@@ -78,20 +303,21 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             module=r"^chromadb(\.|$)",
         )
 
+        # Shared with the other storages opened on the collection
+        self._search_cache = SearchCache(
+            namespace=os.path.join(
+                db_storage_path(), "knowledge", self._sanitized_collection_name
+            )
+        )
         self.app = create_persistent_client(
             path=os.path.join(db_storage_path(), "knowledge"),
             settings=Settings(allow_reset=True),
         )
 
         try:
-            collection_name = (
-                f"knowledge_{self.collection_name}"
-                if self.collection_name
-                else "knowledge"
-            )
             if self.app:
                 self.collection = self.app.get_or_create_collection(
-                    name=sanitize_collection_name(collection_name),
+                    name=self._sanitized_collection_name,
                     embedding_function=self.embedder,
                 )
             else:
@@ -99,7 +325,200 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         except Exception:
             raise Exception("Failed to create or get collection")
 
+        if self.hybrid_search:
+            self._lexical_index = LexicalIndex(
+                os.path.join(
+                    db_storage_path(),
+                    KNOWLEDGE_DIRECTORY,
+                    "lexical",
+                    self._sanitized_collection_name,
+                )
+            )
+            self._sync_lexical_index()
+
+    def _sync_lexical_index(self, page_size: int = 1000) -> None:
+        """Rebuild the lexical index if it does not match the collection.
+
+        This indexes collections created before hybrid search was enabled.
+        """
+        if not self.collection or self._lexical_index is None:
+            return
+        total = self.collection.count()
+        if len(self._lexical_index) == total:
+            return
+        self._lexical_index.clear()
+        for offset in range(0, total, page_size):
+            page = self.collection.get(
+                limit=page_size, offset=offset, include=["documents"]
+            )
+            documents = page["documents"] or []
+            self._lexical_index.add(dict(zip(page["ids"], documents)))
+        self._lexical_index.flush()
+
+    @property
+    def _sanitized_collection_name(self) -> str:
+        return sanitize_collection_name(
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+
+    @property
+    def manifest(self) -> KnowledgeIngestionManifest:
+        """Manifest of the sources ingested into the knowledge collections."""
+        if self._manifest is None:
+            self._manifest = KnowledgeIngestionManifest()
+        return self._manifest
+
+    def is_ingested(self, source_key: str, fingerprint: str) -> bool:
+        """Whether a source with this fingerprint is already in the collection.
+
+        Args:
+            source_key: Identifies the source within the collection.
+            fingerprint: Hash of the source content and chunking settings.
+        """
+        if not self.collection:
+            return False
+        record = self.manifest.get(self._sanitized_collection_name, source_key)
+        if record is None or record.fingerprint != fingerprint:
+            return False
+        # Guard against collections that were emptied behind the manifest's back
+        present = self.collection.get(ids=record.chunk_ids, include=[])["ids"]
+        return len(present) == len(set(record.chunk_ids))
+
+    def sync_documents(
+        self,
+        source_key: str,
+        documents: Iterable[str],
+        fingerprint: str,
+        file_paths: Optional[Sequence[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        batch_size: int = 256,
+    ) -> int:
+        """Save the documents of a source, embedding only the new ones.
+
+        Documents are consumed in batches of ``batch_size``, so sources can be
+        streamed without holding all their chunks in memory. Documents already
+        in the collection are left untouched, and the documents the source had
+        on its previous ingestion and no longer has are deleted unless another
+        source still uses them.
+
+        Args:
+            source_key: Identifies the source within the collection.
+            documents: All the chunks of the source.
+            fingerprint: Hash of the source content and chunking settings.
+            file_paths: Files the source was read from, so that its chunks can
+                be removed once these files are deleted.
+            metadata: Metadata of all the documents.
+            batch_size: Number of documents embedded at once.
+
+        Returns:
+            The number of documents that were embedded.
+        """
+        if not self.collection:
+            raise Exception("Collection not initialized")
+
+        seen: Dict[str, None] = {}
+        embedded = 0
+        batch: List[str] = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                embedded += self._save_new_documents(batch, metadata, seen)
+                batch = []
+        if batch:
+            embedded += self._save_new_documents(batch, metadata, seen)
+
+        collection_name = self._sanitized_collection_name
+        records = self.manifest.records(collection_name)
+        previous = records.pop(source_key, None)
+        if previous:
+            self._delete_unused_chunks(set(previous.chunk_ids) - seen.keys(), records)
+
+        self.manifest.record(
+            collection_name,
+            source_key,
+            IngestionRecord(fingerprint, list(seen), list(file_paths or [])),
+        )
+        self.flush()
+        return embedded
+
+    def _save_new_documents(
+        self,
+        documents: List[str],
+        metadata: Optional[Dict[str, Any]],
+        seen: Dict[str, None],
+    ) -> int:
+        """Save the documents that are neither in the collection nor in ``seen``."""
+        new_documents: Dict[str, str] = {}
+        for document in documents:
+            doc_id = hashlib.sha256(document.encode("utf-8")).hexdigest()
+            if doc_id not in seen:
+                seen[doc_id] = None
+                new_documents[doc_id] = document
+        if not new_documents:
+            return 0
+
+        present = self.collection.get(  # type: ignore[union-attr]
+            ids=list(new_documents), include=[]
+        )["ids"]
+        for doc_id in present:
+            new_documents.pop(doc_id, None)
+        if new_documents:
+            self.save(list(new_documents.values()), metadata)
+        return len(new_documents)
+
+    def remove_deleted_sources(self) -> int:
+        """Remove the chunks of file sources whose files were all deleted.
+
+        Sources that are merely not configured are kept, as several crews and
+        agents may share a collection.
+
+        Returns:
+            The number of removed sources.
+        """
+        if not self.collection:
+            return 0
+        collection_name = self._sanitized_collection_name
+        records = self.manifest.records(collection_name)
+        deleted = [
+            source_key
+            for source_key, record in records.items()
+            if record.file_paths
+            and not any(os.path.exists(path) for path in record.file_paths)
+        ]
+        if not deleted:
+            return 0
+
+        stale_ids = set()
+        for source_key in deleted:
+            stale_ids.update(records.pop(source_key).chunk_ids)
+        self._delete_unused_chunks(stale_ids, records)
+        self.manifest.remove(collection_name, deleted)
+        self.flush()
+        return len(deleted)
+
+    def flush(self) -> None:
+        """Write the lexical index changes made since the last flush to disk.
+
+        ``save`` only updates the index in memory, so that ingesting a source
+        writes a single segment rather than one per batch.
+        """
+        if self._lexical_index is not None:
+            self._lexical_index.flush()
+
+    def _delete_unused_chunks(
+        self, chunk_ids: set, records: Dict[str, IngestionRecord]
+    ) -> None:
+        """Delete the chunks none of the remaining sources use."""
+        for record in records.values():
+            chunk_ids.difference_update(record.chunk_ids)
+        if chunk_ids and self.collection:
+            self.collection.delete(ids=list(chunk_ids))
+            if self._lexical_index is not None:
+                self._lexical_index.remove(chunk_ids)
+            self._search_cache.invalidate()
+
     def reset(self):
+        self._search_cache.invalidate()
         base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
         if not self.app:
             self.app = create_persistent_client(
@@ -110,6 +529,9 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         shutil.rmtree(base_path)
         self.app = None
         self.collection = None
+        if self._lexical_index is not None:
+            self._lexical_index.clear()
+            self._lexical_index = None
 
     def save(
         self,
@@ -155,6 +577,9 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 metadatas=final_metadata,
                 ids=filtered_ids,
             )
+            if self._lexical_index is not None:
+                self._lexical_index.add(dict(zip(filtered_ids, filtered_docs)))
+            self._search_cache.invalidate()
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -186,6 +611,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
+        self._embedder_config = embedder
         self.embedder = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
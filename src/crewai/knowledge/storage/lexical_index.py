@@ -0,0 +1,412 @@
+import heapq
+import json
+import math
+import os
+import re
+import shutil
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"\w+")
+_PENDING = ""
+
+# Rank offset of reciprocal rank fusion, dampening the weight of top ranks
+RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words, keeping identifiers like ``ERR_42``."""
+    return _TOKEN.findall(text.lower())
+
+
+class _Segment:
+    """Immutable postings of a set of documents, stored as flat arrays.
+
+    The postings of the term ``terms[term]`` are
+    ``postings[offsets[t]:offsets[t + 1]]``, the positions of the documents
+    containing it, with its frequency in each of them in ``freqs``.
+    """
+
+    def __init__(
+        self,
+        doc_ids: List[str],
+        terms: Dict[str, int],
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        freqs: np.ndarray,
+        lengths: np.ndarray,
+    ) -> None:
+        self.doc_ids = doc_ids
+        self.terms = terms
+        self.offsets = offsets
+        self.postings = postings
+        self.freqs = freqs
+        self.lengths = lengths
+
+    @classmethod
+    def build(cls, documents: Dict[str, Counter]) -> "_Segment":
+        by_term: Dict[str, List[Tuple[int, int]]] = {}
+        for position, counts in enumerate(documents.values()):
+            for term, freq in counts.items():
+                by_term.setdefault(term, []).append((position, freq))
+
+        terms: Dict[str, int] = {}
+        offsets = [0]
+        postings: List[int] = []
+        freqs: List[int] = []
+        for term in sorted(by_term):
+            terms[term] = len(terms)
+            for position, freq in by_term[term]:
+                postings.append(position)
+                freqs.append(freq)
+            offsets.append(len(postings))
+        return cls(
+            list(documents),
+            terms,
+            np.array(offsets, dtype=np.int64),
+            np.array(postings, dtype=np.int32),
+            np.array(freqs, dtype=np.int32),
+            np.array(
+                [sum(counts.values()) for counts in documents.values()],
+                dtype=np.int32,
+            ),
+        )
+
+    @classmethod
+    def load(cls, directory: str) -> "_Segment":
+        """Open a segment, memory-mapping its arrays."""
+        with open(os.path.join(directory, "segment.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in ("offsets", "postings", "freqs", "lengths")
+        }
+        terms = {term: index for index, term in enumerate(meta["terms"])}
+        return cls(meta["doc_ids"], terms, **arrays)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in ("offsets", "postings", "freqs", "lengths"):
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, "segment.json"), "w", encoding="utf-8") as f:
+            json.dump({"doc_ids": self.doc_ids, "terms": list(self.terms)}, f)
+
+    def lookup(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        index = self.terms.get(term)
+        if index is None:
+            return None
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.postings[start:end], self.freqs[start:end]
+
+    @classmethod
+    def merge(cls, parts: List[Tuple["_Segment", np.ndarray]]) -> "_Segment":
+        """Merge the live documents of segments, given with their live masks.
+
+        The postings are remapped and sorted as arrays, without rebuilding
+        the term counts of each document.
+        """
+        vocabulary = sorted(set().union(*(segment.terms for segment, _ in parts)))
+        term_index = {term: index for index, term in enumerate(vocabulary)}
+        doc_ids: List[str] = []
+        term_ids, postings, freqs, lengths = [], [], [], []
+        for segment, live in parts:
+            # New position of each document, -1 for the removed ones
+            positions = np.full(len(live), -1, dtype=np.int64)
+            positions[live] = np.arange(len(doc_ids), len(doc_ids) + int(live.sum()))
+            doc_ids.extend(
+                doc_id for doc_id, keep in zip(segment.doc_ids, live) if keep
+            )
+            lengths.append(np.asarray(segment.lengths)[live])
+
+            moved = positions[np.asarray(segment.postings)]
+            keep = moved >= 0
+            segment_terms = np.array(
+                [term_index[term] for term in segment.terms], dtype=np.int64
+            )
+            term_ids.append(np.repeat(segment_terms, np.diff(segment.offsets))[keep])
+            postings.append(moved[keep])
+            freqs.append(np.asarray(segment.freqs)[keep])
+
+        all_terms = np.concatenate(term_ids)
+        all_postings = np.concatenate(postings)
+        order = np.lexsort((all_postings, all_terms))
+        # Terms left without postings are dropped
+        counts = np.bincount(all_terms, minlength=len(vocabulary))
+        used = np.flatnonzero(counts)
+        return cls(
+            doc_ids,
+            {vocabulary[index]: position for position, index in enumerate(used)},
+            np.concatenate(([0], np.cumsum(counts[used]))).astype(np.int64),
+            all_postings[order].astype(np.int32),
+            np.concatenate(freqs)[order].astype(np.int32),
+            np.concatenate(lengths).astype(np.int32),
+        )
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index of the documents of a knowledge collection.
+
+    Documents are added to an in-memory segment, which ``flush`` writes to
+    disk as flat arrays that are memory-mapped when the index is opened.
+    Segments are merged by size tiers: once ``merge_factor`` segments hold
+    about the same number of documents, they are merged into one segment of
+    the next tier, so each document is only rewritten a logarithmic number of
+    times. Removed documents are masked until their segment is merged.
+    Without a ``path``, the index only lives in memory, and ``flush`` keeps
+    the segments there.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        merge_factor: int = 8,
+    ) -> None:
+        if merge_factor < 2:
+            raise ValueError("merge_factor must be at least 2")
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.merge_factor = merge_factor
+        self._segments: Dict[str, _Segment] = {}
+        self._pending: Dict[str, Counter] = {}
+        # Segment of the pending documents, built by the first search after a change
+        self._pending_segment: Optional[_Segment] = None
+        # Segment holding the live version of each document
+        self._locations: Dict[str, str] = {}
+        self._deleted: Set[Tuple[str, str]] = set()
+        self._next_segment = 0
+        self._live: Optional[Dict[str, np.ndarray]] = None
+        self._lock = threading.RLock()
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._locations
+
+    def add(self, documents: Dict[str, str]) -> None:
+        """Index documents by id, replacing the documents with the same ids."""
+        with self._lock:
+            for doc_id, text in documents.items():
+                self._unlink(doc_id)
+                self._pending[doc_id] = Counter(tokenize(text))
+                self._locations[doc_id] = _PENDING
+            self._pending_segment = None
+            self._live = None
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        """Remove documents from the index."""
+        with self._lock:
+            for doc_id in doc_ids:
+                self._unlink(doc_id)
+                self._locations.pop(doc_id, None)
+            self._pending_segment = None
+            self._live = None
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Return the ids and BM25 scores of the best matching documents."""
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or not self._locations:
+                return []
+            segments = self._searchable_segments()
+            live = self._live_masks(segments)
+            total_length = sum(
+                int(segment.lengths[live[name]].sum())
+                for name, segment in segments.items()
+            )
+            count = len(self._locations)
+            average_length = total_length / count or 1.0
+
+            scores: Dict[str, np.ndarray] = {}
+            for term in terms:
+                matches = []
+                for name, segment in segments.items():
+                    found = segment.lookup(term)
+                    if found is None:
+                        continue
+                    positions, freqs = found
+                    keep = live[name][positions]
+                    matches.append((name, positions[keep], freqs[keep]))
+                frequency = sum(len(positions) for _, positions, _ in matches)
+                if not frequency:
+                    continue
+                idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                for name, positions, freqs in matches:
+                    segment = segments[name]
+                    tf = freqs.astype(np.float64)
+                    lengths = segment.lengths[positions] / average_length
+                    norm = self.k1 * (1 - self.b + self.b * lengths)
+                    if name not in scores:
+                        scores[name] = np.zeros(len(segment.doc_ids))
+                    scores[name][positions] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            hits = (
+                (float(segment_scores[position]), segments[name].doc_ids[position])
+                for name, segment_scores in scores.items()
+                for position in np.flatnonzero(segment_scores)
+            )
+            return [
+                (doc_id, score) for score, doc_id in heapq.nlargest(limit, hits)
+            ]
+
+    def flush(self) -> None:
+        """Write the documents added since the last flush to a segment.
+
+        The segment is saved to disk, or kept in memory without a ``path``.
+        """
+        with self._lock:
+            if self._pending:
+                self._add_segment(
+                    self._pending_segment or _Segment.build(self._pending)
+                )
+                self._pending = {}
+                self._pending_segment = None
+                self._live = None
+            while (tier := self._full_tier()) is not None:
+                self._merge(tier)
+            if self.path:
+                self._save_state()
+
+    def clear(self) -> None:
+        """Remove all documents, and the index files."""
+        with self._lock:
+            self._segments = {}
+            self._pending = {}
+            self._pending_segment = None
+            self._locations = {}
+            self._deleted = set()
+            self._live = None
+            if self.path:
+                shutil.rmtree(self.path, ignore_errors=True)
+
+    def _unlink(self, doc_id: str) -> None:
+        location = self._locations.get(doc_id)
+        if location == _PENDING:
+            self._pending.pop(doc_id, None)
+        elif location is not None:
+            self._deleted.add((location, doc_id))
+
+    def _searchable_segments(self) -> Dict[str, _Segment]:
+        segments = dict(self._segments)
+        if self._pending:
+            if self._pending_segment is None:
+                self._pending_segment = _Segment.build(self._pending)
+            segments[_PENDING] = self._pending_segment
+        return segments
+
+    def _live_masks(self, segments: Dict[str, _Segment]) -> Dict[str, np.ndarray]:
+        if self._live is None:
+            self._live = {
+                name: np.array(
+                    [self._locations.get(doc_id) == name for doc_id in segment.doc_ids],
+                    dtype=bool,
+                )
+                for name, segment in self._segments.items()
+            }
+        live = dict(self._live)
+        if _PENDING in segments:
+            live[_PENDING] = np.ones(len(self._pending), dtype=bool)
+        return live
+
+    def _tier(self, segment: _Segment) -> int:
+        size, tier = len(segment.doc_ids), 0
+        while size >= self.merge_factor:
+            size //= self.merge_factor
+            tier += 1
+        return tier
+
+    def _full_tier(self) -> Optional[List[str]]:
+        """Segments of the smallest tier holding ``merge_factor`` of them."""
+        tiers: Dict[int, List[str]] = {}
+        for name, segment in self._segments.items():
+            tiers.setdefault(self._tier(segment), []).append(name)
+        for _, names in sorted(tiers.items()):
+            if len(names) >= self.merge_factor:
+                return names
+        return None
+
+    def _merge(self, names: List[str]) -> None:
+        """Merge segments into one, dropping their removed documents."""
+        live = self._live_masks(self._segments)
+        merged = _Segment.merge([(self._segments[name], live[name]) for name in names])
+
+        for name in names:
+            del self._segments[name]
+        self._deleted = {
+            (name, doc_id) for name, doc_id in self._deleted if name not in names
+        }
+        if merged.doc_ids:
+            self._add_segment(merged)
+        self._live = None
+        if self.path:
+            self._save_state()
+            for name in names:
+                shutil.rmtree(self._segment_path(name), ignore_errors=True)
+
+    def _add_segment(self, segment: _Segment) -> None:
+        name = f"segment_{self._next_segment}"
+        self._next_segment += 1
+        if self.path:
+            segment.save(self._segment_path(name))
+            segment = _Segment.load(self._segment_path(name))
+        self._segments[name] = segment
+        for doc_id in segment.doc_ids:
+            self._locations[doc_id] = name
+
+    def _segment_path(self, name: str) -> str:
+        return os.path.join(self.path or "", name)
+
+    def _state_path(self) -> str:
+        return os.path.join(self.path or "", "index.json")
+
+    def _save_state(self) -> None:
+        os.makedirs(self.path or "", exist_ok=True)
+        state = {
+            "segments": list(self._segments),
+            "deleted": sorted(self._deleted),
+            "next_segment": self._next_segment,
+        }
+        temporary = self._state_path() + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temporary, self._state_path())
+
+    def _load(self) -> None:
+        if not os.path.exists(self._state_path()):
+            return
+        with open(self._state_path(), encoding="utf-8") as f:
+            state = json.load(f)
+        self._next_segment = state["next_segment"]
+        for name in state["segments"]:
+            segment = _Segment.load(self._segment_path(name))
+            self._segments[name] = segment
+            for doc_id in segment.doc_ids:
+                self._locations[doc_id] = name
+        for name, doc_id in state["deleted"]:
+            self._deleted.add((name, doc_id))
+            if self._locations.get(doc_id) == name:
+                del self._locations[doc_id]
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Iterable[str]], k: int = RRF_K
+) -> List[Tuple[str, float]]:
+    """Fuse rankings of ids, scoring each id by the sum of ``1 / (k + rank)``.
+
+    Returns:
+        The ids with their fused scores, best first.
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,424 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.rag.embeddings.configurator import EmbeddingConfigurator
+from crewai.utilities.chromadb import sanitize_collection_name
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.paths import db_storage_path
+
+Quantization = Literal["none", "float16", "int8"]
+
+FORMAT_VERSION = 1
+_DTYPES = {"none": np.float32, "float16": np.float16, "int8": np.int8}
+_DIGEST_SIZE = 32
+
+
+class MmapKnowledgeStorage(BaseKnowledgeStorage):
+    """
+    Knowledge storage keeping its vectors in flat memory-mapped files.
+
+    Vectors are normalized and stored row by row, optionally quantized to
+    ``float16`` or ``int8`` (with a scale per vector) to divide their size by
+    two or four. Searches scan the quantized vectors block by block, then
+    rescore the best ``rescore_factor * limit`` candidates exactly with the
+    float32 vectors, which are kept in a separate file and only read for the
+    candidates.
+
+    The files are only appended to, and ``meta.json`` is replaced once the
+    appended rows are written, so processes opening the storage with
+    ``read_only=True`` share its pages through the page cache and pick up new
+    rows on their next search. A single process should write to a storage.
+
+    Scores are cosine similarities: results scoring below ``score_threshold``
+    are left out.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Dict[str, Any]] = None,
+        collection_name: Optional[str] = None,
+        path: Optional[str] = None,
+        quantization: Quantization = "int8",
+        rescore_factor: int = 4,
+        read_only: bool = False,
+        batch_size: int = 256,
+        block_size: int = 8192,
+    ):
+        if quantization not in _DTYPES:
+            raise ValueError(f"quantization must be one of: {', '.join(_DTYPES)}")
+        self.collection_name = collection_name or "knowledge"
+        self.path = path or os.path.join(
+            db_storage_path(),
+            KNOWLEDGE_DIRECTORY,
+            "mmap",
+            sanitize_collection_name(self.collection_name),
+        )
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor
+        self.read_only = read_only
+        self.batch_size = batch_size
+        self.block_size = block_size
+        self._embedder_config = embedder
+        self._embedder: Any = None
+        self._meta: Dict[str, Any] = {}
+        self._meta_version: Optional[tuple] = None
+        self._arrays: Dict[str, Optional[np.ndarray]] = {}
+        self._digests: Optional[Set[bytes]] = None
+        self._lock = threading.RLock()
+        self._open()
+
+    @property
+    def count(self) -> int:
+        """Number of stored documents, including the ones other processes added."""
+        self._refresh()
+        return int(self._meta.get("count", 0))
+
+    @property
+    def embedder(self) -> Any:
+        """Embedding function, configured on first use."""
+        if self._embedder is None:
+            self._embedder = self._create_embedder(self._embedder_config)
+        return self._embedder
+
+    def search(
+        self,
+        query: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Dict[str, Any]]:
+        """Search the stored documents with each query, merging the results.
+
+        ``filter`` keeps the documents whose metadata has all of its items.
+        Filtered searches rank more candidates in growing rounds until enough
+        of them pass the filter.
+        """
+        if not query or not self.count:
+            return []
+        queries = self._normalize(np.asarray(self.embedder(query), dtype=np.float32))
+        with self._lock:
+            self._refresh()
+            count = int(self._meta.get("count", 0))
+            candidates = min(limit * max(self.rescore_factor, 1), count)
+            while True:
+                best, exhausted = self._best_rows(queries, candidates, score_threshold)
+                results = self._results(best, limit, filter)
+                if (
+                    not filter
+                    or len(results) == limit
+                    or exhausted
+                    or candidates == count
+                ):
+                    return results
+                candidates = min(candidates * 4, count)
+
+    def save(
+        self,
+        documents: List[str],
+        metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Embed and append the documents not already in the storage.
+
+        Documents are embedded and appended in batches of ``batch_size``.
+        """
+        self._check_writable()
+        with self._lock:
+            digests = self._stored_digests()
+            pending: Dict[bytes, tuple] = {}
+            for index, document in enumerate(documents):
+                digest = hashlib.sha256(document.encode("utf-8")).digest()
+                if digest in digests or digest in pending:
+                    continue
+                meta = metadata[index] if isinstance(metadata, list) else metadata
+                pending[digest] = (document, meta)
+                if len(pending) >= self.batch_size:
+                    self._embed_and_append(pending, digests)
+                    pending = {}
+            if pending:
+                self._embed_and_append(pending, digests)
+
+    def reset(self) -> None:
+        """Remove the stored documents and their files."""
+        self._check_writable()
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self._meta = {}
+            self._meta_version = None
+            self._arrays = {}
+            self._digests = None
+            self._open()
+
+    def _open(self) -> None:
+        if not self.read_only:
+            os.makedirs(self.path, exist_ok=True)
+        self._refresh(force=True)
+        stored = self._meta.get("quantization")
+        if stored and stored != self.quantization:
+            raise ValueError(
+                f"The storage at {self.path} is quantized as {stored}, "
+                f"not {self.quantization}"
+            )
+        if not self.read_only:
+            self._truncate_unfinished_writes()
+
+    def _refresh(self, force: bool = False) -> None:
+        """Map the rows appended since the storage was opened, if any."""
+        try:
+            stat = os.stat(self._file("meta.json"))
+        except FileNotFoundError:
+            return
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if not force and version == self._meta_version:
+            return
+        with open(self._file("meta.json"), encoding="utf-8") as f:
+            self._meta = json.load(f)
+        self._meta_version = version
+        self._arrays = {}
+
+    def _array(self, name: str) -> Optional[np.ndarray]:
+        """Memory-map one of the files of the storage, None when it is empty."""
+        if name not in self._arrays:
+            count = int(self._meta.get("count", 0))
+            dimensions = int(self._meta.get("dimensions", 0))
+            shapes = {
+                "vectors": (_DTYPES[self.quantization], (count, dimensions)),
+                "full": (np.float32, (count, dimensions)),
+                "scales": (np.float32, (count,)),
+                "offsets": (np.int64, (count + 1,)),
+            }
+            if name == "documents":
+                offsets = self._array("offsets")
+                size = int(offsets[-1]) if offsets is not None else 0
+                self._arrays[name] = (
+                    np.memmap(
+                        self._file("documents.jsonl"),
+                        dtype=np.uint8,
+                        mode="r",
+                        shape=(size,),
+                    )
+                    if size
+                    else None
+                )
+                return self._arrays[name]
+            dtype, shape = shapes[name]
+            self._arrays[name] = (
+                np.memmap(self._file(f"{name}.bin"), dtype=dtype, mode="r", shape=shape)
+                if count
+                else None
+            )
+        return self._arrays[name]
+
+    def _candidates(self, queries: np.ndarray, size: int):
+        """Yield, for each query, its best rows and their exact scores."""
+        vectors = self._array("vectors")
+        scales = self._array("scales") if self.quantization == "int8" else None
+        count = len(vectors)  # type: ignore[arg-type]
+        top_rows = np.empty((len(queries), 0), dtype=np.int64)
+        top_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, count, self.block_size):
+            block = np.asarray(
+                vectors[start : start + self.block_size],  # type: ignore[index]
+                dtype=np.float32,
+            )
+            scores = queries @ block.T
+            if scales is not None:
+                scores *= scales[start : start + self.block_size]
+            rows = np.arange(start, start + len(block))
+            top_rows = np.concatenate(
+                [top_rows, np.broadcast_to(rows, scores.shape)], axis=1
+            )
+            top_scores = np.concatenate([top_scores, scores], axis=1)
+            if top_scores.shape[1] > size:
+                keep = np.argpartition(-top_scores, size - 1, axis=1)[:, :size]
+                top_rows = np.take_along_axis(top_rows, keep, axis=1)
+                top_scores = np.take_along_axis(top_scores, keep, axis=1)
+
+        full = self._array("full") if self.quantization != "none" else None
+        for query, rows, scores in zip(queries, top_rows, top_scores):
+            if full is not None:
+                order = np.sort(rows)
+                scores = np.asarray(full[order], dtype=np.float32) @ query
+                rows = order
+            yield zip(rows.tolist(), scores.tolist())
+
+    def _best_rows(
+        self, queries: np.ndarray, candidates: int, score_threshold: float
+    ) -> Tuple[Dict[int, float], bool]:
+        """Best score of the candidate rows of the queries above the threshold.
+
+        Also tells whether every query had candidates below the threshold, in
+        which case ranking more candidates cannot add any result.
+        """
+        best: Dict[int, float] = {}
+        exhausted = True
+        for rows in self._candidates(queries, candidates):
+            below = False
+            for row, score in rows:
+                if score < score_threshold:
+                    below = True
+                elif score > best.get(row, -np.inf):
+                    best[row] = score
+            exhausted = exhausted and below
+        return best, exhausted
+
+    def _results(
+        self, best: Dict[int, float], limit: int, filter: Optional[dict]
+    ) -> List[Dict[str, Any]]:
+        results = []
+        for row, score in sorted(best.items(), key=lambda item: -item[1]):
+            document = self._document(row)
+            metadata = document.get("metadata") or {}
+            if filter and any(metadata.get(k) != v for k, v in filter.items()):
+                continue
+            results.append(
+                {
+                    "id": document["id"],
+                    "metadata": metadata,
+                    "context": document["context"],
+                    "score": score,
+                    "relevance": score,
+                }
+            )
+            if len(results) == limit:
+                break
+        return results
+
+    def _document(self, row: int) -> Dict[str, Any]:
+        offsets = self._array("offsets")
+        documents = self._array("documents")
+        start, end = int(offsets[row]), int(offsets[row + 1])  # type: ignore[index]
+        return json.loads(documents[start:end].tobytes())  # type: ignore[index]
+
+    def _embed_and_append(
+        self, pending: Dict[bytes, tuple], digests: Set[bytes]
+    ) -> None:
+        batch = list(pending.items())
+        vectors = np.asarray(
+            self.embedder([document for _, (document, _) in batch]),
+            dtype=np.float32,
+        )
+        self._append(batch, self._normalize(vectors))
+        digests.update(pending)
+
+    def _append(self, batch: List[tuple], vectors: np.ndarray) -> None:
+        count = int(self._meta.get("count", 0))
+        dimensions = int(self._meta.get("dimensions", vectors.shape[1]))
+        if vectors.shape[1] != dimensions:
+            raise ValueError(
+                f"Embedding dimension mismatch: the storage holds {dimensions} "
+                f"dimensional vectors, not {vectors.shape[1]}"
+            )
+
+        if self.quantization == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127
+            scales[scales == 0] = 1.0
+            quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+            self._write("scales.bin", scales.astype(np.float32).tobytes())
+        else:
+            quantized = vectors.astype(_DTYPES[self.quantization])
+        self._write("vectors.bin", quantized.tobytes())
+        if self.quantization != "none":
+            self._write("full.bin", vectors.tobytes())
+
+        lines = [
+            json.dumps(
+                {"id": digest.hex(), "context": document, "metadata": meta}
+            ).encode("utf-8")
+            + b"\n"
+            for digest, (document, meta) in batch
+        ]
+        position = os.path.getsize(self._file("documents.jsonl")) if count else 0
+        offsets = np.cumsum([position] + [len(line) for line in lines])
+        self._write("documents.jsonl", b"".join(lines))
+        self._write(
+            "offsets.bin", offsets[0 if not count else 1 :].astype(np.int64).tobytes()
+        )
+        self._write("ids.bin", b"".join(digest for digest, _ in batch))
+
+        self._save_meta(
+            {
+                "version": FORMAT_VERSION,
+                "quantization": self.quantization,
+                "dimensions": dimensions,
+                "count": count + len(batch),
+            }
+        )
+
+    def _write(self, name: str, data: bytes) -> None:
+        with open(self._file(name), "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _save_meta(self, meta: Dict[str, Any]) -> None:
+        temporary = self._file("meta.json.tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temporary, self._file("meta.json"))
+        self._refresh(force=True)
+
+    def _truncate_unfinished_writes(self) -> None:
+        """Drop the rows appended by a write that did not complete."""
+        count = int(self._meta.get("count", 0))
+        dimensions = int(self._meta.get("dimensions", 0))
+        offsets = self._array("offsets")
+        sizes = {
+            "vectors.bin": count
+            * dimensions
+            * np.dtype(_DTYPES[self.quantization]).itemsize,
+            "full.bin": count * dimensions * 4 if self.quantization != "none" else 0,
+            "scales.bin": count * 4 if self.quantization == "int8" else 0,
+            "offsets.bin": (count + 1) * 8 if count else 0,
+            "ids.bin": count * _DIGEST_SIZE,
+            "documents.jsonl": int(offsets[-1]) if offsets is not None else 0,
+        }
+        for name, size in sizes.items():
+            path = self._file(name)
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+    def _stored_digests(self) -> Set[bytes]:
+        if self._digests is None:
+            self._digests = set()
+            path = self._file("ids.bin")
+            if self._meta.get("count") and os.path.exists(path):
+                with open(path, "rb") as f:
+                    while chunk := f.read(_DIGEST_SIZE * 4096):
+                        self._digests.update(
+                            chunk[i : i + _DIGEST_SIZE]
+                            for i in range(0, len(chunk), _DIGEST_SIZE)
+                        )
+        return self._digests
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise PermissionError(f"The storage at {self.path} is opened read-only")
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32)
+
+    @staticmethod
+    def _create_embedder(embedder: Optional[Dict[str, Any]]) -> Any:
+        if embedder:
+            return EmbeddingConfigurator().configure_embedder(embedder)
+        from chromadb.utils.embedding_functions.openai_embedding_function import (
+            OpenAIEmbeddingFunction,
+        )
+
+        return OpenAIEmbeddingFunction(
+            api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
+        )
@@ -0,0 +1,121 @@
+"""Caching of the knowledge search queries rewritten by agent LLMs.
+
+Before searching its knowledge, an agent asks its LLM to rewrite the task
+prompt into a search query. The rewritten queries are keyed on the LLM and on
+the SHA-256 of the prompts, so identical tasks, such as the ones run by
+``kickoff_for_each`` or retried, reuse the query instead of calling the LLM
+again.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite import LRUStore
+
+
+class QueryRewriteCache:
+    """LRU cache of rewritten knowledge search queries.
+
+    Queries are kept in memory, or in a SQLite database when ``path`` is set so
+    they survive across runs and processes, see ``LRUStore``. The least
+    recently used queries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1024,
+        touch_interval: float = 60.0,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._store = LRUStore(
+            "query_rewrites",
+            path=path,
+            max_entries=max_entries,
+            touch_interval=touch_interval,
+        )
+
+    @staticmethod
+    def key(llm: Any, system_prompt: str, prompt: str) -> str:
+        """Build the cache key of ``prompt`` rewritten by ``llm``."""
+        identity = "|".join(
+            str(getattr(llm, attribute, None) or "")
+            for attribute in ("model", "base_url", "temperature")
+        )
+        digest = hashlib.sha256(
+            "\0".join((system_prompt, prompt)).encode("utf-8")
+        ).hexdigest()
+        return f"{type(llm).__qualname__}|{identity}:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up the query stored under ``key``, None if it is missing."""
+        try:
+            (query,) = self._store.get_many([key])
+        except sqlite3.Error as e:
+            logging.error(f"Error reading the query rewrite cache: {e}")
+            query = None
+        with self._lock:
+            if query is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return query
+
+    def put(self, key: str, query: str) -> None:
+        """Store the query under its key, evicting the least recently used."""
+        try:
+            self._store.put_many([(key, query)])
+        except sqlite3.Error as e:
+            logging.error(f"Error writing to the query rewrite cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached queries and reset the metrics."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+        try:
+            self._store.clear()
+        except sqlite3.Error as e:
+            logging.error(f"Error clearing the query rewrite cache: {e}")
+
+
+_shared_caches: Dict[Tuple[str, bool], QueryRewriteCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def default_query_rewrite_cache_path() -> str:
+    """Path of the query rewrite cache shared by the crews of the project."""
+    return os.path.join(db_storage_path(), "query_rewrite_cache.db")
+
+
+def get_query_rewrite_cache(
+    persist: bool = False, max_entries: int = 1024
+) -> QueryRewriteCache:
+    """Return the query rewrite cache of the project, shared by its agents.
+
+    Args:
+        persist: Whether to store the queries in
+            ``default_query_rewrite_cache_path()`` rather than in memory.
+        max_entries: Maximum number of cached queries, used when the cache is
+            first opened.
+
+    Returns:
+        The query rewrite cache.
+    """
+    storage = os.path.abspath(db_storage_path())
+    with _shared_caches_lock:
+        if (storage, persist) not in _shared_caches:
+            _shared_caches[(storage, persist)] = QueryRewriteCache(
+                path=default_query_rewrite_cache_path() if persist else None,
+                max_entries=max_entries,
+            )
+        return _shared_caches[(storage, persist)]
@@ -44,13 +44,15 @@ with warnings.catch_warnings():
     from litellm.litellm_core_utils.get_supported_openai_params import (
         get_supported_openai_params,
     )
-    from litellm.types.utils import ModelResponse
+    from litellm.types.utils import ModelResponse, Usage
     from litellm.utils import supports_response_schema
 
 
 import io
 from typing import TextIO
 
+from crewai.agents.constants import OBSERVATION_MARKER
+from crewai.agents.parser import StreamParser
 from crewai.llms.base_llm import BaseLLM
 from crewai.events.event_bus import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
@@ -451,13 +453,18 @@ class LLM(BaseLLM):
             AccumulatedToolArgs
         )
 
+        # ReAct responses from agents can stop as soon as the action is complete
+        react_parser = StreamParser() if self._is_react_call(from_agent) else None
+
         # --- 2) Make sure stream is set to True and include usage metrics
         params["stream"] = True
         params["stream_options"] = {"include_usage": True}
 
+        stopped_early = False
         try:
             # --- 3) Process each chunk in the stream
-            for chunk in litellm.completion(**params):
+            stream = litellm.completion(**params)
+            for chunk in stream:
                 chunk_count += 1
                 last_chunk = chunk
 
@@ -542,6 +549,20 @@ class LLM(BaseLLM):
                             from_agent=from_agent,
                         ),
                     )
+
+                    if react_parser is not None and react_parser.feed(chunk_content):
+                        stopped_early = True
+                        break
+
+            if react_parser is not None:
+                full_response = react_parser.publish()
+            if stopped_early:
+                # The usage chunk comes last, so it was not received
+                self._close_stream(stream)
+                if not usage_info:
+                    usage_info = self._estimate_usage(
+                        params["messages"], full_response
+                    )
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -697,6 +718,12 @@ class LLM(BaseLLM):
             )
             raise Exception(f"Failed to get streaming response: {str(e)}")
 
+    def _is_react_call(self, from_agent: Optional[Any]) -> bool:
+        """Whether the call comes from an agent loop waiting for an observation."""
+        return from_agent is not None and any(
+            stop.startswith(OBSERVATION_MARKER) for stop in self.stop
+        )
+
     def _handle_streaming_tool_calls(
         self,
         tool_calls: List[ChatCompletionDeltaToolCall],
@@ -742,6 +769,37 @@ class LLM(BaseLLM):
                     continue
         return None
 
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        """Abort a streaming response, closing its connection."""
+        for target in (stream, getattr(stream, "completion_stream", None)):
+            close = getattr(target, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logging.debug(f"Error closing the stream: {e}")
+
+    def _estimate_usage(
+        self, messages: List[Dict[str, str]], response: str
+    ) -> Optional[Usage]:
+        """Count the tokens of a response whose stream was stopped early.
+
+        Cached prompt tokens are only reported by the provider, so they are
+        not part of the estimate.
+        """
+        try:
+            prompt_tokens = litellm.token_counter(model=self.model, messages=messages)
+            completion_tokens = litellm.token_counter(model=self.model, text=response)
+        except Exception as e:
+            logging.debug(f"Error counting the tokens of the response: {e}")
+            return None
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
     def _handle_streaming_callbacks(
         self,
         callbacks: Optional[List[Any]],
@@ -1023,6 +1081,8 @@ class LLM(BaseLLM):
             try:
                 # --- 6) Prepare parameters for the completion call
                 params = self._prepare_completion_params(messages, tools)
+                if self.is_anthropic and getattr(from_agent, "prompt_caching", False):
+                    params["messages"] = self._add_cache_control(params["messages"])
                 # --- 7) Make the completion call and handle response
                 if self.stream:
                     return self._handle_streaming_response(
@@ -1170,6 +1230,42 @@ class LLM(BaseLLM):
 
         return messages
 
+    @staticmethod
+    def _add_cache_control(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Mark the static prefix and the conversation tail as cacheable.
+
+        Anthropic only caches prompt prefixes up to explicit breakpoints. The
+        system message holds the static role, backstory and tool descriptions,
+        and marking the last message lets every agent iteration reuse the
+        conversation cached by the previous one.
+
+        Args:
+            messages: Formatted messages about to be sent to the provider.
+
+        Returns:
+            A copy of the messages with cache control blocks on the breakpoints.
+        """
+        breakpoints = {len(messages) - 1}
+        for index, message in enumerate(messages):
+            if message["role"] == "system":
+                breakpoints.add(index)
+
+        marked = []
+        for index, message in enumerate(messages):
+            if index in breakpoints and isinstance(message["content"], str):
+                message = {
+                    **message,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": message["content"],
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            marked.append(message)
+        return marked
+
     def _get_custom_llm_provider(self) -> Optional[str]:
         """
         Derives the custom_llm_provider from the model string.
@@ -2,10 +2,13 @@ from .entity.entity_memory import EntityMemory
 from .long_term.long_term_memory import LongTermMemory
 from .short_term.short_term_memory import ShortTermMemory
 from .external.external_memory import ExternalMemory
+from .memory import MemoryContext, memory_context
 
 __all__ = [
     "EntityMemory",
     "LongTermMemory",
     "ShortTermMemory",
     "ExternalMemory",
+    "MemoryContext",
+    "memory_context",
 ]
@@ -1,4 +1,7 @@
-from typing import Optional, TYPE_CHECKING
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from crewai.memory import (
     EntityMemory,
@@ -6,6 +9,8 @@ from crewai.memory import (
     LongTermMemory,
     ShortTermMemory,
 )
+from crewai.memory.memory import memory_context
+from crewai.memory.storage.query_embeddings import shared_query_embeddings
 
 if TYPE_CHECKING:
     from crewai.agent import Agent
@@ -21,6 +26,7 @@ class ContextualMemory:
         exm: ExternalMemory,
         agent: Optional["Agent"] = None,
         task: Optional["Task"] = None,
+        timeout: Optional[float] = None,
     ):
         self.stm = stm
         self.ltm = ltm
@@ -28,19 +34,8 @@ class ContextualMemory:
         self.exm = exm
         self.agent = agent
         self.task = task
-
-        if self.stm is not None:
-            self.stm.agent = self.agent
-            self.stm.task = self.task
-        if self.ltm is not None:
-            self.ltm.agent = self.agent
-            self.ltm.task = self.task
-        if self.em is not None:
-            self.em.agent = self.agent
-            self.em.task = self.task
-        if self.exm is not None:
-            self.exm.agent = self.agent
-            self.exm.task = self.task
+        self.timeout = timeout
+        self.retrieval_times_ms: Dict[str, float] = {}
 
     def build_context_for_task(self, task, context) -> str:
         """
@@ -52,13 +47,65 @@ class ContextualMemory:
         if query == "":
             return ""
 
+        fetches: List[Tuple[str, Callable[[str], Optional[str]], str]] = [
+            ("long_term_memory", self._fetch_ltm_context, task.description),
+            ("short_term_memory", self._fetch_stm_context, query),
+            ("entity_memory", self._fetch_entity_context, query),
+            ("external_memory", self._fetch_external_context, query),
+        ]
+        stores = {
+            "long_term_memory": self.ltm,
+            "short_term_memory": self.stm,
+            "entity_memory": self.em,
+            "external_memory": self.exm,
+        }
+        fetches = [fetch for fetch in fetches if stores[fetch[0]] is not None]
+        self.retrieval_times_ms = {}
+        if not fetches:
+            return ""
+
+        # Stores are searched concurrently and embed the shared query once.
+        # Stores that miss the timeout are left out of the context and of
+        # the retrieval times.
+        executor = ThreadPoolExecutor(
+            max_workers=len(fetches), thread_name_prefix="crewai-memory-retrieval"
+        )
+        try:
+            with (
+                memory_context(agent=self.agent, task=self.task),
+                shared_query_embeddings(),
+            ):
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._timed_fetch,
+                        fetch,
+                        argument,
+                    )
+                    for _, fetch, argument in fetches
+                ]
+            done, _ = wait(futures, timeout=self.timeout)
+        finally:
+            executor.shutdown(wait=False)
+
         context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
-        context.append(self._fetch_external_context(query))
+        retrieval_times_ms: Dict[str, float] = {}
+        for (name, _, _), future in zip(fetches, futures):
+            if future in done:
+                result, elapsed_ms = future.result()
+                context.append(result)
+                retrieval_times_ms[name] = elapsed_ms
+        self.retrieval_times_ms = retrieval_times_ms
         return "\n".join(filter(None, context))
 
+    @staticmethod
+    def _timed_fetch(
+        fetch: Callable[[str], Optional[str]], argument: str
+    ) -> Tuple[Optional[str], float]:
+        start_time = time.time()
+        result = fetch(argument)
+        return result, (time.time() - start_time) * 1000
+
     def _fetch_stm_context(self, query) -> str:
         """
         Fetches recent relevant insights from STM related to the task's description and expected_output,
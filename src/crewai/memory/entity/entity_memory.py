@@ -60,6 +60,10 @@ class EntityMemory(Memory):
     ) -> None:
         """Saves one or more entity items into the SQLite storage.
 
+        Entities are keyed on their normalized name and type, so saving an
+        entity again replaces its description. Storages supporting batched
+        writes embed all the entities in a single call.
+
         Args:
             value: Single EntityMemoryItem or list of EntityMemoryItems to save.
             metadata: Optional metadata dict (included for supertype compatibility but not used).
@@ -91,7 +95,13 @@ class EntityMemory(Memory):
         errors = []
 
         try:
-            for item in items:
+            pending = items
+            save_many = getattr(self.storage, "save_many", None)
+            if self._memory_provider != "mem0" and save_many is not None:
+                saved_count, errors = self._upsert(items, save_many)
+                pending = []
+
+            for item in pending:
                 try:
                     if self._memory_provider == "mem0":
                         data = f"""
@@ -150,6 +160,24 @@ class EntityMemory(Memory):
             )
             raise
 
+    def _upsert(
+        self, items: list[EntityMemoryItem], save_many: Any
+    ) -> tuple[int, list[str]]:
+        """Upsert the entities keyed on their stable id in one batched write.
+
+        When an entity appears several times, its last description wins.
+        """
+        latest = {item.entity_id: item for item in items}
+        try:
+            save_many(
+                [f"{i.name}({i.type}): {i.description}" for i in latest.values()],
+                [{**i.metadata, "entity_id": eid} for eid, i in latest.items()],
+                ids=list(latest),
+            )
+        except Exception as e:
+            return 0, [f"{item.name}: {str(e)}" for item in latest.values()]
+        return len(items), []
+
     def search(
         self,
         query: str,
@@ -170,8 +198,12 @@ class EntityMemory(Memory):
 
         start_time = time.time()
         try:
-            results = super().search(
-                query=query, limit=limit, score_threshold=score_threshold
+            # Over-fetch so that results left after deduplication fill the limit
+            results = self._deduplicate(
+                super().search(
+                    query=query, limit=limit * 2, score_threshold=score_threshold
+                ),
+                limit,
             )
 
             crewai_event_bus.emit(
@@ -202,6 +234,21 @@ class EntityMemory(Memory):
             )
             raise
 
+    @staticmethod
+    def _deduplicate(results: list[Any], limit: int) -> list[Any]:
+        """Keep the most relevant result of every entity."""
+        seen = set()
+        unique = []
+        for result in results:
+            metadata = result.get("metadata") or {}
+            key = metadata.get("entity_id") or result.get("context")
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique.append(result)
+        return unique[:limit]
+
     def reset(self) -> None:
         try:
             self.storage.reset()
@@ -1,3 +1,18 @@
+import re
+import uuid
+
+_ENTITY_NAMESPACE = uuid.UUID("5b0a3c4e-8f7d-4e0a-9a43-6d1c2f0e7b91")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def entity_id(name: str, type: str) -> str:
+    """Stable id of an entity, derived from its normalized name and type."""
+    normalized = "|".join(
+        _WHITESPACE.sub(" ", part).strip().casefold() for part in (name, type)
+    )
+    return str(uuid.uuid5(_ENTITY_NAMESPACE, normalized))
+
+
 class EntityMemoryItem:
     def __init__(
         self,
@@ -10,3 +25,4 @@ class EntityMemoryItem:
         self.type = type
         self.description = description
         self.metadata = {"relationships": relationships}
+        self.entity_id = entity_id(name, type)
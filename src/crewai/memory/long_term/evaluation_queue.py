@@ -0,0 +1,169 @@
+import contextvars
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from crewai.utilities.evaluators.task_evaluator import TaskEvaluation, TaskEvaluator
+from crewai.utilities.printer import Printer
+
+_FLUSH = object()
+_STOP = object()
+
+
+@dataclass
+class _PendingEvaluation:
+    agent: Any
+    task: Any
+    output: str
+    on_evaluated: Callable[[TaskEvaluation], None]
+    context: contextvars.Context
+
+
+class LongTermMemoryEvaluationQueue:
+    """Evaluates completed tasks for long-term memory off the critical path.
+
+    Submitted tasks are collected into batches of up to ``batch_size`` tasks,
+    waiting at most ``max_wait_seconds`` for a batch to fill. The tasks of a
+    batch completed by the same agent are evaluated with a single LLM call,
+    and at most ``max_concurrency`` of these calls run at once. Once a task is
+    evaluated, its ``on_evaluated`` callback writes the results back, in a
+    copy of the context the task was submitted from.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 4,
+        max_wait_seconds: float = 1.0,
+        max_concurrency: int = 2,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_concurrency = max_concurrency
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._printer = Printer()
+
+    def submit(
+        self,
+        agent: Any,
+        task: Any,
+        output: str,
+        on_evaluated: Callable[[TaskEvaluation], None],
+    ) -> None:
+        """Queue the evaluation of a task completed by ``agent``."""
+        with self._condition:
+            self._pending += 1
+            self._ensure_worker()
+        self._queue.put(
+            _PendingEvaluation(
+                agent, task, output, on_evaluated, contextvars.copy_context()
+            )
+        )
+
+    def flush(self) -> None:
+        """Evaluate the queued tasks right away and wait for their results."""
+        with self._condition:
+            if self._pending == 0:
+                return
+        self._queue.put(_FLUSH)
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending == 0)
+
+    def close(self) -> None:
+        """Flush pending evaluations and stop the workers."""
+        self.flush()
+        with self._condition:
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+        if thread:
+            self._queue.put(_STOP)
+            thread.join()
+        if executor:
+            executor.shutdown(wait=True)
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted tasks whose results have not been written yet."""
+        return self._pending
+
+    def _ensure_worker(self) -> None:
+        if self._thread:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="crewai-ltm-evaluation",
+        )
+        self._thread = threading.Thread(
+            target=self._collect_batches, name="crewai-ltm-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def _collect_batches(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if item is _FLUSH:
+                continue
+
+            batch: List[_PendingEvaluation] = [item]
+            deadline = time.monotonic() + self.max_wait_seconds
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _FLUSH:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            by_agent: Dict[int, List[_PendingEvaluation]] = {}
+            for pending in batch:
+                by_agent.setdefault(id(pending.agent), []).append(pending)
+            for group in by_agent.values():
+                self._executor.submit(self._evaluate, group)  # type: ignore[union-attr]
+            if stop:
+                return
+
+    def _evaluate(self, group: List[_PendingEvaluation]) -> None:
+        try:
+            evaluations = TaskEvaluator(group[0].agent).evaluate_batch(
+                [(pending.task, pending.output) for pending in group]
+            )
+            for pending, evaluation in zip(group, evaluations):
+                if not isinstance(evaluation, TaskEvaluation):
+                    continue
+                try:
+                    pending.context.run(pending.on_evaluated, evaluation)
+                except Exception as e:
+                    self._printer.print(
+                        content=f"Failed to add to long term memory: {e}",
+                        color="red",
+                    )
+        except Exception as e:
+            self._printer.print(
+                content=f"Failed to evaluate tasks for long term memory: {e}",
+                color="red",
+            )
+        finally:
+            with self._condition:
+                self._pending -= len(group)
+                self._condition.notify_all()
@@ -22,11 +22,16 @@ class LongTermMemory(Memory):
     Inherits from the Memory class and utilizes an instance of a class that
     adheres to the Storage for data storage, specifically working with
     LongTermMemoryItem instances.
+
+    When ``max_entries_per_task`` is set, the default storage only keeps that
+    many of the latest memories of each task.
     """
 
-    def __init__(self, storage=None, path=None):
+    def __init__(self, storage=None, path=None, max_entries_per_task=None):
         if not storage:
-            storage = LTMSQLiteStorage(db_path=path) if path else LTMSQLiteStorage()
+            storage = LTMSQLiteStorage(
+                db_path=path, max_entries_per_task=max_entries_per_task
+            )
         super().__init__(storage=storage)
 
     def save(self, item: LongTermMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
 
@@ -7,6 +10,37 @@ if TYPE_CHECKING:
     from crewai.task import Task
 
 
+@dataclass(frozen=True)
+class MemoryContext:
+    """The agent and task a memory operation is performed on behalf of."""
+
+    agent: Optional["Agent"] = None
+    task: Optional["Task"] = None
+
+
+_current_memory_context: ContextVar[Optional[MemoryContext]] = ContextVar(
+    "crewai_memory_context", default=None
+)
+
+
+@contextmanager
+def memory_context(
+    agent: Optional["Agent"] = None, task: Optional["Task"] = None
+) -> Iterator[MemoryContext]:
+    """Attribute the memory operations run inside the block to an agent and task.
+
+    The context is bound to the current thread or asyncio task (and to threads
+    started with a copy of the current context), so concurrent tasks sharing
+    the crew's memory instances each see their own agent and task.
+    """
+    context = MemoryContext(agent=agent, task=task)
+    token = _current_memory_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_memory_context.reset(token)
+
+
 class Memory(BaseModel):
     """
     Base class for memory, now supporting agent tags and generic metadata.
@@ -24,7 +58,14 @@ class Memory(BaseModel):
 
     @property
     def task(self) -> Optional["Task"]:
-        """Get the current task associated with this memory."""
+        """Get the current task associated with this memory.
+
+        The task of the active ``memory_context`` takes precedence over the
+        one set on the instance.
+        """
+        context = _current_memory_context.get()
+        if context is not None:
+            return context.task
         return self._task
 
     @task.setter
@@ -34,7 +75,14 @@ class Memory(BaseModel):
 
     @property
     def agent(self) -> Optional["Agent"]:
-        """Get the current agent associated with this memory."""
+        """Get the current agent associated with this memory.
+
+        The agent of the active ``memory_context`` takes precedence over the
+        one set on the instance.
+        """
+        context = _current_memory_context.get()
+        if context is not None:
+            return context.agent
         return self._agent
 
     @agent.setter
@@ -0,0 +1,91 @@
+import contextvars
+import functools
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+from crewai.utilities.printer import Printer
+
+
+class MemoryWriter:
+    """Persists memories on background workers, off the agent's critical path.
+
+    Save jobs go through a bounded queue. When the queue is full, ``submit``
+    blocks until a worker frees a slot, so a slow storage backend slows the
+    producing agents down instead of letting pending writes grow without
+    bound. ``flush`` is a barrier that returns once every submitted job has
+    run.
+
+    Workers are started lazily on the first submission and exit on ``close``.
+    """
+
+    def __init__(self, max_queue_size: int = 100, workers: int = 1) -> None:
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer")
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+
+        self.max_queue_size = max_queue_size
+        self.workers = workers
+        self._queue: queue.Queue[Optional[Callable[[], Any]]] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._printer = Printer()
+
+    def submit(self, job: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue ``job(*args, **kwargs)`` to run on a worker.
+
+        The job runs in a copy of the caller's context, so context variables
+        set by the crew are visible to it.
+        """
+        self._ensure_workers()
+        context = contextvars.copy_context()
+        self._queue.put(functools.partial(context.run, job, *args, **kwargs))
+
+    def flush(self) -> None:
+        """Block until every submitted job has been processed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending jobs and stop the workers."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of jobs waiting in the queue."""
+        return self._queue.qsize()
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"crewai-memory-writer-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except Exception as e:
+                self._printer.print(
+                    content=f"Failed to save memory in the background: {e}",
+                    color="red",
+                )
+            finally:
+                self._queue.task_done()
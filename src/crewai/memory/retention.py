@@ -0,0 +1,224 @@
+"""Retention, decay and compaction of stored memories.
+
+Storages that support compaction expose ``apply_retention(policy)``, which
+collects their entries as ``RetentionEntry`` objects, asks
+``select_entries_to_remove`` which ones the policy drops and deletes them.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+SAVED_AT_METADATA_KEY = "crewai_saved_at"
+
+_SECONDS_PER_DAY = 86400.0
+_LSH_TABLES = 8
+_LSH_MAX_BITS = 16
+
+
+class MemoryRetentionPolicy(BaseModel):
+    """How long memories are kept and how stores are compacted."""
+
+    ttl_days: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Memories older than this many days are removed. None keeps memories regardless of age.",
+    )
+    max_entries: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Maximum number of memories kept per store. The memories with the lowest retention score are removed first.",
+    )
+    recency_half_life_days: float = Field(
+        default=30.0,
+        gt=0,
+        description="Number of days after which the retention score of a memory is halved.",
+    )
+    min_retention_score: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Memories whose decayed retention score falls below this value are removed.",
+    )
+    deduplicate: bool = Field(
+        default=True,
+        description="Whether duplicate and near-duplicate memories are merged, keeping the most recent one.",
+    )
+    similarity_threshold: float = Field(
+        default=0.97,
+        ge=0,
+        le=1,
+        description="Cosine similarity above which two memories are considered near-duplicates.",
+    )
+    compaction_interval_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Minimum number of seconds between background compactions run after a kickoff. None disables background compaction.",
+    )
+
+
+@dataclass
+class RetentionEntry:
+    """A stored memory as seen by the retention engine."""
+
+    id: Any
+    saved_at: Optional[float] = None
+    importance: float = 1.0
+    document: Optional[str] = None
+    embedding: Optional[Sequence[float]] = None
+
+
+def importance_from_metadata(metadata: Optional[Dict[str, Any]]) -> float:
+    """Read the importance of a memory from its ``quality`` metadata.
+
+    Qualities on the 0-10 scale used by task evaluations are normalized to
+    0-1. Memories without a quality have an importance of 1.
+    """
+    quality = (metadata or {}).get("quality")
+    if not isinstance(quality, (int, float)):
+        return 1.0
+    return max(0.0, min(1.0, quality / 10 if quality > 1 else quality))
+
+
+def saved_at_from_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Read the save timestamp stamped on a memory by its storage."""
+    saved_at = (metadata or {}).get(SAVED_AT_METADATA_KEY)
+    return float(saved_at) if isinstance(saved_at, (int, float)) else None
+
+
+def retention_score(
+    entry: RetentionEntry, policy: MemoryRetentionPolicy, now: float
+) -> float:
+    """Importance of a memory decayed by its age.
+
+    Memories saved before timestamps were recorded are treated as new.
+    """
+    if entry.saved_at is None:
+        return entry.importance
+    age_days = max(0.0, now - entry.saved_at) / _SECONDS_PER_DAY
+    return entry.importance * 0.5 ** (age_days / policy.recency_half_life_days)
+
+
+def select_entries_to_remove(
+    entries: Sequence[RetentionEntry],
+    policy: MemoryRetentionPolicy,
+    now: Optional[float] = None,
+) -> List[Any]:
+    """Select the ids of the entries the policy removes.
+
+    Entries are removed, in order, when they are past the TTL, when they
+    duplicate a more recent entry, when their retention score is below the
+    minimum, and finally when the store holds more than ``max_entries``.
+    """
+    now = time.time() if now is None else now
+    remaining = list(entries)
+    removed: List[Any] = []
+
+    def drop(keep: List[RetentionEntry]) -> None:
+        kept_ids = {id(entry) for entry in keep}
+        removed.extend(entry.id for entry in remaining if id(entry) not in kept_ids)
+        remaining[:] = keep
+
+    if policy.ttl_days is not None:
+        cutoff = now - policy.ttl_days * _SECONDS_PER_DAY
+        drop([e for e in remaining if e.saved_at is None or e.saved_at >= cutoff])
+
+    if policy.deduplicate:
+        drop(_deduplicate(remaining, policy.similarity_threshold))
+
+    if policy.min_retention_score is not None:
+        drop(
+            [
+                e
+                for e in remaining
+                if retention_score(e, policy, now) >= policy.min_retention_score
+            ]
+        )
+
+    if policy.max_entries is not None and len(remaining) > policy.max_entries:
+        ranked = sorted(
+            remaining, key=lambda e: retention_score(e, policy, now), reverse=True
+        )
+        drop(ranked[: policy.max_entries])
+
+    return removed
+
+
+def _deduplicate(
+    entries: List[RetentionEntry], similarity_threshold: float
+) -> List[RetentionEntry]:
+    """Keep the most recent entry of every group of (near-)duplicates.
+
+    Exact duplicates are found by hashing their documents. Near-duplicates
+    are only compared with the kept entries sharing a bucket with them in one
+    of ``_LSH_TABLES`` random hyperplane hashes of their embeddings, sized so
+    that two entries as similar as ``similarity_threshold`` share a bucket in
+    a table with a probability of at least one half. A rare near-duplicate
+    may therefore be kept.
+    """
+    newest_first = sorted(entries, key=lambda e: e.saved_at or 0.0, reverse=True)
+    seen_documents = set()
+    unique = []
+    for entry in newest_first:
+        if entry.document is None or entry.document not in seen_documents:
+            unique.append(entry)
+        if entry.document is not None:
+            seen_documents.add(entry.document)
+
+    # Embeddings of another dimension than the first one are not compared
+    embeddings = [
+        (entry, np.asarray(entry.embedding, dtype=np.float32).ravel())
+        for entry in unique
+        if entry.embedding is not None
+    ]
+    embeddings = [
+        (entry, vector)
+        for entry, vector in embeddings
+        if vector.size == embeddings[0][1].size
+    ]
+    rows = {id(entry): row for row, (entry, _) in enumerate(embeddings)}
+    if embeddings:
+        vectors = np.stack([vector for _, vector in embeddings])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+        keys = _bucket_keys(vectors, similarity_threshold)
+
+    buckets: List[Dict[int, List[int]]] = [{} for _ in range(_LSH_TABLES)]
+    kept_ids = set()
+    for entry in unique:
+        row = rows.get(id(entry))
+        if row is not None:
+            candidates = {
+                other
+                for table, key in enumerate(keys[row])
+                for other in buckets[table].get(key, ())
+            }
+            if candidates and (
+                float(np.max(vectors[list(candidates)] @ vectors[row]))
+                >= similarity_threshold
+            ):
+                continue
+            for table, key in enumerate(keys[row]):
+                buckets[table].setdefault(key, []).append(row)
+        kept_ids.add(id(entry))
+
+    # Preserve the original order of the surviving entries
+    return [entry for entry in entries if id(entry) in kept_ids]
+
+
+def _bucket_keys(vectors: np.ndarray, similarity_threshold: float) -> List[List[int]]:
+    """Random hyperplane hashes of normalized vectors, one per LSH table."""
+    angle = float(np.arccos(np.clip(similarity_threshold, -1.0, 1.0))) / np.pi
+    bits = (
+        _LSH_MAX_BITS
+        if angle == 0
+        else int(np.clip(np.log(0.5) / np.log1p(-angle), 1, _LSH_MAX_BITS))
+    )
+    planes = np.random.default_rng(0).standard_normal(
+        (vectors.shape[1], _LSH_TABLES * bits)
+    )
+    signs = (vectors @ planes > 0).reshape(len(vectors), _LSH_TABLES, bits)
+    return (signs @ (1 << np.arange(bits))).tolist()
@@ -0,0 +1,399 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from crewai.memory.retention import (
+    MemoryRetentionPolicy,
+    RetentionEntry,
+    importance_from_metadata,
+    select_entries_to_remove,
+)
+from crewai.memory.storage.query_embeddings import (
+    embed_query,
+    embedder_key,
+    is_sharing_query_embeddings,
+)
+from crewai.rag.embeddings.configurator import EmbeddingConfigurator
+from crewai.rag.storage.base_rag_storage import BaseRAGStorage
+from crewai.utilities.search_cache import SearchCache
+
+
+class _VectorRecord:
+    __slots__ = ("id", "document", "metadata", "saved_at")
+
+    def __init__(
+        self,
+        id: str,
+        document: str,
+        metadata: Dict[str, Any],
+        saved_at: Optional[float] = None,
+    ) -> None:
+        self.id = id
+        self.document = document
+        self.metadata = metadata
+        self.saved_at = saved_at
+
+
+class InMemoryVectorStorage(BaseRAGStorage):
+    """
+    In-process vector store for short-lived memories such as short-term and
+    entity memory.
+
+    Embeddings are kept normalized in a contiguous float32 matrix and searched
+    by brute-force cosine similarity, which for the few hundred entries a run
+    produces is faster than an approximate index and needs no database client.
+    When ``path`` is set, every save appends its embeddings and records to
+    files under it, which are memory-mapped back on construction. Replaced
+    entries are appended again and folded when the files are loaded, and the
+    files are only rewritten then and when the retention policy removes
+    entries.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(
+        self,
+        type: str,
+        allow_reset: bool = True,
+        embedder_config: Optional[Dict[str, Any]] = None,
+        crew: Any = None,
+        path: Optional[str] = None,
+    ):
+        super().__init__(type, allow_reset, embedder_config, crew)
+        self.path = path
+        self._lock = threading.RLock()
+        self._records: List[_VectorRecord] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        self._search_cache = SearchCache()
+        self._initialize_app()
+
+    def _initialize_app(self):
+        self._set_embedder_config()
+        if self.path:
+            self._load()
+
+    def _set_embedder_config(self):
+        self._embedder_key = embedder_key(self.embedder_config)
+        self.embedder_config = EmbeddingConfigurator().configure_embedder(
+            self.embedder_config
+        )
+
+    def _sanitize_role(self, role: str) -> str:
+        return role.replace("\n", "").replace(" ", "_").replace("/", "_")
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        return self._size
+
+    def save(self, value: Any, metadata: Dict[str, Any]) -> None:
+        try:
+            self.save_many([value], [metadata])
+        except Exception as e:
+            logging.error(f"Error during {self.type} save: {str(e)}")
+
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Any]:
+        try:
+            return self._search_cache.get_or_search(
+                query,
+                limit,
+                score_threshold,
+                filter,
+                lambda: self._query(query, limit, filter, score_threshold),
+            )
+        except Exception as e:
+            logging.error(f"Error during {self.type} search: {str(e)}")
+            return []
+
+    def _query(
+        self,
+        query: str,
+        limit: int,
+        filter: Optional[dict],
+        score_threshold: float,
+    ) -> List[Any]:
+        with self._lock:
+            matrix = self._matrix
+            records = list(self._records)
+        if not records or matrix is None:
+            return []
+
+        if is_sharing_query_embeddings():
+            query_embedding = embed_query(self._embedder_key, query, self._embed_query)
+        else:
+            query_embedding = self._embed_query(query)
+        scores = matrix[: len(records)] @ self._normalize(query_embedding)
+
+        if filter:
+            mask = np.fromiter(
+                (
+                    all(record.metadata.get(k) == v for k, v in filter.items())
+                    for record in records
+                ),
+                dtype=bool,
+                count=len(records),
+            )
+            scores = np.where(mask, scores, -np.inf)
+
+        limit = min(limit, len(records))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for index in top:
+            score = float(scores[index])
+            if score >= score_threshold:
+                record = records[index]
+                results.append(
+                    {
+                        "id": record.id,
+                        "metadata": record.metadata,
+                        "context": record.document,
+                        "score": score,
+                    }
+                )
+        return results
+
+    def _embed_query(self, query: str) -> Any:
+        return self.embedder_config([query])[0]
+
+    def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
+        self.save_many([text], [metadata])
+
+    def save_many(
+        self,
+        values: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+    ) -> None:
+        """Upsert several entries, embedding them in a single batch.
+
+        Entries saved with an id that is already stored replace it. Errors are
+        raised, so that callers can report the entries that were not saved.
+        """
+        if not values:
+            return
+        vectors = [self._normalize(v) for v in self.embedder_config(list(values))]
+        ids = ids or [str(uuid.uuid4()) for _ in values]
+        saved_at = time.time()
+
+        with self._lock:
+            positions = {record.id: index for index, record in enumerate(self._records)}
+            records = []
+            for entry_id, text, metadata, vector in zip(
+                ids, values, metadatas, vectors
+            ):
+                record = _VectorRecord(entry_id, text, metadata or {}, saved_at)
+                records.append(record)
+                index = positions.get(entry_id)
+                if index is None:
+                    index = self._size
+                    self._ensure_capacity(self._size + 1, vector.shape[0])
+                    self._records.append(record)
+                    self._size += 1
+                    positions[entry_id] = index
+                else:
+                    # Copy a memory-mapped matrix before writing to it
+                    self._ensure_capacity(self._size, vector.shape[0])
+                    self._records[index] = record
+                self._matrix[index] = vector  # type: ignore[index]
+            self._search_cache.invalidate()
+            if self.path:
+                self._append(records, np.stack(vectors))
+
+    def apply_retention(self, policy: MemoryRetentionPolicy) -> int:
+        """Remove the entries dropped by the retention policy.
+
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            entries = [
+                RetentionEntry(
+                    id=index,
+                    saved_at=record.saved_at,
+                    importance=importance_from_metadata(record.metadata),
+                    document=record.document,
+                    embedding=self._matrix[index],  # type: ignore[index]
+                )
+                for index, record in enumerate(self._records)
+            ]
+            removed = set(select_entries_to_remove(entries, policy))
+            if not removed:
+                return 0
+
+            keep = [index for index in range(self._size) if index not in removed]
+            self._records = [self._records[index] for index in keep]
+            self._matrix = (
+                np.ascontiguousarray(self._matrix[keep]) if keep else None  # type: ignore[index]
+            )
+            self._size = len(keep)
+            self._search_cache.invalidate()
+            if self.path:
+                if keep:
+                    self._rewrite()
+                else:
+                    self.reset()
+            return len(removed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._search_cache.invalidate()
+            self._records = []
+            self._matrix = None
+            self._size = 0
+            if self.path:
+                for file_path in (
+                    self._vectors_path,
+                    self._records_path,
+                    self._meta_path,
+                ):
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _ensure_capacity(self, size: int, dimensions: int) -> None:
+        matrix = self._matrix
+        if matrix is not None and matrix.shape[1] != dimensions:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {matrix.shape[1]}, got {dimensions}"
+            )
+        # Memory-mapped matrices are read-only, copy them on the first write
+        if (
+            matrix is not None
+            and size <= matrix.shape[0]
+            and not isinstance(matrix, np.memmap)
+        ):
+            return
+
+        capacity = max(self._INITIAL_CAPACITY, size)
+        if matrix is not None:
+            capacity = max(capacity, matrix.shape[0] * 2)
+        grown = np.empty((capacity, dimensions), dtype=np.float32)
+        if matrix is not None:
+            grown[: self._size] = matrix[: self._size]
+        self._matrix = grown
+
+    @property
+    def _vectors_path(self) -> str:
+        return os.path.join(self.path, f"{self.type}.f32")  # type: ignore[arg-type]
+
+    @property
+    def _records_path(self) -> str:
+        return os.path.join(self.path, f"{self.type}.jsonl")  # type: ignore[arg-type]
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.path, f"{self.type}.meta.json")  # type: ignore[arg-type]
+
+    def _load(self) -> None:
+        paths = (self._vectors_path, self._records_path, self._meta_path)
+        if not all(os.path.exists(file_path) for file_path in paths):
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            dimensions = int(json.load(f)["dimensions"])
+        records = []
+        with open(self._records_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A save interrupted while appending its records
+                    break
+                records.append(
+                    _VectorRecord(
+                        record["id"],
+                        record["document"],
+                        record["metadata"],
+                        record.get("saved_at"),
+                    )
+                )
+        rows = os.path.getsize(self._vectors_path) // (4 * dimensions)
+        count = min(len(records), rows)
+        if not count:
+            return
+        matrix = np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r", shape=(count, dimensions)
+        )
+        records = records[:count]
+
+        positions: Dict[str, int] = {}
+        for row, record in enumerate(records):
+            positions[record.id] = row
+        if len(positions) == count == len(records) == rows:
+            self._records = records
+            self._matrix = matrix
+            self._size = count
+            return
+
+        # Fold the replaced entries into their first position, then compact
+        first: Dict[str, int] = {}
+        for row, record in enumerate(records):
+            first.setdefault(record.id, row)
+        latest = [positions[entry_id] for entry_id in first]
+        self._records = [records[row] for row in latest]
+        self._matrix = np.array(matrix[latest])
+        self._size = len(latest)
+        self._rewrite()
+
+    def _append(self, records: List[_VectorRecord], vectors: np.ndarray) -> None:
+        os.makedirs(self.path, exist_ok=True)  # type: ignore[arg-type]
+        if not os.path.exists(self._meta_path):
+            self._write_meta(vectors.shape[1])
+        # Vectors first: records without their vectors are dropped on load
+        with open(self._vectors_path, "ab") as f:
+            f.write(vectors.astype(np.float32).tobytes())
+        with open(self._records_path, "a", encoding="utf-8") as f:
+            f.write("".join(self._record_line(record) for record in records))
+
+    def _rewrite(self) -> None:
+        os.makedirs(self.path, exist_ok=True)  # type: ignore[arg-type]
+        vectors_tmp = f"{self._vectors_path}.tmp"
+        records_tmp = f"{self._records_path}.tmp"
+        with open(vectors_tmp, "wb") as f:
+            f.write(
+                np.ascontiguousarray(
+                    self._matrix[: self._size], dtype=np.float32  # type: ignore[index]
+                ).tobytes()
+            )
+        with open(records_tmp, "w", encoding="utf-8") as f:
+            f.write("".join(self._record_line(record) for record in self._records))
+        self._write_meta(self._matrix.shape[1])  # type: ignore[union-attr]
+        os.replace(vectors_tmp, self._vectors_path)
+        os.replace(records_tmp, self._records_path)
+
+    def _write_meta(self, dimensions: int) -> None:
+        with open(self._meta_path, "w", encoding="utf-8") as f:
+            json.dump({"dimensions": dimensions}, f)
+
+    @staticmethod
+    def _record_line(record: _VectorRecord) -> str:
+        return (
+            json.dumps(
+                {
+                    "id": record.id,
+                    "document": record.document,
+                    "metadata": record.metadata,
+                    "saved_at": record.saved_at,
+                },
+                default=str,
+            )
+            + "\n"
+        )
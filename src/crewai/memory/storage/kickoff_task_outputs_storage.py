@@ -9,6 +9,7 @@ from crewai.utilities import Printer
 from crewai.utilities.crew_json_encoder import CrewJSONEncoder
 from crewai.utilities.errors import DatabaseError, DatabaseOperationError
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite import SQLiteConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class KickoffTaskOutputsSQLiteStorage:
             db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -37,7 +39,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -52,8 +54,12 @@ class KickoffTaskOutputsSQLiteStorage:
                     )
                 """
                 )
-
-                conn.commit()
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_latest_kickoff_task_outputs_task_index
+                    ON latest_kickoff_task_outputs(task_index)
+                """
+                )
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
             logger.error(error_msg)
@@ -81,8 +87,7 @@ class KickoffTaskOutputsSQLiteStorage:
         """
         inputs = inputs or {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -99,7 +104,6 @@ class KickoffTaskOutputsSQLiteStorage:
                         was_replayed,
                     ),
                 )
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
             logger.error(error_msg)
@@ -124,8 +128,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If updating the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
 
                 fields = []
@@ -142,7 +145,6 @@ class KickoffTaskOutputsSQLiteStorage:
                 values.append(task_index)
 
                 cursor.execute(query, tuple(values))
-                conn.commit()
 
                 if cursor.rowcount == 0:
                     logger.warning(
@@ -165,7 +167,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                 SELECT *
@@ -204,11 +206,9 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If deleting task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM latest_kickoff_task_outputs")
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
             logger.error(error_msg)
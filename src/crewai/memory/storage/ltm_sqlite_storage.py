@@ -3,25 +3,39 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from crewai.memory.retention import (
+    MemoryRetentionPolicy,
+    RetentionEntry,
+    importance_from_metadata,
+    select_entries_to_remove,
+)
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite import SQLiteConnectionPool
 
 
 class LTMSQLiteStorage:
     """
     An updated SQLite storage class for LTM data storage.
+
+    Connections are pooled and run in WAL mode, and lookups by task description
+    go through a composite index matching the ``load`` ordering. When
+    ``max_entries_per_task`` is set, only that many of the latest memories are
+    kept for each task.
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self, db_path: Optional[str] = None, max_entries_per_task: Optional[int] = None
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
         self.db_path = db_path
+        self.max_entries_per_task = max_entries_per_task
         self._printer: Printer = Printer()
         # Ensure parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self):
@@ -29,7 +43,7 @@ class LTMSQLiteStorage:
         Initializes the SQLite database and creates LTM table
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -42,8 +56,12 @@ class LTMSQLiteStorage:
                     )
                 """
                 )
-
-                conn.commit()
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_long_term_memories_task
+                    ON long_term_memories(task_description, datetime DESC, score ASC)
+                """
+                )
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
@@ -58,17 +76,48 @@ class LTMSQLiteStorage:
         score: Union[int, float],
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        self.save_many(
+            [
+                {
+                    "task_description": task_description,
+                    "metadata": metadata,
+                    "datetime": datetime,
+                    "score": score,
+                }
+            ]
+        )
+
+    def save_many(self, memories: List[Dict[str, Any]]) -> None:
+        """Saves several memories to the LTM table in a single transaction.
+
+        Args:
+            memories: Dicts with the ``task_description``, ``metadata``,
+                ``datetime`` and ``score`` of each memory.
+        """
+        if not memories:
+            return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.connection() as conn:
+                conn.executemany(
                     """
                 INSERT INTO long_term_memories (task_description, metadata, datetime, score)
                 VALUES (?, ?, ?, ?)
             """,
-                    (task_description, json.dumps(metadata), datetime, score),
+                    [
+                        (
+                            memory["task_description"],
+                            json.dumps(memory["metadata"]),
+                            memory["datetime"],
+                            memory["score"],
+                        )
+                        for memory in memories
+                    ],
                 )
-                conn.commit()
+                if self.max_entries_per_task is not None:
+                    for task_description in {
+                        memory["task_description"] for memory in memories
+                    }:
+                        self._prune_task(conn, task_description)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
@@ -80,17 +129,17 @@ class LTMSQLiteStorage:
     ) -> Optional[List[Dict[str, Any]]]:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    f"""
+                    """
                     SELECT metadata, datetime, score
                     FROM long_term_memories
                     WHERE task_description = ?
                     ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+                    LIMIT ?
+                """,
+                    (task_description, latest_n),
                 )
                 rows = cursor.fetchall()
                 if rows:
@@ -110,15 +159,87 @@ class LTMSQLiteStorage:
             )
         return None
 
+    def apply_retention(self, policy: MemoryRetentionPolicy) -> int:
+        """Remove the memories dropped by the retention policy.
+
+        Memories are deduplicated on their task description and metadata, and
+        their importance is the quality score they were saved with. Tasks
+        holding more than ``max_entries_per_task`` memories, for instance
+        saved before the limit was set, are cut down to their latest ones.
+
+        Returns:
+            The number of removed memories.
+        """
+        try:
+            with self._pool.connection() as conn:
+                rows = conn.execute(
+                    "SELECT id, task_description, metadata, datetime, score FROM long_term_memories"
+                ).fetchall()
+                entries = [
+                    RetentionEntry(
+                        id=row[0],
+                        saved_at=_parse_timestamp(row[3]),
+                        importance=importance_from_metadata({"quality": row[4]}),
+                        document=f"{row[1]}\n{row[2]}",
+                    )
+                    for row in rows
+                ]
+                ids = select_entries_to_remove(entries, policy)
+                conn.executemany(
+                    "DELETE FROM long_term_memories WHERE id = ?",
+                    [(entry_id,) for entry_id in ids],
+                )
+                removed = len(ids)
+                if self.max_entries_per_task is not None:
+                    removed += self._prune_tasks(conn)
+                return removed
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while compacting LTM: {e}",
+                color="red",
+            )
+        return 0
+
+    def _prune_tasks(self, conn: sqlite3.Connection) -> int:
+        cursor = conn.execute(
+            """
+            DELETE FROM long_term_memories
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY task_description
+                        ORDER BY datetime DESC, score ASC
+                    ) AS position
+                    FROM long_term_memories
+                )
+                WHERE position > ?
+            )
+        """,
+            (self.max_entries_per_task,),
+        )
+        return cursor.rowcount
+
+    def _prune_task(self, conn: sqlite3.Connection, task_description: str) -> None:
+        conn.execute(
+            """
+            DELETE FROM long_term_memories
+            WHERE task_description = ? AND id NOT IN (
+                SELECT id FROM long_term_memories
+                WHERE task_description = ?
+                ORDER BY datetime DESC, score ASC
+                LIMIT ?
+            )
+        """,
+            (task_description, task_description, self.max_entries_per_task),
+        )
+
     def reset(
         self,
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
+            with self._pool.connection() as conn:
+                conn.execute("DELETE FROM long_term_memories")
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -126,3 +247,10 @@ class LTMSQLiteStorage:
                 color="red",
             )
         return None
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,85 @@
+"""Sharing query embeddings between memory stores during a retrieval.
+
+Short-term, entity and external memory are usually configured with the same
+embedder and are all searched with the same query before every task. Inside
+a ``shared_query_embeddings`` scope, storages embed their query through
+``embed_query`` so that each distinct (embedder, query) pair is embedded once,
+even when the stores are searched from several threads.
+"""
+
+import contextvars
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+_CacheKey = Tuple[str, str]
+
+
+class _QueryEmbeddings:
+    def __init__(self) -> None:
+        self._embeddings: Dict[_CacheKey, Any] = {}
+        self._locks: Dict[_CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _CacheKey, embed: Callable[[], Any]) -> Any:
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._embeddings:
+                self._embeddings[key] = embed()
+            return self._embeddings[key]
+
+
+_current: contextvars.ContextVar[Optional[_QueryEmbeddings]] = contextvars.ContextVar(
+    "crewai_shared_query_embeddings", default=None
+)
+
+
+@contextmanager
+def shared_query_embeddings() -> Iterator[None]:
+    """Share query embeddings between all storages searched inside the block.
+
+    Threads started inside the block only see the scope if they run in a copy
+    of the current context (see ``contextvars.copy_context``).
+    """
+    token = _current.set(_QueryEmbeddings())
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def is_sharing_query_embeddings() -> bool:
+    """Whether a ``shared_query_embeddings`` scope is active."""
+    return _current.get() is not None
+
+
+def embedder_key(embedder_config: Any) -> str:
+    """Build a key identifying an embedder configuration.
+
+    Storages configured from equal embedder dicts share the same key, as do
+    storages sharing the same embedding function instance.
+    """
+    if embedder_config is None:
+        return "default"
+    if isinstance(embedder_config, dict):
+        return json.dumps(embedder_config, sort_keys=True, default=str)
+    return f"instance:{id(embedder_config)}"
+
+
+def embed_query(key: str, query: str, embed: Callable[[str], Any]) -> Any:
+    """Embed ``query``, reusing the result within a shared scope.
+
+    Args:
+        key: Identifies the embedder, see ``embedder_key``.
+        query: The text to embed.
+        embed: Embeds a single text.
+
+    Returns:
+        The query embedding.
+    """
+    scope = _current.get()
+    if scope is None:
+        return embed(query)
+    return scope.get((key, query), lambda: embed(query))
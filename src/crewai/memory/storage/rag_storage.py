@@ -1,15 +1,30 @@
 import logging
 import os
 import shutil
+import time
 import uuid
 
 from typing import Any, Dict, List, Optional
 from chromadb.api import ClientAPI
+from crewai.memory.retention import (
+    SAVED_AT_METADATA_KEY,
+    MemoryRetentionPolicy,
+    RetentionEntry,
+    importance_from_metadata,
+    saved_at_from_metadata,
+    select_entries_to_remove,
+)
+from crewai.memory.storage.query_embeddings import (
+    embed_query,
+    embedder_key,
+    is_sharing_query_embeddings,
+)
 from crewai.rag.storage.base_rag_storage import BaseRAGStorage
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
 from crewai.utilities.chromadb import create_persistent_client
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.search_cache import SearchCache
 from crewai.utilities.logger_utils import suppress_logging
 import warnings
 
@@ -36,10 +51,15 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
+        # Shared with the other storages opened on the collection
+        self._search_cache = SearchCache(
+            namespace=os.path.join(path or self.storage_file_name, type)
+        )
         self._initialize_app()
 
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
+        self._embedder_key = embedder_key(self.embedder_config)
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
     def _initialize_app(self):
@@ -104,38 +124,114 @@ class RAGStorage(BaseRAGStorage):
             self._initialize_app()
 
         try:
-            with suppress_logging(
-                "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
-            ):
-                response = self.collection.query(query_texts=query, n_results=limit)
-
-            results = []
-            for i in range(len(response["ids"][0])):
-                result = {
-                    "id": response["ids"][0][i],
-                    "metadata": response["metadatas"][0][i],
-                    "context": response["documents"][0][i],
-                    "score": response["distances"][0][i],
-                }
-                if result["score"] >= score_threshold:
-                    results.append(result)
-
-            return results
+            return self._search_cache.get_or_search(
+                query,
+                limit,
+                score_threshold,
+                filter,
+                lambda: self._query(query, limit, score_threshold),
+            )
         except Exception as e:
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
+    def _query(self, query: str, limit: int, score_threshold: float) -> List[Any]:
+        with suppress_logging(
+            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
+        ):
+            if is_sharing_query_embeddings():
+                query_embedding = embed_query(
+                    self._embedder_key, query, self._embed_query
+                )
+                response = self.collection.query(
+                    query_embeddings=[query_embedding], n_results=limit
+                )
+            else:
+                response = self.collection.query(query_texts=query, n_results=limit)
+
+        results = []
+        for i in range(len(response["ids"][0])):
+            result = {
+                "id": response["ids"][0][i],
+                "metadata": response["metadatas"][0][i],
+                "context": response["documents"][0][i],
+                "score": response["distances"][0][i],
+            }
+            if result["score"] >= score_threshold:
+                results.append(result)
+
+        return results
+
+    def _embed_query(self, query: str) -> Any:
+        return self.embedder_config([query])[0]
+
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
         self.collection.add(
             documents=[text],
-            metadatas=[metadata or {}],
+            metadatas=[{**(metadata or {}), SAVED_AT_METADATA_KEY: time.time()}],
             ids=[str(uuid.uuid4())],
         )
+        self._search_cache.invalidate()
+
+    def save_many(
+        self,
+        values: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+    ) -> None:
+        """Upsert several entries, embedding them in a single batch.
+
+        Entries saved with an id that is already stored replace it. Errors are
+        raised, so that callers can report the entries that were not saved.
+        """
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        saved_at = time.time()
+        try:
+            self.collection.upsert(
+                documents=values,
+                metadatas=[
+                    {**(metadata or {}), SAVED_AT_METADATA_KEY: saved_at}
+                    for metadata in metadatas
+                ],
+                ids=ids or [str(uuid.uuid4()) for _ in values],
+            )
+        finally:
+            self._search_cache.invalidate()
+
+    def apply_retention(self, policy: MemoryRetentionPolicy) -> int:
+        """Remove the entries dropped by the retention policy.
+
+        Returns:
+            The number of removed entries.
+        """
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        stored = self.collection.get(include=["metadatas", "documents", "embeddings"])
+        embeddings = stored.get("embeddings")
+        entries = [
+            RetentionEntry(
+                id=entry_id,
+                saved_at=saved_at_from_metadata(metadata),
+                importance=importance_from_metadata(metadata),
+                document=stored["documents"][i],
+                embedding=embeddings[i] if embeddings is not None else None,
+            )
+            for i, (entry_id, metadata) in enumerate(
+                zip(stored["ids"], stored["metadatas"])
+            )
+        ]
+        ids = select_entries_to_remove(entries, policy)
+        if ids:
+            self.collection.delete(ids=ids)
+            self._search_cache.invalidate()
+        return len(ids)
 
     def reset(self) -> None:
+        self._search_cache.invalidate()
         try:
             if self.app:
                 self.app.reset()
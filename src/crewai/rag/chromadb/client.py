@@ -1,11 +1,14 @@
 """ChromaDB client implementation."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterable
 from typing import Any
 
 from chromadb.api.types import (
     Embeddable,
     EmbeddingFunction as ChromaEmbeddingFunction,
+    Embeddings,
     QueryResult,
 )
 from typing_extensions import Unpack
@@ -14,6 +17,7 @@ from crewai.rag.chromadb.types import (
     ChromaDBClientType,
     ChromaDBCollectionCreateParams,
     ChromaDBCollectionSearchParams,
+    PreparedDocuments,
 )
 from crewai.rag.chromadb.utils import (
     _extract_search_params,
@@ -28,8 +32,17 @@ from crewai.rag.core.base_client import (
     BaseClient,
     BaseCollectionParams,
     BaseCollectionAddParams,
+    BaseCollectionIngestParams,
 )
-from crewai.rag.types import SearchResult
+from crewai.rag.core.ingest import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    aiter_batches,
+    arun_pipeline,
+    emit_progress,
+    iter_batches,
+    run_pipeline,
+)
+from crewai.rag.types import BaseRecord, IngestStats, SearchResult
 
 
 class ChromaDBClient(BaseClient):
@@ -353,6 +366,131 @@ class ChromaDBClient(BaseClient):
             metadatas=prepared.metadatas,
         )
 
+    def ingest(self, **kwargs: Unpack[BaseCollectionIngestParams]) -> IngestStats:
+        """Stream documents into a collection in batches.
+
+        Performs an upsert operation - documents with existing IDs are updated.
+        Each batch is embedded while the previous one is upserted.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable of BaseRecord dicts, consumed lazily.
+            batch_size: Number of documents per batch (default: 256).
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method ingest() requires a ClientAPI. "
+                "Use aingest() for AsyncClientAPI."
+            )
+
+        collection_name = kwargs["collection_name"]
+        documents = kwargs["documents"]
+        if isinstance(documents, AsyncIterable):
+            raise TypeError(
+                "Synchronous method ingest() cannot consume async iterables. "
+                "Use aingest() with an AsyncClientAPI."
+            )
+
+        collection = self.client.get_collection(
+            name=_sanitize_collection_name(collection_name),
+            embedding_function=self.embedding_function,
+        )
+
+        def prepare(batch: list[BaseRecord]) -> tuple[PreparedDocuments, Embeddings]:
+            prepared = _prepare_documents_for_chromadb(batch)
+            return prepared, self.embedding_function(prepared.texts)
+
+        def write(item: tuple[PreparedDocuments, Embeddings], _last: bool) -> None:
+            prepared, embeddings = item
+            collection.upsert(
+                ids=prepared.ids,
+                embeddings=embeddings,
+                documents=prepared.texts,
+                metadatas=prepared.metadatas,
+            )
+
+        return run_pipeline(
+            iter_batches(
+                documents, kwargs.get("batch_size", DEFAULT_INGEST_BATCH_SIZE)
+            ),
+            prepare,
+            write,
+            lambda added: emit_progress(self, "chromadb", collection_name, added),
+        )
+
+    async def aingest(
+        self, **kwargs: Unpack[BaseCollectionIngestParams]
+    ) -> IngestStats:
+        """Stream documents into a collection in batches asynchronously.
+
+        Performs an upsert operation - documents with existing IDs are updated.
+        Each batch is embedded in a worker thread while the previous one is
+        upserted.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable or async iterable of BaseRecord dicts.
+            batch_size: Number of documents per batch (default: 256).
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method aingest() requires an AsyncClientAPI. "
+                "Use ingest() for ClientAPI."
+            )
+
+        collection_name = kwargs["collection_name"]
+        documents = kwargs["documents"]
+
+        collection = await self.client.get_collection(
+            name=_sanitize_collection_name(collection_name),
+            embedding_function=self.embedding_function,
+        )
+
+        async def prepare(
+            batch: list[BaseRecord],
+        ) -> tuple[PreparedDocuments, Embeddings]:
+            prepared = _prepare_documents_for_chromadb(batch)
+            embeddings = await asyncio.to_thread(
+                self.embedding_function, prepared.texts
+            )
+            return prepared, embeddings
+
+        async def write(
+            item: tuple[PreparedDocuments, Embeddings], _last: bool
+        ) -> None:
+            prepared, embeddings = item
+            await collection.upsert(
+                ids=prepared.ids,
+                embeddings=embeddings,
+                documents=prepared.texts,
+                metadatas=prepared.metadatas,
+            )
+
+        return await arun_pipeline(
+            aiter_batches(
+                documents, kwargs.get("batch_size", DEFAULT_INGEST_BATCH_SIZE)
+            ),
+            prepare,
+            write,
+            lambda added: emit_progress(self, "chromadb", collection_name, added),
+        )
+
     def search(
         self, **kwargs: Unpack[ChromaDBCollectionSearchParams]
     ) -> list[SearchResult]:
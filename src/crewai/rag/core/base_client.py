@@ -1,6 +1,7 @@
 """Protocol for vector database client implementations."""
 
 from abc import abstractmethod
+from collections.abc import AsyncIterable, Iterable
 from typing import Any, Protocol, runtime_checkable, Annotated
 from typing_extensions import Unpack, Required, TypedDict
 from pydantic import GetCoreSchemaHandler
@@ -10,6 +11,7 @@ from pydantic_core import CoreSchema, core_schema
 from crewai.rag.types import (
     EmbeddingFunction,
     BaseRecord,
+    IngestStats,
     SearchResult,
 )
 
@@ -42,6 +44,22 @@ class BaseCollectionAddParams(BaseCollectionParams):
     documents: list[BaseRecord]
 
 
+class BaseCollectionIngestParams(BaseCollectionParams, total=False):
+    """Parameters for streaming documents into a collection.
+
+    Extends BaseCollectionParams with the documents to stream.
+
+    Attributes:
+        collection_name: The name of the collection to add documents to.
+        documents: Iterable of BaseRecord dicts, consumed lazily. The async
+            method also accepts async iterables.
+        batch_size: Number of documents embedded and written together.
+    """
+
+    documents: Required[Iterable[BaseRecord] | AsyncIterable[BaseRecord]]
+    batch_size: int
+
+
 class BaseCollectionSearchParams(BaseCollectionParams, total=False):
     """Parameters for searching within a collection.
 
@@ -268,6 +286,59 @@ class BaseClient(Protocol):
         """
         ...
 
+    @abstractmethod
+    def ingest(self, **kwargs: Unpack[BaseCollectionIngestParams]) -> IngestStats:
+        """Stream documents into a collection in batches.
+
+        Unlike add_documents, the documents are consumed lazily, so the number
+        of documents is not bounded by memory. Each batch is embedded while the
+        previous one is being written.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable of BaseRecord dicts, as for add_documents.
+            batch_size: Number of documents embedded and written together.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+
+        Example:
+            >>> from crewai.rag.chromadb.client import ChromaDBClient
+            >>> client = ChromaDBClient()
+            >>>
+            >>> def records():
+            ...     with open("corpus.txt") as f:
+            ...         for line in f:
+            ...             yield {"content": line.strip()}
+            >>>
+            >>> stats = client.ingest(collection_name="my_docs", documents=records())
+        """
+        ...
+
+    @abstractmethod
+    async def aingest(
+        self, **kwargs: Unpack[BaseCollectionIngestParams]
+    ) -> IngestStats:
+        """Stream documents into a collection in batches asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable or async iterable of BaseRecord dicts.
+            batch_size: Number of documents embedded and written together.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+        """
+        ...
+
     @abstractmethod
     def search(
         self, **kwargs: Unpack[BaseCollectionSearchParams]
@@ -0,0 +1,206 @@
+"""Batching and pipelining of bulk ingestions, shared by the RAG clients."""
+
+import asyncio
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.rag_events import RagDocumentsAddProgressEvent
+from crewai.rag.types import BaseRecord, IngestStats
+
+T = TypeVar("T")
+
+DEFAULT_INGEST_BATCH_SIZE = 256
+
+
+def iter_batches(
+    records: Iterable[BaseRecord], batch_size: int
+) -> Iterator[tuple[list[BaseRecord], bool]]:
+    """Group records into batches, flagging the last one.
+
+    Records are consumed lazily: only the batch being yielded and the next one
+    are held in memory.
+
+    Args:
+        records: Records to group.
+        batch_size: Maximum number of records per batch.
+
+    Yields:
+        Each batch, and whether it is the last one.
+    """
+    batch_size = max(batch_size, 1)
+    iterator = iter(records)
+    batch = _take(iterator, batch_size)
+    while batch:
+        following = _take(iterator, batch_size)
+        yield batch, not following
+        batch = following
+
+
+async def aiter_batches(
+    records: Iterable[BaseRecord] | AsyncIterable[BaseRecord], batch_size: int
+) -> AsyncIterator[tuple[list[BaseRecord], bool]]:
+    """Group sync or async records into batches, flagging the last one.
+
+    Args:
+        records: Records to group.
+        batch_size: Maximum number of records per batch.
+
+    Yields:
+        Each batch, and whether it is the last one.
+    """
+    if not isinstance(records, AsyncIterable):
+        for batch, last in iter_batches(records, batch_size):
+            yield batch, last
+        return
+
+    batch_size = max(batch_size, 1)
+    batch: list[BaseRecord] = []
+    async for record in records:
+        if len(batch) == batch_size:
+            yield batch, False
+            batch = []
+        batch.append(record)
+    if batch:
+        yield batch, True
+
+
+def run_pipeline(
+    batches: Iterable[tuple[list[BaseRecord], bool]],
+    prepare: Callable[[list[BaseRecord]], T],
+    write: Callable[[T, bool], Any],
+    on_written: Callable[[int], None] | None = None,
+    concurrent_writes: bool = True,
+) -> IngestStats:
+    """Prepare each batch while the previous one is being written.
+
+    Args:
+        batches: Batches to ingest, with whether each is the last one.
+        prepare: Turns a batch into what ``write`` takes, such as embeddings.
+        write: Writes a prepared batch, given whether it is the last one.
+        on_written: Called with the number of documents written so far.
+        concurrent_writes: Whether writes run in a background thread. Without
+            it, batches are prepared and written one after the other.
+
+    Returns:
+        The statistics of the ingestion.
+    """
+    stats = IngestStats(documents=0, batches=0, seconds=0.0)
+    started = time.perf_counter()
+
+    def written(size: int) -> None:
+        stats["documents"] += size
+        stats["batches"] += 1
+        if on_written:
+            on_written(stats["documents"])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: tuple[Future[Any], int] | None = None
+        for batch, last in batches:
+            prepared = prepare(batch)
+            if pending is not None:
+                pending[0].result()
+                written(pending[1])
+                pending = None
+            if concurrent_writes:
+                pending = (executor.submit(write, prepared, last), len(batch))
+            else:
+                write(prepared, last)
+                written(len(batch))
+        if pending is not None:
+            pending[0].result()
+            written(pending[1])
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+async def arun_pipeline(
+    batches: AsyncIterable[tuple[list[BaseRecord], bool]],
+    prepare: Callable[[list[BaseRecord]], Awaitable[T]],
+    write: Callable[[T, bool], Awaitable[Any]],
+    on_written: Callable[[int], None] | None = None,
+) -> IngestStats:
+    """Prepare each batch while the previous one is being written, asynchronously.
+
+    Args:
+        batches: Batches to ingest, with whether each is the last one.
+        prepare: Turns a batch into what ``write`` takes, such as embeddings.
+        write: Writes a prepared batch, given whether it is the last one.
+        on_written: Called with the number of documents written so far.
+
+    Returns:
+        The statistics of the ingestion.
+    """
+    stats = IngestStats(documents=0, batches=0, seconds=0.0)
+    started = time.perf_counter()
+
+    async def written(pending: tuple[asyncio.Future[Any], int]) -> None:
+        await pending[0]
+        stats["documents"] += pending[1]
+        stats["batches"] += 1
+        if on_written:
+            on_written(stats["documents"])
+
+    pending: tuple[asyncio.Future[Any], int] | None = None
+    try:
+        async for batch, last in batches:
+            prepared = await prepare(batch)
+            if pending is not None:
+                await written(pending)
+                pending = None
+            pending = (asyncio.ensure_future(write(prepared, last)), len(batch))
+        if pending is not None:
+            await written(pending)
+            pending = None
+    finally:
+        if pending is not None:
+            pending[0].cancel()
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def emit_progress(
+    source: Any,
+    provider: str,
+    collection_name: str,
+    added: int,
+    total: int | None = None,
+) -> None:
+    """Emit the progress of adding documents to a collection.
+
+    Args:
+        source: Client adding the documents.
+        provider: Vector store provider, such as ``qdrant``.
+        collection_name: Name of the collection the documents are added to.
+        added: Number of documents written so far.
+        total: Number of documents to add, None if unknown.
+    """
+    crewai_event_bus.emit(
+        source,
+        event=RagDocumentsAddProgressEvent(
+            provider=provider,
+            collection_name=collection_name,
+            added=added,
+            total=total,
+        ),
+    )
+
+
+def _take(iterator: Iterator[BaseRecord], size: int) -> list[BaseRecord]:
+    batch = []
+    for record in iterator:
+        batch.append(record)
+        if len(batch) == size:
+            break
+    return batch
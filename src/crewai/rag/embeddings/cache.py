@@ -0,0 +1,268 @@
+"""Caching of embeddings across memory, knowledge and RAG clients.
+
+Embeddings are keyed on the embedder (provider, model and dimensions) and on
+the SHA-256 of the embedded text, so re-ingesting unchanged documents and
+re-running identical queries reuse the stored vectors instead of calling the
+provider again.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite import LRUStore
+
+_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings stored as compact float blobs.
+
+    Vectors are kept in memory, or in a SQLite database when ``path`` is set so
+    they survive across runs and processes, see ``LRUStore``. The least
+    recently used vectors are evicted beyond ``max_entries``. Storing
+    ``float16`` vectors halves the size of the cache at the cost of some
+    precision.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 100_000,
+        dtype: str = "float32",
+        touch_interval: float = 60.0,
+    ) -> None:
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be one of: {', '.join(_DTYPES)}")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.dtype = dtype
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._store = LRUStore(
+            "embeddings",
+            path=path,
+            max_entries=max_entries,
+            touch_interval=touch_interval,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the looked up texts that were found in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        """Build the cache key of ``text`` embedded by the ``namespace`` embedder."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{namespace}:{digest}"
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up the vectors stored under ``keys``, None for the missing ones."""
+        try:
+            blobs = self._store.get_many([self._stored_key(key) for key in keys])
+        except sqlite3.Error as e:
+            logging.error(f"Error reading the embedding cache: {e}")
+            blobs = [None] * len(keys)
+
+        vectors = [
+            None if blob is None else np.frombuffer(blob, dtype=_DTYPES[self.dtype])
+            for blob in blobs
+        ]
+        hits = sum(vector is not None for vector in vectors)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Any]) -> None:
+        """Store the vectors under their keys, evicting the least recently used."""
+        items = [
+            (
+                self._stored_key(key),
+                np.asarray(vector, dtype=_DTYPES[self.dtype]).ravel().tobytes(),
+            )
+            for key, vector in zip(keys, vectors)
+        ]
+        try:
+            self._store.put_many(items)
+        except sqlite3.Error as e:
+            logging.error(f"Error writing to the embedding cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached vectors and reset the metrics."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+        try:
+            self._store.clear()
+        except sqlite3.Error as e:
+            logging.error(f"Error clearing the embedding cache: {e}")
+
+    def _stored_key(self, key: str) -> str:
+        # Vectors stored with another dtype are not read back
+        return f"{self.dtype}:{key}"
+
+
+_shared_caches: Dict[str, EmbeddingCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def default_embedding_cache_path() -> str:
+    """Path of the embedding cache shared by the crews of the project."""
+    return os.path.join(db_storage_path(), "embedding_cache.db")
+
+
+def get_embedding_cache(
+    path: Optional[str] = None,
+    max_entries: int = 100_000,
+    dtype: str = "float32",
+) -> EmbeddingCache:
+    """Return the cache stored at ``path``, shared by everything that uses it.
+
+    Args:
+        path: SQLite database of the cache. Defaults to
+            ``default_embedding_cache_path()``.
+        max_entries: Maximum number of cached vectors, used when the cache is
+            first opened.
+        dtype: ``float32`` or ``float16``, used when the cache is first opened.
+
+    Returns:
+        The embedding cache.
+    """
+    path = os.path.abspath(path or default_embedding_cache_path())
+    with _shared_caches_lock:
+        if path not in _shared_caches:
+            _shared_caches[path] = EmbeddingCache(
+                path=path, max_entries=max_entries, dtype=dtype
+            )
+        return _shared_caches[path]
+
+
+def embedder_namespace(
+    embedding_function: Any, embedder_config: Optional[Dict[str, Any]] = None
+) -> str:
+    """Identify the provider, model and dimensions of an embedder.
+
+    Vectors cached under different namespaces are never mixed up, so changing
+    the model or the dimensions of an embedder starts from an empty cache.
+    """
+    if embedder_config and embedder_config.get("provider") != "custom":
+        config = embedder_config.get("config", {})
+        provider = embedder_config.get("provider")
+        model = config.get("model") or config.get("model_name")
+        dimensions = config.get("dimensions")
+    else:
+        provider = type(embedding_function).__qualname__
+        model = getattr(embedding_function, "model_name", None) or getattr(
+            embedding_function, "_model_name", None
+        )
+        dimensions = getattr(embedding_function, "dimensions", None) or getattr(
+            embedding_function, "_dimensions", None
+        )
+    return f"{provider}|{model or ''}|{dimensions or ''}"
+
+
+def embed_with_cache(
+    cache: EmbeddingCache,
+    namespace: str,
+    texts: Sequence[str],
+    embed: Callable[[List[str]], Sequence[Any]],
+) -> List[np.ndarray]:
+    """Embed ``texts``, calling ``embed`` once for the texts not in the cache.
+
+    Duplicate texts are only embedded once.
+    """
+    keys = [cache.key(namespace, text) for text in texts]
+    vectors = cache.get_many(keys)
+
+    missing: Dict[str, str] = {}
+    for key, text, vector in zip(keys, texts, vectors):
+        if vector is None:
+            missing.setdefault(key, text)
+    if missing:
+        embedded = [
+            np.asarray(vector, dtype=np.float32).ravel()
+            for vector in embed(list(missing.values()))
+        ]
+        cache.put_many(list(missing), embedded)
+        by_key = dict(zip(missing, embedded))
+        vectors = [
+            by_key[key] if vector is None else vector
+            for key, vector in zip(keys, vectors)
+        ]
+    return [np.asarray(vector, dtype=np.float32) for vector in vectors]  # type: ignore[misc]
+
+
+class CachedEmbeddingFunction(EmbeddingFunction):
+    """Wraps a ChromaDB embedding function with an ``EmbeddingCache``.
+
+    Used for memory and knowledge storages through the ``cache`` key of the
+    embedder configuration, and directly with the ChromaDB client.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        cache: Optional[EmbeddingCache] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.cache = cache or get_embedding_cache()
+        self.namespace = namespace or embedder_namespace(embedding_function)
+
+    def __call__(self, input: Documents) -> Embeddings:
+        vectors = embed_with_cache(
+            self.cache, self.namespace, list(input), self.embedding_function
+        )
+        return [vector.tolist() for vector in vectors]
+
+
+class CachedTextEmbeddingFunction:
+    """Wraps a single-text embedding function, such as the Qdrant client's.
+
+    ``embed_batch`` embeds the texts missing from the cache with one call to
+    the ``embed_batch`` method of the wrapped function when it has one, so the
+    Qdrant client still embeds documents in batches.
+    """
+
+    def __init__(
+        self,
+        embedding_function: Callable[[str], Any],
+        cache: Optional[EmbeddingCache] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.cache = cache or get_embedding_cache()
+        self.namespace = namespace or embedder_namespace(embedding_function)
+
+    def __call__(self, text: str) -> List[float]:
+        (vector,) = embed_with_cache(
+            self.cache,
+            self.namespace,
+            [text],
+            lambda texts: [self.embedding_function(t) for t in texts],
+        )
+        return vector.tolist()
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        vectors = embed_with_cache(
+            self.cache, self.namespace, list(texts), self._embed_missing
+        )
+        return [vector.tolist() for vector in vectors]
+
+    def _embed_missing(self, texts: List[str]) -> Sequence[Any]:
+        embed_batch = getattr(type(self.embedding_function), "embed_batch", None)
+        if callable(embed_batch):
+            return self.embedding_function.embed_batch(texts)  # type: ignore[attr-defined]
+        return [self.embedding_function(text) for text in texts]
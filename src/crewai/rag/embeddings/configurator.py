@@ -25,10 +25,36 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        When the config has a ``cache`` key, the embedding function is wrapped
+        with an embedding cache shared by every storage using the same cache:
+        ``True`` uses the project's default cache, while a dict sets its
+        ``path``, ``max_entries`` and ``dtype``.
+        """
         if embedder_config is None:
             return self._create_default_embedding_function()
 
+        cache_config = embedder_config.get("cache")
+        if cache_config:
+            from crewai.rag.embeddings.cache import (
+                CachedEmbeddingFunction,
+                embedder_namespace,
+                get_embedding_cache,
+            )
+
+            embedding_function = self.configure_embedder(
+                {k: v for k, v in embedder_config.items() if k != "cache"}
+            )
+            cache = get_embedding_cache(
+                **(cache_config if isinstance(cache_config, dict) else {})
+            )
+            return CachedEmbeddingFunction(
+                embedding_function,
+                cache=cache,
+                namespace=embedder_namespace(embedding_function, embedder_config),
+            )
+
         provider = embedder_config.get("provider")
         config = embedder_config.get("config", {})
         model_name = config.get("model") if provider != "custom" else None
@@ -1,15 +1,26 @@
 """Qdrant client implementation."""
 
+from collections.abc import AsyncIterable, Iterable
 from typing import Any, cast
 
+from qdrant_client import AsyncQdrantClient, QdrantClient as SyncQdrantClient
+from qdrant_client.models import PointStruct
 from typing_extensions import Unpack
 
 from crewai.rag.core.base_client import (
     BaseClient,
     BaseCollectionParams,
     BaseCollectionAddParams,
+    BaseCollectionIngestParams,
     BaseCollectionSearchParams,
 )
+from crewai.rag.core.ingest import (
+    aiter_batches,
+    arun_pipeline,
+    emit_progress,
+    iter_batches,
+    run_pipeline,
+)
 from crewai.rag.core.exceptions import ClientMethodMismatchError
 from crewai.rag.qdrant.types import (
     AsyncEmbeddingFunction,
@@ -18,6 +29,8 @@ from crewai.rag.qdrant.types import (
     QdrantCollectionCreateParams,
 )
 from crewai.rag.qdrant.utils import (
+    _aembed_texts,
+    _embed_texts,
     _is_async_client,
     _is_async_embedding_function,
     _is_sync_client,
@@ -26,7 +39,7 @@ from crewai.rag.qdrant.utils import (
     _prepare_search_params,
     _process_search_results,
 )
-from crewai.rag.types import SearchResult
+from crewai.rag.types import BaseRecord, IngestStats, SearchResult
 
 
 class QdrantClient(BaseClient):
@@ -35,24 +48,38 @@ class QdrantClient(BaseClient):
     Provides vector database operations for Qdrant, supporting both
     synchronous and asynchronous clients.
 
+    Documents are added in batches: each batch is embedded with a single
+    request when the embedding function has an ``embed_batch`` method, and
+    upserted without waiting for Qdrant to apply it, except for the last one.
+
     Attributes:
         client: Qdrant client instance (QdrantClient or AsyncQdrantClient).
         embedding_function: Function to generate embeddings for documents.
+        batch_size: Number of documents embedded and upserted together.
+        embedding_concurrency: Maximum number of concurrent requests of async
+            embedding functions without batch support.
     """
 
     def __init__(
         self,
         client: QdrantClientType,
         embedding_function: EmbeddingFunction | AsyncEmbeddingFunction,
+        batch_size: int = 256,
+        embedding_concurrency: int = 8,
     ) -> None:
         """Initialize QdrantClient with client and embedding function.
 
         Args:
             client: Pre-configured Qdrant client instance.
             embedding_function: Embedding function for text to vector conversion.
+            batch_size: Number of documents embedded and upserted together.
+            embedding_concurrency: Maximum number of concurrent requests of async
+                embedding functions without batch support.
         """
         self.client = client
         self.embedding_function = embedding_function
+        self.batch_size = batch_size
+        self.embedding_concurrency = embedding_concurrency
 
     def create_collection(self, **kwargs: Unpack[QdrantCollectionCreateParams]) -> None:
         """Create a new collection in Qdrant.
@@ -248,19 +275,9 @@ class QdrantClient(BaseClient):
         if not self.client.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
-        points = []
-        for doc in documents:
-            if _is_async_embedding_function(self.embedding_function):
-                raise TypeError(
-                    "Async embedding function cannot be used with sync add_documents. "
-                    "Use aadd_documents instead."
-                )
-            sync_fn = cast(EmbeddingFunction, self.embedding_function)
-            embedding = sync_fn(doc["content"])
-            point = _create_point_from_document(doc, embedding)
-            points.append(point)
-
-        self.client.upsert(collection_name=collection_name, points=points)
+        self._upsert_batches(
+            collection_name, iter_batches(documents, self.batch_size), len(documents)
+        )
 
     async def aadd_documents(self, **kwargs: Unpack[BaseCollectionAddParams]) -> None:
         """Add documents with their embeddings to a collection asynchronously.
@@ -290,18 +307,92 @@ class QdrantClient(BaseClient):
         if not await self.client.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
-        points = []
-        for doc in documents:
-            if _is_async_embedding_function(self.embedding_function):
-                async_fn = cast(AsyncEmbeddingFunction, self.embedding_function)
-                embedding = await async_fn(doc["content"])
-            else:
-                sync_fn = cast(EmbeddingFunction, self.embedding_function)
-                embedding = sync_fn(doc["content"])
-            point = _create_point_from_document(doc, embedding)
-            points.append(point)
+        await self._aupsert_batches(
+            collection_name, aiter_batches(documents, self.batch_size), len(documents)
+        )
+
+    def ingest(self, **kwargs: Unpack[BaseCollectionIngestParams]) -> IngestStats:
+        """Stream documents into a collection in batches.
+
+        Each batch is embedded while the previous one is upserted, without
+        waiting for Qdrant to apply it except for the last batch.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable of BaseRecord dicts, consumed lazily.
+            batch_size: Number of documents per batch. Defaults to the
+                client's batch_size.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_sync_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="ingest",
+                expected_client="QdrantClient",
+                alt_method="aingest",
+                alt_client="AsyncQdrantClient",
+            )
+
+        collection_name = kwargs["collection_name"]
+        documents = kwargs["documents"]
+        if isinstance(documents, AsyncIterable):
+            raise TypeError(
+                "Async iterables cannot be used with sync ingest. "
+                "Use aingest instead."
+            )
+
+        if not self.client.collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        return self._upsert_batches(
+            collection_name,
+            iter_batches(documents, kwargs.get("batch_size", self.batch_size)),
+        )
+
+    async def aingest(
+        self, **kwargs: Unpack[BaseCollectionIngestParams]
+    ) -> IngestStats:
+        """Stream documents into a collection in batches asynchronously.
+
+        Each batch is embedded while the previous one is upserted, without
+        waiting for Qdrant to apply it except for the last batch.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: Iterable or async iterable of BaseRecord dicts.
+            batch_size: Number of documents per batch. Defaults to the
+                client's batch_size.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_async_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="aingest",
+                expected_client="AsyncQdrantClient",
+                alt_method="ingest",
+                alt_client="QdrantClient",
+            )
 
-        await self.client.upsert(collection_name=collection_name, points=points)
+        collection_name = kwargs["collection_name"]
+        documents = kwargs["documents"]
+
+        if not await self.client.collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        return await self._aupsert_batches(
+            collection_name,
+            aiter_batches(documents, kwargs.get("batch_size", self.batch_size)),
+        )
 
     def search(
         self, **kwargs: Unpack[BaseCollectionSearchParams]
@@ -499,3 +590,92 @@ class QdrantClient(BaseClient):
 
         for collection in collections_response.collections:
             await self.client.delete_collection(collection_name=collection.name)
+
+    def _upsert_batches(
+        self,
+        collection_name: str,
+        batches: Iterable[tuple[list[BaseRecord], bool]],
+        total: int | None = None,
+    ) -> IngestStats:
+        """Embed and upsert batches of documents with the sync client.
+
+        Args:
+            collection_name: Name of the collection to upsert into.
+            batches: Batches of documents, with whether each is the last one.
+            total: Number of documents, None if unknown.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+        """
+        if _is_async_embedding_function(self.embedding_function):
+            raise TypeError(
+                "Async embedding function cannot be used with sync add_documents "
+                "or ingest. Use aadd_documents or aingest instead."
+            )
+        sync_fn = cast(EmbeddingFunction, self.embedding_function)
+        client = cast(SyncQdrantClient, self.client)
+
+        def prepare(batch: list[BaseRecord]) -> list[PointStruct]:
+            embeddings = _embed_texts(sync_fn, [doc["content"] for doc in batch])
+            return [
+                _create_point_from_document(doc, embedding)
+                for doc, embedding in zip(batch, embeddings)
+            ]
+
+        def write(points: list[PointStruct], last: bool) -> None:
+            # Qdrant applies the updates in order, so waiting for the last one
+            # waits for all of them
+            client.upsert(collection_name=collection_name, points=points, wait=last)
+
+        # Upserts that do not wait return right away, and local clients
+        # cannot be shared with a background thread
+        return run_pipeline(
+            batches,
+            prepare,
+            write,
+            lambda added: emit_progress(self, "qdrant", collection_name, added, total),
+            concurrent_writes=False,
+        )
+
+    async def _aupsert_batches(
+        self,
+        collection_name: str,
+        batches: AsyncIterable[tuple[list[BaseRecord], bool]],
+        total: int | None = None,
+    ) -> IngestStats:
+        """Embed and upsert batches of documents with the async client.
+
+        The next batch is embedded while the previous one is upserted.
+
+        Args:
+            collection_name: Name of the collection to upsert into.
+            batches: Batches of documents, with whether each is the last one.
+            total: Number of documents, None if unknown.
+
+        Returns:
+            IngestStats with the number of documents and batches written.
+        """
+        client = cast(AsyncQdrantClient, self.client)
+
+        async def prepare(batch: list[BaseRecord]) -> list[PointStruct]:
+            embeddings = await _aembed_texts(
+                self.embedding_function,
+                [doc["content"] for doc in batch],
+                self.embedding_concurrency,
+            )
+            return [
+                _create_point_from_document(doc, embedding)
+                for doc, embedding in zip(batch, embeddings)
+            ]
+
+        async def write(points: list[PointStruct], last: bool) -> None:
+            await client.upsert(
+                collection_name=collection_name, points=points, wait=last
+            )
+
+        return await arun_pipeline(
+            batches,
+            prepare,
+            write,
+            lambda added: emit_progress(self, "qdrant", collection_name, added, total),
+        )
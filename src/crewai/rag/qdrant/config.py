@@ -18,17 +18,15 @@ def _default_options() -> QdrantClientParams:
     return QdrantClientParams(path=DEFAULT_STORAGE_PATH)
 
 
-def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
-    """Create default Qdrant embedding function.
+class _FastEmbedFunction:
+    """Embeds texts with a fastembed model, one by one or in batches."""
 
-    Returns:
-        Default embedding function using fastembed with all-MiniLM-L6-v2.
-    """
-    from fastembed import TextEmbedding
+    def __init__(self, model_name: str) -> None:
+        from fastembed import TextEmbedding
 
-    model = TextEmbedding(model_name=DEFAULT_EMBEDDING_MODEL)
+        self.model = TextEmbedding(model_name=model_name)
 
-    def embed_fn(text: str) -> list[float]:
+    def __call__(self, text: str) -> list[float]:
         """Embed a single text string.
 
         Args:
@@ -37,10 +35,30 @@ def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
         Returns:
             Embedding vector as list of floats.
         """
-        embeddings = list(model.embed([text]))
-        return embeddings[0].tolist() if embeddings else []
+        embeddings = self.embed_batch([text])
+        return embeddings[0] if embeddings else []
 
-    return cast(QdrantEmbeddingFunctionWrapper, embed_fn)
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts in a single pass of the model.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Embedding vectors as lists of floats, in the order of the texts.
+        """
+        return [embedding.tolist() for embedding in self.model.embed(texts)]
+
+
+def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
+    """Create default Qdrant embedding function.
+
+    Returns:
+        Default embedding function using fastembed with all-MiniLM-L6-v2.
+    """
+    return cast(
+        QdrantEmbeddingFunctionWrapper, _FastEmbedFunction(DEFAULT_EMBEDDING_MODEL)
+    )
 
 
 @pyd_dataclass(frozen=True)
@@ -52,3 +70,5 @@ class QdrantConfig(BaseRagConfig):
     embedding_function: QdrantEmbeddingFunctionWrapper = field(
         default_factory=_default_embedding_function
     )
+    batch_size: int = 256
+    embedding_concurrency: int = 8
@@ -17,5 +17,8 @@ def create_client(config: QdrantConfig) -> QdrantClient:
 
     qdrant_client = SyncQdrantClientBase(**config.options)
     return QdrantClient(
-        client=qdrant_client, embedding_function=config.embedding_function
+        client=qdrant_client,
+        embedding_function=config.embedding_function,
+        batch_size=config.batch_size,
+        embedding_concurrency=config.embedding_concurrency,
     )
@@ -55,6 +55,21 @@ class EmbeddingFunction(Protocol):
         ...
 
 
+class BatchEmbeddingFunction(EmbeddingFunction, Protocol):
+    """Protocol for embedding functions that can also embed texts in batches."""
+
+    def embed_batch(self, texts: list[str]) -> list[QueryEmbedding]:
+        """Convert texts to embedding vectors in a single request.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            Embedding vectors, in the order of the texts.
+        """
+        ...
+
+
 class QdrantEmbeddingFunctionWrapper(EmbeddingFunction):
     """Base class for Qdrant EmbeddingFunction to work with Pydantic validation."""
 
@@ -85,6 +100,21 @@ class AsyncEmbeddingFunction(Protocol):
         ...
 
 
+class AsyncBatchEmbeddingFunction(AsyncEmbeddingFunction, Protocol):
+    """Protocol for async embedding functions that can also embed texts in batches."""
+
+    async def embed_batch(self, texts: list[str]) -> list[QueryEmbedding]:
+        """Convert texts to embedding vectors in a single request asynchronously.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            Embedding vectors, in the order of the texts.
+        """
+        ...
+
+
 class QdrantClientParams(TypedDict, total=False):
     """Parameters for QdrantClient initialization.
 
@@ -1,7 +1,8 @@
 """Utility functions for Qdrant operations."""
 
 import asyncio
-from typing import TypeGuard
+import inspect
+from typing import TypeGuard, cast
 from uuid import uuid4
 
 from qdrant_client import AsyncQdrantClient, QdrantClient as SyncQdrantClient
@@ -15,7 +16,9 @@ from qdrant_client.models import (
 
 from crewai.rag.qdrant.constants import DEFAULT_VECTOR_PARAMS
 from crewai.rag.qdrant.types import (
+    AsyncBatchEmbeddingFunction,
     AsyncEmbeddingFunction,
+    BatchEmbeddingFunction,
     CreateCollectionParams,
     EmbeddingFunction,
     FilterCondition,
@@ -71,13 +74,87 @@ def _is_async_embedding_function(
 ) -> TypeGuard[AsyncEmbeddingFunction]:
     """Type guard to check if the embedding function is async.
 
+    Callable instances are async when their ``__call__`` method is.
+
     Args:
         func: The embedding function to check.
 
     Returns:
         True if the function is async, False otherwise.
     """
-    return asyncio.iscoroutinefunction(func)
+    return asyncio.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def _supports_batch_embedding(
+    func: EmbeddingFunction | AsyncEmbeddingFunction,
+) -> bool:
+    """Check if the embedding function embeds batches of texts with ``embed_batch``.
+
+    The method is looked up on the class, so that mocks and plain functions
+    are embedded text by text.
+
+    Args:
+        func: The embedding function to check.
+
+    Returns:
+        True if the function has an ``embed_batch`` method, False otherwise.
+    """
+    return callable(getattr(type(func), "embed_batch", None))
+
+
+def _embed_texts(func: EmbeddingFunction, texts: list[str]) -> list[QueryEmbedding]:
+    """Embed texts with a single request if the function supports batches.
+
+    Args:
+        func: Sync embedding function.
+        texts: Texts to embed.
+
+    Returns:
+        Embedding vectors, in the order of the texts.
+    """
+    if _supports_batch_embedding(func):
+        if inspect.iscoroutinefunction(type(func).embed_batch):
+            raise TypeError(
+                "Async embed_batch cannot be used with sync add_documents or "
+                "ingest. Use aadd_documents or aingest instead."
+            )
+        return list(cast(BatchEmbeddingFunction, func).embed_batch(texts))
+    return [func(text) for text in texts]
+
+
+async def _aembed_texts(
+    func: EmbeddingFunction | AsyncEmbeddingFunction,
+    texts: list[str],
+    concurrency: int,
+) -> list[QueryEmbedding]:
+    """Embed texts asynchronously, in a single request if supported.
+
+    Async functions without batch support embed up to ``concurrency`` texts
+    at the same time.
+
+    Args:
+        func: Sync or async embedding function.
+        texts: Texts to embed.
+        concurrency: Maximum number of concurrent embedding requests.
+
+    Returns:
+        Embedding vectors, in the order of the texts.
+    """
+    if _supports_batch_embedding(func):
+        embeddings = cast(AsyncBatchEmbeddingFunction, func).embed_batch(texts)
+        return list(await embeddings if inspect.isawaitable(embeddings) else embeddings)
+    if not _is_async_embedding_function(func):
+        return [cast(EmbeddingFunction, func)(text) for text in texts]
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def embed(text: str) -> QueryEmbedding:
+        async with semaphore:
+            return await func(text)
+
+    return list(await asyncio.gather(*(embed(text) for text in texts)))
 
 
 def _get_collection_params(
@@ -48,3 +48,17 @@ class SearchResult(TypedDict):
     content: str
     metadata: dict[str, Any]
     score: float
+
+
+class IngestStats(TypedDict):
+    """Statistics of a bulk ingestion into a vector store.
+
+    Attributes:
+        documents: Number of documents written.
+        batches: Number of batches the documents were written in.
+        seconds: Time taken by the ingestion.
+    """
+
+    documents: int
+    batches: int
+    seconds: float
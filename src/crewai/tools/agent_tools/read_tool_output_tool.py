@@ -0,0 +1,53 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from crewai.tools.base_tool import BaseTool
+from crewai.tools.tool_output import ToolOutputStore
+from crewai.utilities import I18N
+
+i18n = I18N()
+
+
+class ReadToolOutputToolSchema(BaseModel):
+    output_id: str = Field(..., description="The id of the stored tool output")
+    page: int = Field(default=2, description="The page of the output to read")
+
+
+class ReadToolOutputTool(BaseTool):
+    """Tool for paging through tool outputs that were too large to show inline"""
+
+    name: str = Field(default_factory=lambda: i18n.tools("read_tool_output")["name"])  # type: ignore
+    description: str = Field(default_factory=lambda: i18n.tools("read_tool_output")["description"])  # type: ignore
+    args_schema: type[BaseModel] = ReadToolOutputToolSchema
+    store: ToolOutputStore = Field(
+        description="Store holding the tool outputs that overflowed",
+        exclude=True,
+    )
+
+    def _run(
+        self,
+        output_id: str,
+        page: Optional[int] = 2,
+        **kwargs,
+    ) -> str:
+        if page is None:
+            page = 1
+        total_pages = self.store.page_count(output_id)
+        if page < 1 and total_pages:
+            return i18n.errors("tool_output_invalid_page").format(
+                output_id=output_id, page=page, total_pages=total_pages
+            )
+        content = self.store.read(output_id, page)
+        if content is None:
+            return i18n.errors("tool_output_not_found").format(
+                output_id=output_id, page=page, total_pages=total_pages
+            )
+        if page < total_pages:
+            content += i18n.slice("tool_output_truncated").format(
+                output_id=output_id,
+                page=page,
+                total_pages=total_pages,
+                next_page=page + 1,
+            )
+        return content
@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
-from inspect import signature
-from typing import Any, Callable, Type, get_args, get_origin, Optional, List
+from inspect import iscoroutine, signature
+from typing import Any, Callable, Dict, Type, get_args, get_origin, Optional, List
 
 from pydantic import (
     BaseModel,
@@ -88,13 +88,47 @@ class BaseTool(BaseModel, ABC):
         result = self._run(*args, **kwargs)
 
         # If _run is async, we safely run it
-        if asyncio.iscoroutine(result):
+        if iscoroutine(result):
             result = asyncio.run(result)
 
         self.current_usage_count += 1
 
         return result
 
+    def run_batch(self, args_list: List[Dict[str, Any]]) -> List[Any]:
+        """Run the tool once for each argument set in ``args_list``.
+
+        Returns one result per argument set, in the same order.
+        """
+        print(f"Using Tool: {self.name} (batch of {len(args_list)})")
+        results = self._run_batch(args_list)
+
+        if iscoroutine(results):
+            results = asyncio.run(results)
+
+        self.current_usage_count += len(args_list)
+
+        return results
+
+    def _run_batch(self, args_list: List[Dict[str, Any]]) -> List[Any]:
+        """Run the tool over several argument sets.
+
+        Override this to amortize connection setup or use a vectorized backend.
+        The default implementation calls ``_run`` once per argument set.
+        """
+        results = []
+        for args in args_list:
+            result = self._run(**args)
+            if iscoroutine(result):
+                result = asyncio.run(result)
+            results.append(result)
+        return results
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the tool overrides ``_run_batch`` with a native batch implementation."""
+        return type(self)._run_batch is not BaseTool._run_batch
+
     def reset_usage_count(self) -> None:
         """Reset the current usage count to zero."""
         self.current_usage_count = 0
@@ -118,6 +152,7 @@ class BaseTool(BaseModel, ABC):
             result_as_answer=self.result_as_answer,
             max_usage_count=self.max_usage_count,
             current_usage_count=self.current_usage_count,
+            batch_func=self._run_batch if self.supports_batch else None,
         )
         structured_tool._original_tool = self
         return structured_tool
@@ -190,6 +225,8 @@ class BaseTool(BaseModel, ABC):
         }
 
         self.description = f"Tool Name: {self.name}\nTool Arguments: {args_schema}\nTool Description: {self.description}"
+        if self.supports_batch:
+            self.description += "\nTool Batching: pass a list of argument objects as the input to run this tool on several inputs in a single call."
 
     @staticmethod
     def _get_arg_annotations(annotation: type[Any] | None) -> str:
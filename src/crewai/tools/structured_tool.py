@@ -40,6 +40,7 @@ class CrewStructuredTool:
         result_as_answer: bool = False,
         max_usage_count: int | None = None,
         current_usage_count: int = 0,
+        batch_func: Optional[Callable[[list[dict]], Any]] = None,
     ) -> None:
         """Initialize the structured tool.
 
@@ -51,6 +52,7 @@ class CrewStructuredTool:
             result_as_answer: Whether to return the output directly
             max_usage_count: Maximum number of times this tool can be used. None means unlimited usage.
             current_usage_count: Current number of times this tool has been used.
+            batch_func: Optional function running the tool over a list of argument sets at once.
         """
         self.name = name
         self.description = description
@@ -60,6 +62,7 @@ class CrewStructuredTool:
         self.result_as_answer = result_as_answer
         self.max_usage_count = max_usage_count
         self.current_usage_count = current_usage_count
+        self.batch_func = batch_func
         self._original_tool = None
 
         # Validate the function signature matches the schema
@@ -284,11 +287,52 @@ class CrewStructuredTool:
 
         result = self.func(**parsed_args, **kwargs)
 
-        if asyncio.iscoroutine(result):
+        if inspect.iscoroutine(result):
             return asyncio.run(result)
 
         return result
 
+    def invoke_batch(self, inputs: list[Union[str, dict]]) -> list[Any]:
+        """Execute the tool once per input, in a single batch call when supported.
+
+        Args:
+            inputs: The input arguments for each call
+
+        Returns:
+            One result per input, in the same order
+        """
+        parsed_inputs = [self._parse_args(input) for input in inputs]
+
+        if (
+            self.max_usage_count is not None
+            and self.current_usage_count + len(parsed_inputs) > self.max_usage_count
+        ):
+            raise ToolUsageLimitExceeded(
+                f"Tool '{self.name}' can only be used {self.max_usage_count - self.current_usage_count} more time(s), but a batch of {len(parsed_inputs)} was requested."
+            )
+
+        for _ in parsed_inputs:
+            self._increment_usage_count()
+
+        if self.batch_func is None:
+            results = []
+            for parsed_args in parsed_inputs:
+                result = self.func(**parsed_args)
+                if inspect.iscoroutine(result):
+                    result = asyncio.run(result)
+                results.append(result)
+            return results
+
+        results = self.batch_func(parsed_inputs)
+        if inspect.iscoroutine(results):
+            results = asyncio.run(results)
+
+        if len(results) != len(parsed_inputs):
+            raise ValueError(
+                f"Tool '{self.name}' returned {len(results)} results for a batch of {len(parsed_inputs)} inputs."
+            )
+        return list(results)
+
     def has_reached_max_usage_count(self) -> bool:
         """Check if the tool has reached its maximum usage count."""
         return (
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from pydantic import BaseModel as PydanticBaseModel
@@ -10,6 +10,10 @@ class ToolCalling(BaseModel):
     arguments: Optional[Dict[str, Any]] = Field(
         ..., description="A dictionary of arguments to be passed to the tool."
     )
+    batch_arguments: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="A list of argument dictionaries when the tool is called on several inputs at once.",
+    )
 
 
 class InstructorToolCalling(PydanticBaseModel):
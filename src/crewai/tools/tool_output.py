@@ -0,0 +1,155 @@
+"""Size-bounded handling of tool outputs.
+
+Tool results are appended verbatim to the agent conversation and re-sent on
+every following LLM call. This module caps the inline size of a tool output
+and keeps the overflow in an addressable side store that the agent can page
+through with the read tool output tool.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any, Optional
+
+CHARS_PER_TOKEN = 4
+"""Rough number of characters per token used to turn token budgets into slices."""
+
+
+def consume_tool_output(
+    result: Any, max_chars: Optional[int] = None, note: str = ""
+) -> Any:
+    """Materialize generator or iterator tool outputs into a single string.
+
+    Tools may stream their output by returning an iterator of chunks. Any
+    other result is returned unchanged.
+
+    Args:
+        result: The raw value returned by the tool.
+        max_chars: Number of characters after which the iterator is no longer
+            read and is closed. None reads it to the end.
+        note: Template appended to an output cut at ``max_chars``. It is
+            formatted with ``max_chars``.
+
+    Returns:
+        The joined chunks if the result was an iterator, otherwise the result.
+    """
+    if not isinstance(result, Iterator):
+        return result
+    if max_chars is None:
+        return "".join(str(chunk) for chunk in result)
+
+    chunks = []
+    size = 0
+    for chunk in result:
+        chunks.append(str(chunk))
+        size += len(chunks[-1])
+        if size > max_chars:
+            close = getattr(result, "close", None)
+            if callable(close):
+                close()
+            return "".join(chunks)[:max_chars] + note.format(max_chars=max_chars)
+    return "".join(chunks)
+
+
+class ToolOutputStore:
+    """In-memory store holding tool outputs that exceeded the inline budget.
+
+    Outputs are addressed by a short content hash, so storing the same output
+    twice (e.g. when it comes back from the tool cache) reuses the same id.
+    Each stored output is split into pages of ``page_tokens`` tokens, the
+    first of which is what the agent sees inline.
+
+    At most ``max_outputs`` outputs totalling ``max_chars`` characters are
+    kept: the least recently stored or read outputs are evicted first, and
+    the most recent output is always kept.
+    """
+
+    def __init__(
+        self, page_tokens: int, max_outputs: int = 32, max_chars: int = 8_000_000
+    ) -> None:
+        self.page_tokens = page_tokens
+        self.max_outputs = max_outputs
+        self.max_chars = max_chars
+        self._outputs: OrderedDict[str, str] = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    @property
+    def page_size(self) -> int:
+        return max(self.page_tokens * CHARS_PER_TOKEN, 1)
+
+    @property
+    def max_output_chars(self) -> int:
+        """Number of characters of a streamed output that are worth reading."""
+        return max(self.page_size + 1, self.max_chars)
+
+    def add(self, output: str) -> str:
+        """Store an output and return its id."""
+        output_id = hashlib.sha256(output.encode("utf-8")).hexdigest()[:12]
+        with self._lock:
+            if output_id in self._outputs:
+                self._outputs.move_to_end(output_id)
+                return output_id
+            self._outputs[output_id] = output
+            self._chars += len(output)
+            while len(self._outputs) > 1 and (
+                len(self._outputs) > self.max_outputs or self._chars > self.max_chars
+            ):
+                _, evicted = self._outputs.popitem(last=False)
+                self._chars -= len(evicted)
+        return output_id
+
+    def page_count(self, output_id: str) -> int:
+        output = self._get(output_id)
+        if output is None:
+            return 0
+        return self._page_count(output)
+
+    def read(self, output_id: str, page: int = 1) -> Optional[str]:
+        """Return a 1-indexed page of a stored output, or None if not found."""
+        output = self._get(output_id)
+        if output is None or page < 1 or page > self._page_count(output):
+            return None
+        start = (page - 1) * self.page_size
+        return output[start : start + self.page_size]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._outputs.clear()
+            self._chars = 0
+
+    def _get(self, output_id: str) -> Optional[str]:
+        with self._lock:
+            output = self._outputs.get(output_id)
+            if output is not None:
+                self._outputs.move_to_end(output_id)
+            return output
+
+    def _page_count(self, output: str) -> int:
+        return max(-(-len(output) // self.page_size), 1)
+
+
+def bound_tool_output(output: str, store: ToolOutputStore, note: str) -> str:
+    """Cap an output at one page of ``store``, keeping the full text for paging.
+
+    Args:
+        output: The stringified tool output.
+        store: Store receiving the full output when it overflows. Its page size
+            is the inline token budget.
+        note: Template appended to the truncated output. It is formatted with
+            ``output_id``, ``page``, ``total_pages`` and ``next_page``.
+
+    Returns:
+        The output itself if it fits, otherwise its first page followed by the note.
+    """
+    if len(output) <= store.page_size:
+        return output
+
+    output_id = store.add(output)
+    return f"{store.read(output_id, 1)}" + note.format(
+        output_id=output_id,
+        page=1,
+        total_pages=store.page_count(output_id),
+        next_page=2,
+    )
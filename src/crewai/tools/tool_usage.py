@@ -15,6 +15,7 @@ from crewai.task import Task
 from crewai.telemetry import Telemetry
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from crewai.tools.tool_output import bound_tool_output, consume_tool_output
 from crewai.utilities import I18N, Converter, Printer
 from crewai.utilities.agent_utils import (
     get_tool_names,
@@ -187,7 +188,10 @@ class ToolUsage:
         from_cache = False
         result = None  # type: ignore
 
-        if self.tools_handler and self.tools_handler.cache:
+        # Batch calls are cached per element, in _invoke_batch
+        batch_arguments = getattr(calling, "batch_arguments", None)
+        is_batch = batch_arguments is not None
+        if self.tools_handler and self.tools_handler.cache and not is_batch:
             result = self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )  # type: ignore
@@ -202,7 +206,8 @@ class ToolUsage:
             None,
         )
 
-        usage_limit_error = self._check_usage_limit(available_tool, tool.name)
+        uses = len(batch_arguments) if batch_arguments is not None else 1
+        usage_limit_error = self._check_usage_limit(available_tool, tool.name, uses)
         if usage_limit_error:
             try:
                 result = usage_limit_error
@@ -225,7 +230,11 @@ class ToolUsage:
                     if self.task:
                         self.task.increment_delegations(coworker)
 
-                if calling.arguments:
+                if is_batch:
+                    result = self._invoke_batch(
+                        tool=tool, calling=calling, available_tool=available_tool
+                    )
+                elif calling.arguments:
                     try:
                         acceptable_args = tool.args_schema.model_json_schema()[
                             "properties"
@@ -270,9 +279,11 @@ class ToolUsage:
                     self.task.increment_tools_errors()
                 return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
+            result = self._consume_output(result)
+
             if self.tools_handler:
-                should_cache = True
-                if (
+                should_cache = not is_batch
+                if should_cache and (
                     hasattr(available_tool, "cache_function")
                     and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
                 ):
@@ -288,6 +299,8 @@ class ToolUsage:
             tool_name=tool.name,
             attempts=self._run_attempts,
         )
+        if not getattr(available_tool, "result_as_answer", False):
+            result = self._bound_result(result=result, tool_name=tool.name)
         result = self._format_result(result=result)  # type: ignore # "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
         data = {
             "result": result,
@@ -314,7 +327,7 @@ class ToolUsage:
             self.agent.tools_results.append(data)
 
         if available_tool and hasattr(available_tool, "current_usage_count"):
-            available_tool.current_usage_count += 1
+            available_tool.current_usage_count += uses
             if (
                 hasattr(available_tool, "max_usage_count")
                 and available_tool.max_usage_count is not None
@@ -326,6 +339,69 @@ class ToolUsage:
 
         return result
 
+    def _invoke_batch(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        available_tool: Any,
+    ) -> str:
+        """Run a tool over several argument sets in one call.
+
+        The cache is checked for each argument set and only the misses are
+        passed to the tool, in a single ``invoke_batch`` call.
+        """
+        batch_arguments: List[Dict[str, Any]] = getattr(calling, "batch_arguments", [])
+        cache = self.tools_handler.cache if self.tools_handler else None
+        results: List[Any] = [None] * len(batch_arguments)
+        misses: List[int] = []
+
+        for index, arguments in enumerate(batch_arguments):
+            cached = (
+                cache.read(tool=calling.tool_name, input=arguments) if cache else None
+            )
+            if cached is None:
+                misses.append(index)
+            else:
+                results[index] = cached
+
+        if misses:
+            acceptable_args = tool.args_schema.model_json_schema()["properties"].keys()
+            inputs = [
+                self._add_fingerprint_metadata(
+                    {
+                        k: v
+                        for k, v in batch_arguments[index].items()
+                        if k in acceptable_args
+                    }
+                )
+                for index in misses
+            ]
+            outputs = tool.invoke_batch(inputs)  # type: ignore[arg-type]
+
+            for index, output in zip(misses, outputs):
+                output = self._consume_output(output)
+                results[index] = output
+                should_cache = True
+                if getattr(available_tool, "cache_function", None):
+                    should_cache = available_tool.cache_function(
+                        batch_arguments[index], output
+                    )
+                if cache and should_cache:
+                    cache.add(
+                        tool=calling.tool_name,
+                        input=batch_arguments[index],
+                        output=output,
+                    )
+
+        return "\n\n".join(
+            self._i18n.slice("batch_tool_result").format(
+                index=index + 1,
+                arguments=json.dumps(arguments, default=str),
+                result=result,
+            )
+            for index, (arguments, result) in enumerate(zip(batch_arguments, results))
+        )
+
     def _format_result(self, result: Any) -> str:
         if self.task:
             self.task.used_tools += 1
@@ -333,6 +409,33 @@ class ToolUsage:
             result = self._remember_format(result=result)
         return str(result)
 
+    def _consume_output(self, result: Any) -> Any:
+        """Join a streamed tool result, reading no more than the agent keeps."""
+        store = getattr(self.agent, "_tool_output_store", None)
+        return consume_tool_output(
+            result,
+            max_chars=store.max_output_chars if store else None,
+            note=self._i18n.errors("tool_output_stream_truncated"),
+        )
+
+    def _bound_result(self, result: Any, tool_name: str) -> Any:
+        """Cap the inline size of a tool result if the agent sets a token budget.
+
+        The overflow is kept in the agent's tool output store and can be read
+        page by page with the read tool output tool.
+        """
+        store = getattr(self.agent, "_tool_output_store", None)
+        if store is None or tool_name in (
+            self._i18n.tools("read_tool_output")["name"],  # type: ignore
+            self._i18n.tools("add_image")["name"],  # type: ignore
+        ):
+            return result
+        return bound_tool_output(
+            output=str(result),
+            store=store,
+            note=self._i18n.slice("tool_output_truncated"),
+        )
+
     def _should_remember_format(self) -> bool:
         if self.task:
             return self.task.used_tools % self._remember_format_after_usages == 0
@@ -356,22 +459,26 @@ class ToolUsage:
             )
         return False
 
-    def _check_usage_limit(self, tool: Any, tool_name: str) -> str | None:
+    def _check_usage_limit(
+        self, tool: Any, tool_name: str, uses: int = 1
+    ) -> str | None:
         """Check if tool has reached its usage limit.
 
         Args:
             tool: The tool to check
             tool_name: The name of the tool (used for error message)
+            uses: The number of uses the call needs, one per batch element
 
         Returns:
             Error message if limit reached, None otherwise
         """
-        if (
-            hasattr(tool, "max_usage_count")
-            and tool.max_usage_count is not None
-            and tool.current_usage_count >= tool.max_usage_count
-        ):
+        if not hasattr(tool, "max_usage_count") or tool.max_usage_count is None:
+            return None
+        if tool.current_usage_count >= tool.max_usage_count:
             return f"Tool '{tool_name}' has reached its usage limit of {tool.max_usage_count} times and cannot be used anymore."
+        if tool.current_usage_count + uses > tool.max_usage_count:
+            remaining = tool.max_usage_count - tool.current_usage_count
+            return f"Tool '{tool_name}' can only be used {remaining} more times before reaching its usage limit of {tool.max_usage_count}, but the batch has {uses} inputs."
         return None
 
     def _select_tool(self, tool_name: str) -> Any:
@@ -473,7 +580,7 @@ class ToolUsage:
                     f"{self._i18n.errors('tool_arguments_error')}"
                 )
 
-        if not isinstance(arguments, dict):
+        if not isinstance(arguments, (dict, list)):
             if raise_error:
                 raise
             else:
@@ -481,6 +588,13 @@ class ToolUsage:
                     f"{self._i18n.errors('tool_arguments_error')}"
                 )
 
+        if isinstance(arguments, list):
+            return ToolCalling(
+                tool_name=tool.name,
+                arguments={"batch": arguments},
+                batch_arguments=arguments,
+            )
+
         return ToolCalling(
             tool_name=tool.name,
             arguments=arguments,
@@ -510,7 +624,20 @@ class ToolUsage:
                 )
             return self._tool_calling(tool_string)
 
-    def _validate_tool_input(self, tool_input: Optional[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _is_valid_tool_input(arguments: Any) -> bool:
+        """Check for a dictionary of arguments or a batch of them."""
+        if isinstance(arguments, dict):
+            return True
+        return (
+            isinstance(arguments, list)
+            and len(arguments) > 0
+            and all(isinstance(item, dict) for item in arguments)
+        )
+
+    def _validate_tool_input(
+        self, tool_input: Optional[str]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         if tool_input is None:
             return {}
 
@@ -522,7 +649,7 @@ class ToolUsage:
         # Attempt 1: Parse as JSON
         try:
             arguments = json.loads(tool_input)
-            if isinstance(arguments, dict):
+            if self._is_valid_tool_input(arguments):
                 return arguments
         except (JSONDecodeError, TypeError):
             pass  # Continue to the next parsing attempt
@@ -530,7 +657,7 @@ class ToolUsage:
         # Attempt 2: Parse as Python literal
         try:
             arguments = ast.literal_eval(tool_input)
-            if isinstance(arguments, dict):
+            if self._is_valid_tool_input(arguments):
                 return arguments
         except (ValueError, SyntaxError):
             repaired_input = repair_json(tool_input)
@@ -539,7 +666,7 @@ class ToolUsage:
         # Attempt 3: Parse as JSON5
         try:
             arguments = json5.loads(tool_input)
-            if isinstance(arguments, dict):
+            if self._is_valid_tool_input(arguments):
                 return arguments
         except (JSONDecodeError, ValueError, TypeError):
             pass  # Continue to the next parsing attempt
@@ -551,7 +678,7 @@ class ToolUsage:
                 content=f"Repaired JSON: {repaired_input}", color="blue"
             )
             arguments = json.loads(repaired_input)
-            if isinstance(arguments, dict):
+            if self._is_valid_tool_input(arguments):
                 return arguments
         except Exception as e:
             error = f"Failed to repair JSON: {e}"
@@ -1,5 +1,6 @@
 import json
 import re
+from functools import lru_cache
 from typing import Any, Optional, Type, Union, get_args, get_origin
 
 from pydantic import BaseModel, ValidationError
@@ -253,6 +254,7 @@ def create_converter(
     return converter
 
 
+@lru_cache(maxsize=128)
 def generate_model_description(model: Type[BaseModel]) -> str:
     """
     Generate a string description of a Pydantic model's fields and their types.
@@ -261,6 +263,9 @@ def generate_model_description(model: Type[BaseModel]) -> str:
     the model's fields and their respective types. The description includes handling
     of complex types such as `Optional`, `List`, and `Dict`, as well as nested Pydantic
     models.
+
+    Descriptions are memoized per model class, so repeated tasks with the same
+    output model reuse the exact same string.
     """
 
     def describe_field(field_type):
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Sequence, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -28,6 +28,12 @@ class TaskEvaluation(BaseModel):
     )
 
 
+class TaskEvaluations(BaseModel):
+    evaluations: List[TaskEvaluation] = Field(
+        description="One evaluation per task, in the order the tasks were given."
+    )
+
+
 class TrainingTaskEvaluation(BaseModel):
     suggestions: List[str] = Field(
         description="List of clear, actionable instructions derived from the Human Feedbacks to enhance the Agent's performance. Analyze the differences between Initial Outputs and Improved Outputs to generate specific action items for future tasks. Ensure all key and specific points from the human feedback are incorporated into these instructions."
@@ -75,6 +81,65 @@ class TaskEvaluator:
 
         return converter.to_pydantic()
 
+    def evaluate_batch(
+        self, tasks_and_outputs: Sequence[Tuple[Any, str]]
+    ) -> List[TaskEvaluation]:
+        """
+        Evaluate several completed tasks with a single LLM call.
+
+        Falls back to evaluating the tasks one by one when the batched answer
+        cannot be parsed or does not hold one evaluation per task.
+
+        Parameters:
+            - tasks_and_outputs: The tasks and their outputs, in order.
+        """
+        if len(tasks_and_outputs) == 1:
+            task, output = tasks_and_outputs[0]
+            return [self.evaluate(task, output)]
+
+        for task, _ in tasks_and_outputs:
+            crewai_event_bus.emit(
+                self, TaskEvaluationEvent(evaluation_type="task_evaluation", task=task)
+            )
+        tasks_text = "".join(
+            f"Task {index}:\n"
+            f"Task Description:\n{task.description}\n\n"
+            f"Expected Output:\n{task.expected_output}\n\n"
+            f"Actual Output:\n{output}\n\n"
+            for index, (task, output) in enumerate(tasks_and_outputs, start=1)
+        )
+        evaluation_query = (
+            f"Assess the quality of each of the following {len(tasks_and_outputs)} completed tasks based on its description, expected output, and actual results.\n\n"
+            f"{tasks_text}"
+            "For each task, in order, please provide:\n"
+            "- Bullet points suggestions to improve future similar tasks\n"
+            "- A score from 0 to 10 evaluating on completion, quality, and overall performance"
+            "- Entities extracted from the task output, if any, their type, description, and relationships"
+        )
+
+        instructions = "Convert all responses into valid JSON output."
+
+        if not self.llm.supports_function_calling():
+            model_schema = PydanticSchemaParser(model=TaskEvaluations).get_schema()
+            instructions = f"{instructions}\n\nReturn only valid JSON with the following schema:\n```json\n{model_schema}\n```"
+
+        converter = Converter(
+            llm=self.llm,
+            text=evaluation_query,
+            model=TaskEvaluations,
+            instructions=instructions,
+        )
+
+        try:
+            result = converter.to_pydantic()
+        except Exception:
+            result = None
+        if isinstance(result, TaskEvaluations) and len(result.evaluations) == len(
+            tasks_and_outputs
+        ):
+            return result.evaluations
+        return [self.evaluate(task, output) for task, output in tasks_and_outputs]
+
     def evaluate_training_data(
         self, training_data: dict, agent_id: str
     ) -> TrainingTaskEvaluation:
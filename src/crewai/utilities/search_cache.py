@@ -0,0 +1,120 @@
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# Versions of the stores shared by several caches, such as the storages of
+# an agent and of its crew opened on the same collection
+_shared_versions: Dict[str, int] = {}
+_shared_versions_lock = threading.Lock()
+
+
+class SearchCache:
+    """Memoizes the search results of a store until the store is written to.
+
+    Results are keyed on the search arguments and on the store version, which
+    ``invalidate`` bumps on every write, so a repeated search within a run is
+    answered without re-embedding the query or querying the vector database.
+    Caches created with the same ``namespace``, such as the path of a
+    collection, share its version, so a write through any of them invalidates
+    all of them. Writes made to the same store by another process are not
+    detected.
+    """
+
+    def __init__(self, maxsize: int = 128, namespace: Optional[str] = None) -> None:
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self._version = 0
+        self._entries_version = 0
+        self._entries: OrderedDict[Hashable, List[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Number of writes the cache has been invalidated for."""
+        if self.namespace is None:
+            return self._version
+        with _shared_versions_lock:
+            return _shared_versions.get(self.namespace, 0)
+
+    def invalidate(self) -> None:
+        """Drop the cached results after the store was written to."""
+        with self._lock:
+            if self.namespace is None:
+                self._version += 1
+            else:
+                with _shared_versions_lock:
+                    _shared_versions[self.namespace] = (
+                        _shared_versions.get(self.namespace, 0) + 1
+                    )
+            self._entries.clear()
+
+    def contains(
+        self,
+        query: Any,
+        limit: int,
+        score_threshold: float,
+        filter: Optional[dict],
+    ) -> bool:
+        """Whether results for these arguments are cached."""
+        with self._lock:
+            version = self._current_version()
+            return (
+                self._key(version, query, limit, score_threshold, filter)
+                in self._entries
+            )
+
+    def get_or_search(
+        self,
+        query: Any,
+        limit: int,
+        score_threshold: float,
+        filter: Optional[dict],
+        search: Callable[[], List[Any]],
+    ) -> List[Any]:
+        """Return the cached results for these arguments or run ``search``.
+
+        Results are only cached when ``search`` returns, and callers get a copy
+        they are free to modify.
+        """
+        with self._lock:
+            version = self._current_version()
+            key = self._key(version, query, limit, score_threshold, filter)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(self._entries[key])
+
+        results = search()
+
+        with self._lock:
+            # Skip results computed while the store was being written to
+            if version == self._current_version():
+                self._entries[key] = copy.deepcopy(results)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return results
+
+    def _current_version(self) -> int:
+        """The store version, dropping the entries cached for older ones."""
+        version = self.version
+        if version != self._entries_version:
+            self._entries.clear()
+            self._entries_version = version
+        return version
+
+    @staticmethod
+    def _key(
+        version: int,
+        query: Any,
+        limit: int,
+        score_threshold: float,
+        filter: Optional[dict],
+    ) -> Hashable:
+        return (
+            version,
+            tuple(query) if isinstance(query, list) else query,
+            limit,
+            score_threshold,
+            json.dumps(filter, sort_keys=True, default=str) if filter else None,
+        )
@@ -0,0 +1,204 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class SQLiteConnectionPool:
+    """Reuses SQLite connections configured for concurrent readers and writers.
+
+    Connections are opened in WAL mode, so readers never block on a writer, and
+    with a busy timeout, so concurrent writers wait for the lock instead of
+    failing. Idle connections are kept for reuse up to ``max_idle``; each one
+    is only ever used by a single thread at a time.
+    """
+
+    def __init__(self, db_path: str, max_idle: int = 4, timeout: float = 30.0):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, committing on success and rolling back on error."""
+        conn = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+
+class LRUStore:
+    """Key-value store evicting its least recently used entries.
+
+    Entries are kept in memory, or in the ``table`` of a SQLite database when
+    ``path`` is set, so they survive across runs and processes. In SQLite, a
+    hit only writes its new use time when the stored one is older than
+    ``touch_interval`` seconds, and the least recently used entries are only
+    evicted down to ``max_entries`` once the table holds ``max_entries`` plus
+    a tenth more, so that reads stay reads and writes rarely scan the table.
+    Use times are indexed.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        path: Optional[str] = None,
+        max_entries: int = 1024,
+        touch_interval: float = 60.0,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.table = table
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.high_water = max_entries + max_entries // 10
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: Optional[SQLiteConnectionPool] = None
+        self._count: Optional[int] = None
+        if path:
+            self._initialize_db()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Look up the values stored under ``keys``, None for the missing ones."""
+        if not self._pool:
+            with self._lock:
+                values = []
+                for key in keys:
+                    value = self._entries.get(key)
+                    if value is not None:
+                        self._entries.move_to_end(key)
+                    values.append(value)
+                return values
+
+        found: Dict[str, Any] = {}
+        now = time.time()
+        with self._pool.connection() as conn:
+            # Stay below SQLite's limit on the number of bound parameters
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start : start + 500])
+                rows = conn.execute(
+                    f"SELECT key, value, last_used FROM {self.table} "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                stale = []
+                for key, value, last_used in rows:
+                    found[key] = value
+                    if last_used < now - self.touch_interval:
+                        stale.append(key)
+                if stale:
+                    conn.execute(
+                        f"UPDATE {self.table} SET last_used = ? "
+                        f"WHERE key IN ({','.join('?' * len(stale))})",
+                        [now, *stale],
+                    )
+        return [found.get(key) for key in keys]
+
+    def put_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Store the values under their keys, evicting the least recently used."""
+        if not self._pool:
+            with self._lock:
+                for key, value in items:
+                    self._entries[key] = value
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return
+
+        now = time.time()
+        with self._pool.connection() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, last_used) "
+                f"VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in items],
+            )
+            with self._lock:
+                if self._count is None:
+                    self._count = conn.execute(
+                        f"SELECT COUNT(*) FROM {self.table}"
+                    ).fetchone()[0]
+                else:
+                    # Replaced keys are counted again until the next count
+                    self._count += len(items)
+                if self._count <= self.high_water:
+                    return
+                self._count = conn.execute(
+                    f"SELECT COUNT(*) FROM {self.table}"
+                ).fetchone()[0]
+                if self._count <= self.high_water:
+                    return
+                conn.execute(
+                    f"""
+                    DELETE FROM {self.table} WHERE key IN (
+                        SELECT key FROM {self.table}
+                        ORDER BY last_used DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+                self._count = self.max_entries
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self._count = None
+        if self._pool:
+            with self._pool.connection() as conn:
+                conn.execute(f"DELETE FROM {self.table}")
+
+    def _initialize_db(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)  # type: ignore[arg-type]
+        self._pool = SQLiteConnectionPool(self.path)  # type: ignore[arg-type]
+        with self._pool.connection() as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table}_last_used "
+                f"ON {self.table} (last_used)"
+            )
@@ -41,3 +41,8 @@ class TokenCalcHandler(CustomLogger):
                         self.token_cost_process.sum_cached_prompt_tokens(
                             usage.prompt_tokens_details.cached_tokens
                         )
+                    elif getattr(usage, "cache_read_input_tokens", None):
+                        # Anthropic reports cache hits outside prompt_tokens_details
+                        self.token_cost_process.sum_cached_prompt_tokens(
+                            usage.cache_read_input_tokens
+                        )
@@ -5,6 +5,7 @@ from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import pytest
+from litellm.types.utils import Usage
 
 from crewai import Agent, Crew, Task
 from crewai.agents.cache import CacheHandler
@@ -19,6 +20,7 @@ from crewai.tools.tool_calling import InstructorToolCalling
 from crewai.tools.tool_usage import ToolUsage
 from crewai.utilities import RPMController
 from crewai.utilities.errors import AgentRepositoryError
+from crewai.utilities.prompts import Prompts
 from crewai.events.event_bus import crewai_event_bus
 from crewai.events.types.tool_usage_events import ToolUsageFinishedEvent
 from crewai.process import Process
@@ -1133,6 +1135,81 @@ def test_using_system_prompt():
     assert agent.agent_executor.prompt.get("system")
 
 
+def test_agent_executor_gets_the_read_tool_output_tool():
+    from crewai.tools.agent_tools.read_tool_output_tool import ReadToolOutputTool
+
+    @tool
+    def search(query: str) -> str:
+        """Search the web."""
+        return query
+
+    agent = Agent(
+        role="Researcher",
+        goal="Read large documents.",
+        backstory="You're an agent that reads large documents.",
+        tools=[search],
+        max_tool_output_tokens=500,
+    )
+
+    agent.create_agent_executor()
+    read_tools = [
+        tool
+        for tool in agent.agent_executor.original_tools
+        if isinstance(tool, ReadToolOutputTool)
+    ]
+    assert len(agent.agent_executor.original_tools) == 2
+    assert read_tools[0].store is agent._tool_output_store
+
+    agent.create_agent_executor(tools=[search, *agent.get_tool_output_tools()])
+    assert len(agent.agent_executor.original_tools) == 2
+
+    plain_agent = Agent(role="Reader", goal="Read", backstory="You read.", tools=[search])
+    plain_agent.create_agent_executor()
+    assert plain_agent.agent_executor.original_tools == [search]
+
+
+def test_agent_knowledge_uses_hybrid_search_and_ingestion_workers():
+    source = StringKnowledgeSource(content="Error code E1234 means the disk is full.")
+    agent = Agent(
+        role="Support",
+        goal="Answer tickets",
+        backstory="You answer support tickets.",
+        knowledge_sources=[source],
+        knowledge_hybrid_search=True,
+        knowledge_ingestion_workers=2,
+    )
+
+    with patch("crewai.agent.Knowledge") as knowledge_class:
+        agent.set_knowledge()
+
+    kwargs = knowledge_class.call_args.kwargs
+    assert kwargs["hybrid_search"] is True
+    assert kwargs["ingestion_workers"] == 2
+    knowledge_class.return_value.add_sources.assert_called_once_with()
+    assert agent.copy().knowledge_hybrid_search is True
+
+
+def test_task_execution_prompt_is_memoized_per_configuration():
+    with patch.object(
+        Prompts, "task_execution", autospec=True, side_effect=Prompts.task_execution
+    ) as task_execution:
+        agent = Agent(
+            role="{topic} specialist",
+            goal="Figure {goal} out",
+            backstory="I am the master of {role}",
+        )
+        agent.create_agent_executor()
+        first_prompt = agent.agent_executor.prompt
+        agent.create_agent_executor()
+        assert agent.agent_executor.prompt == first_prompt
+        assert task_execution.call_count == 1
+
+        agent.interpolate_inputs({"topic": "Sales", "goal": "stuff", "role": "nothing"})
+        agent.create_agent_executor()
+        assert task_execution.call_count == 2
+        assert "Sales specialist" in agent.agent_executor.prompt["system"]
+
+
 def test_system_and_prompt_template():
     agent = Agent(
         role="{topic} specialist",
@@ -1889,7 +1966,8 @@ def test_agent_with_knowledge_sources_with_query_limit_and_score_threshold():
             assert agent.knowledge is not None
             mock_knowledge_query.assert_called_once_with(
                 ["Brandon's favorite color"],
-                **knowledge_config.model_dump(),
+                results_limit=10,
+                score_threshold=0.5,
             )
 
 
@@ -1926,7 +2004,8 @@ def test_agent_with_knowledge_sources_with_query_limit_and_score_threshold_defau
             assert agent.knowledge is not None
             mock_knowledge_query.assert_called_once_with(
                 ["Brandon's favorite color"],
-                **knowledge_config.model_dump(),
+                results_limit=3,
+                score_threshold=0.35,
             )
 
 
@@ -2503,3 +2582,80 @@ def test_agent_from_repository_without_org_set(
         "No organization currently set. We recommend setting one before using: `crewai org switch <org_id>` command.",
         style="yellow",
     )
+
+
+def test_agent_prompt_caching_marks_the_executor_requests():
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=LLM(model="anthropic/claude-3-sonnet"),
+        prompt_caching=True,
+    )
+    task = Task(description="Say hi", expected_output="A greeting", agent=agent)
+
+    mock_message = MagicMock()
+    mock_message.content = "Thought: easy\nFinal Answer: hi"
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=mock_message)]
+    with patch("litellm.completion", return_value=mock_response) as completion:
+        assert agent.execute_task(task) == "hi"
+
+    sent = completion.call_args.kwargs["messages"]
+    cache_marker = {"type": "ephemeral"}
+    system = next(m for m in sent if m["role"] == "system")
+    assert system["content"][0]["cache_control"] == cache_marker
+    assert sent[-1]["content"][0]["cache_control"] == cache_marker
+
+
+def test_agent_streaming_llm_stops_once_the_action_is_complete():
+    @tool
+    def lookup(query: str) -> str:
+        """Look up a query."""
+        return f"found {query}"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=LLM(model="gpt-4o", stream=True),
+        tools=[lookup],
+    )
+    task = Task(description="Look up x", expected_output="The result", agent=agent)
+    responses = [
+        [
+            "Thought: look it up\nAction: lookup\nAction Input: ",
+            '{"query": "x"}',
+            "\nObservation: made up",
+            "\nFinal Answer: made up",
+        ],
+        ["Thought: done\nFinal Answer: ", "found x"],
+    ]
+    consumed = []
+    closed = []
+
+    def stream(chunks):
+        try:
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield {"choices": [{"delta": {"content": chunk}}]}
+            yield {
+                "choices": [],
+                "usage": Usage(prompt_tokens=7, completion_tokens=3, total_tokens=10),
+            }
+        finally:
+            closed.append(chunks)
+
+    with patch(
+        "litellm.completion", side_effect=[stream(chunks) for chunks in responses]
+    ):
+        assert agent.execute_task(task) == "found x"
+
+    assert "\nObservation: made up" not in consumed
+    assert consumed[-2:] == responses[1]
+    assert closed == responses
+    # The usage of the stopped stream is estimated
+    usage = agent._token_process.get_summary()
+    assert usage.successful_requests == 2
+    assert usage.prompt_tokens > 7
+    assert usage.completion_tokens > 3
@@ -115,3 +115,35 @@ def test_agent_inject_date_invalid_format():
     agent._inject_date_to_task(task)
 
     assert task.description == original_description
+
+
+def test_agent_inject_date_with_prompt_caching_goes_last():
+    """Test that prompt caching moves the date to the end of the task prompt.
+
+    The task description must stay untouched so the prompt prefix is stable.
+    """
+    with patch("datetime.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2025, 1, 1)
+
+        agent = Agent(
+            role="test_agent",
+            goal="test_goal",
+            backstory="test_backstory",
+            inject_date=True,
+            prompt_caching=True,
+        )
+
+        task = Task(
+            description="Test task",
+            expected_output="Test output",
+            agent=agent,
+        )
+
+        with patch.object(
+            Agent, "_execute_without_timeout", return_value="done"
+        ) as execute:
+            agent.execute_task(task)
+
+        task_prompt = execute.call_args.args[0]
+        assert task.description == "Test task"
+        assert task_prompt.endswith("Current Date: 2025-01-01")
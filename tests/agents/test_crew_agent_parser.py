@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from crewai.agents.crew_agent_executor import (
@@ -359,3 +361,62 @@ def test_integration_valid_and_invalid():
 
 
 # TODO: ADD TEST TO MAKE SURE ** REMOVAL DOESN'T MESS UP ANYTHING
+
+
+def _feed_in_chunks(text, size):
+    stream_parser = parser.StreamParser()
+    for start in range(0, len(text), size):
+        if stream_parser.feed(text[start : start + size]):
+            break
+    return stream_parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_stream_parser_completes_after_json_action_input(size):
+    text = 'Thought: search it\nAction: search\nAction Input: {"query": "a } \\" {", "ids": [1, 2]}\nObservation: made up'
+    stream_parser = _feed_in_chunks(text, size)
+
+    assert stream_parser.is_complete
+    assert stream_parser.text.endswith('"ids": [1, 2]}')
+    result = stream_parser.parse()
+    assert isinstance(result, AgentAction)
+    assert result.tool == "search"
+    assert result.tool_input == '{"query": "a } \\" {", "ids": [1, 2]}'
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_stream_parser_completes_plain_action_input_at_observation(size):
+    text = "Thought: search it\nAction: search\nAction Input: temperature in SF\nObservation: made up"
+    stream_parser = _feed_in_chunks(text, size)
+
+    assert stream_parser.is_complete
+    assert stream_parser.text.endswith("Action Input: temperature in SF")
+
+
+def test_stream_parser_never_completes_final_answer():
+    text = 'Thought: done\nFinal Answer: call Action: search\nAction Input: {"query": "x"}'
+    stream_parser = _feed_in_chunks(text, 2)
+
+    assert not stream_parser.is_complete
+    assert stream_parser.text == text
+    assert isinstance(stream_parser.parse(), AgentFinish)
+
+
+@pytest.mark.parametrize("size", [1, 5, 1000])
+def test_stream_parser_thought_is_reused_by_parse(size):
+    text = 'I should ```search```\nAction: search\nAction Input: {"query": "x"}'
+    stream_parser = _feed_in_chunks(text, size)
+
+    assert stream_parser.thought == parser._extract_thought(text)
+    published = stream_parser.publish()
+    with patch.object(parser, "_extract_thought") as extract_thought:
+        result = parser.parse(published)
+
+    extract_thought.assert_not_called()
+    assert result.thought == "I should search"
+    assert published == text
+    with patch.object(
+        parser, "_extract_thought", wraps=parser._extract_thought
+    ) as extract_thought:
+        assert parser.parse(text).thought == "I should search"
+    extract_thought.assert_called_once_with(text)
@@ -12,13 +12,16 @@ from crewai.cli.cli import (
     deploy_remove,
     deply_status,
     flow_add_crew,
+    memory_compact,
     reset_memories,
     login,
     test,
     train,
     version,
 )
+from crewai.cli.compact_memories_command import compact_memories_command
 from crewai.crew import Crew
+from crewai.memory.retention import MemoryRetentionPolicy
 
 
 @pytest.fixture
@@ -205,6 +208,48 @@ def test_reset_no_memory_flags(runner):
     )
 
 
+def test_memory_compact_overrides_crew_policy(mock_crew, runner):
+    mock_crew.memory_retention = MemoryRetentionPolicy(ttl_days=30, max_entries=50)
+    mock_crew.compact_memories.return_value = {"short": 3, "entity": 1, "long": 0}
+
+    with mock.patch(
+        "crewai.cli.compact_memories_command.get_crews", return_value=[mock_crew]
+    ):
+        result = runner.invoke(memory_compact, ["--ttl-days", "7", "--no-dedupe"])
+
+    policy = mock_crew.compact_memories.call_args.args[0]
+    assert policy.ttl_days == 7
+    assert policy.max_entries == 50
+    assert policy.deduplicate is False
+    assert (
+        "[Crew (test_crew)] Memory compaction has been completed, removed entries "
+        "(short: 3, entity: 1, long: 0)." in result.output
+    )
+
+
+def test_memory_compact_rejects_negative_ttl(mock_crew, runner):
+    with mock.patch(
+        "crewai.cli.compact_memories_command.get_crews", return_value=[mock_crew]
+    ):
+        result = runner.invoke(memory_compact, ["--ttl-days", "-1"])
+
+    assert result.exit_code != 0
+    assert "--ttl-days" in result.output
+    mock_crew.compact_memories.assert_not_called()
+
+
+def test_compact_memories_command_validates_overrides(mock_crew, capsys):
+    mock_crew.memory_retention = None
+
+    with mock.patch(
+        "crewai.cli.compact_memories_command.get_crews", return_value=[mock_crew]
+    ):
+        compact_memories_command({"recency_half_life_days": 0})
+
+    mock_crew.compact_memories.assert_not_called()
+    assert "recency_half_life_days" in capsys.readouterr().err
+
+
 def test_version_flag(runner):
     result = runner.invoke(version)
 
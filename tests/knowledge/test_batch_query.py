@@ -0,0 +1,103 @@
+"""Test batched knowledge queries across knowledge bases."""
+
+from typing import List
+
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.batch_query import query_knowledge
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+
+class RecordingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(text)), 1.0] for text in input]
+
+
+def _knowledge(name: str, facts: List[str], embedder) -> Knowledge:
+    knowledge = Knowledge(
+        collection_name=name,
+        sources=[StringKnowledgeSource(content=fact) for fact in facts],
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+    )
+    knowledge.add_sources()
+    return knowledge
+
+
+def test_queries_are_embedded_once_for_knowledge_bases_sharing_an_embedder():
+    embedder = RecordingEmbedder()
+    agent_knowledge = _knowledge("agent", ["Agents plan.", "Agents act."], embedder)
+    crew_knowledge = _knowledge("crew", ["Crews collaborate on tasks."], embedder)
+    embedder.calls.clear()
+
+    agent_results, crew_results = query_knowledge(
+        [agent_knowledge, crew_knowledge], ["plan", "collaborate"], results_limit=5
+    )
+
+    assert embedder.calls == [["plan", "collaborate"]]
+    assert {result["context"] for result in agent_results} == {
+        "Agents plan.",
+        "Agents act.",
+    }
+    assert [result["context"] for result in crew_results] == [
+        "Crews collaborate on tasks."
+    ]
+
+
+def test_chunks_found_in_several_knowledge_bases_are_kept_once():
+    embedder = RecordingEmbedder()
+    agent_knowledge = _knowledge("agent", ["Shared fact.", "Agent fact."], embedder)
+    crew_knowledge = _knowledge("crew", ["Shared fact."], embedder)
+
+    results = query_knowledge(
+        [agent_knowledge, None, crew_knowledge], ["fact"], results_limit=5
+    )
+
+    contexts = [result["context"] for base in results for result in base]
+    assert sorted(contexts) == ["Agent fact.", "Shared fact."]
+    assert results[1] == []
+
+
+def test_multiple_queries_are_merged_by_relevance():
+    embedder = RecordingEmbedder()
+    knowledge = _knowledge("merged", ["Short.", "A much longer fact."], embedder)
+    embedder.calls.clear()
+
+    results = knowledge.query(["Shrt.", "A much longer fct."], results_limit=5)
+
+    # Each fact is one character away from one of the queries
+    assert embedder.calls == [["Shrt.", "A much longer fct."]]
+    assert sorted(result["context"] for result in results) == [
+        "A much longer fact.",
+        "Short.",
+    ]
+    assert [result["relevance"] for result in results] == [0.5, 0.5]
+
+
+def test_default_embedders_share_their_embedding_key():
+    agent_storage = KnowledgeStorage(collection_name="agent")
+    crew_storage = KnowledgeStorage(collection_name="crew")
+    custom = {"provider": "custom", "config": {"embedder": RecordingEmbedder()}}
+    other = {"provider": "custom", "config": {"embedder": RecordingEmbedder()}}
+
+    assert agent_storage.embedding_key == crew_storage.embedding_key
+    assert (
+        KnowledgeStorage(embedder=custom).embedding_key
+        != KnowledgeStorage(embedder=other).embedding_key
+    )
+
+
+def test_storages_sharing_a_collection_see_each_other_writes():
+    embedder = RecordingEmbedder()
+    agent_knowledge = _knowledge("shared", ["Agents plan."], embedder)
+    crew_knowledge = _knowledge("shared", ["Agents plan."], embedder)
+    assert len(agent_knowledge.query(["plan"], results_limit=5)) == 1
+
+    crew_knowledge.storage.save(["Crews plan too."])
+
+    assert len(agent_knowledge.query(["plan"], results_limit=5)) == 2
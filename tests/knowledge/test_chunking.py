@@ -0,0 +1,151 @@
+import json
+
+import pandas as pd
+import pytest
+
+from crewai.knowledge.chunking import RecordChunker, TextChunker, iter_json_records
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
+from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+
+TEXT = (
+    "The sun is a star. It is very hot.\n\n"
+    "The moon orbits the earth. It has no light of its own.\n\n"
+    "Mars is red."
+)
+
+
+def test_text_chunks_end_on_sentences_and_paragraphs():
+    chunks = list(TextChunker(chunk_size=70).chunk([TEXT]))
+
+    assert chunks == [
+        "The sun is a star. It is very hot.",
+        "The moon orbits the earth. It has no light of its own.\n\nMars is red.",
+    ]
+
+
+def test_consecutive_chunks_overlap_on_whole_sentences():
+    text = "One. Two. Three. Four. Five. Six."
+
+    chunks = list(TextChunker(chunk_size=15, chunk_overlap=6).chunk([text]))
+
+    assert chunks == ["One. Two.", "Two. Three.", "Four. Five.", "Five. Six."]
+
+
+def test_long_sentences_are_split_between_words():
+    chunks = list(TextChunker(chunk_size=12).chunk(["alpha beta gamma delta"]))
+
+    assert chunks == ["alpha beta", "gamma delta"]
+
+
+def test_chunk_size_can_count_tokens():
+    words = lambda text: len(text.split())  # noqa: E731
+
+    chunks = list(TextChunker(chunk_size=9, length_function=words).chunk([TEXT]))
+
+    assert chunks[0] == "The sun is a star. It is very hot."
+    assert all(words(chunk) <= 9 for chunk in chunks)
+
+
+def test_text_without_boundaries_is_flushed_when_it_fits_in_a_chunk():
+    measured = []
+
+    def tokens(text):
+        measured.append(len(text))
+        return len(text) // 100
+
+    pieces = ["a" * 50] * 40
+    chunker = TextChunker(chunk_size=10, length_function=tokens)
+
+    chunks = list(chunker.chunk(pieces))
+
+    assert "".join(chunks) == "".join(pieces)
+    assert max(measured) <= 8 * 10 + 50
+
+
+def test_rows_are_kept_whole_and_repeat_the_header():
+    rows = ["name,color\n", "Alice,blue\n", "Bob,red\n", "Carol,green\n"]
+
+    chunks = list(RecordChunker(chunk_size=32, repeat_header=True).chunk(rows))
+
+    assert chunks == [
+        "name,color\nAlice,blue\nBob,red",
+        "name,color\nCarol,green",
+    ]
+
+
+def test_json_records_are_labelled_with_their_path():
+    data = {"team": "crew", "members": [{"name": "Alice"}, {"name": "Bob"}]}
+
+    def render(value):
+        return json.dumps(value)
+
+    assert list(iter_json_records(data, 30, render)) == [
+        'team:\n"crew"\n',
+        'members[0]:\n{"name": "Alice"}\n',
+        'members[1]:\n{"name": "Bob"}\n',
+    ]
+
+
+def test_json_containers_are_rendered_until_they_outgrow_a_record():
+    data = {"items": list(range(1000))}
+    for level in range(20):
+        data = {f"level{level}": data}
+    rendered = []
+
+    def render(value):
+        for piece in json.dumps(value).split(" "):
+            rendered.append(piece)
+            yield piece + " "
+
+    records = list(iter_json_records(data, 30, render))
+
+    assert len(records) == 1000
+    assert records[0].startswith("level19.level18")
+    assert records[0].endswith(".items[0]:\n0 \n")
+    assert len(rendered) < 2 * 1000
+
+
+def test_csv_source_chunks_whole_rows(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("name,color\nAlice,blue\nBob,red\nCarol,green\n")
+    source = CSVKnowledgeSource(file_paths=[path], chunk_size=30, chunk_overlap=0)
+
+    assert list(source.iter_chunks()) == [
+        "name color\nAlice blue\nBob red",
+        "name color\nCarol green",
+    ]
+
+
+def test_json_source_chunks_records(tmp_path):
+    path = tmp_path / "people.json"
+    people = [{"name": "Alice", "color": "blue"}, {"name": "Bob", "color": "red"}]
+    path.write_text(json.dumps({"people": people}))
+    source = JSONKnowledgeSource(file_paths=[path], chunk_size=40, chunk_overlap=0)
+
+    assert list(source.iter_chunks()) == [
+        "people[0]:\nname: Alice\ncolor: blue",
+        "people[1]:\nname: Bob\ncolor: red",
+    ]
+
+
+def test_excel_source_chunks_rows_of_each_sheet(tmp_path):
+    path = tmp_path / "people.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"name": ["Alice", "Bob"], "color": ["blue", "red"]}).to_excel(
+            writer, sheet_name="people", index=False
+        )
+        pd.DataFrame({"city": ["Paris"]}).to_excel(
+            writer, sheet_name="cities", index=False
+        )
+    source = ExcelKnowledgeSource(file_paths=[path], chunk_size=60, chunk_overlap=0)
+
+    assert list(source.iter_chunks()) == [
+        "Sheet: people\nname,color\nAlice,blue\nBob,red",
+        "Sheet: cities\ncity\nParis",
+    ]
+
+
+def test_overlap_must_be_smaller_than_the_chunk_size():
+    with pytest.raises(ValueError):
+        TextChunker(chunk_size=10, chunk_overlap=10)
@@ -0,0 +1,216 @@
+"""Test hybrid lexical and vector search of knowledge."""
+
+from typing import List
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.storage.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
+
+FACTS = [f"Fact number {i} is boring." for i in range(8)] + [
+    "Disk full raises ERR_4711 during ingestion."
+]
+
+
+class LengthEmbedder(EmbeddingFunction):
+    """Embeds texts by their length, so that identifiers are hard to find."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [[float(len(text)), 1.0] for text in input]
+
+
+def _knowledge(hybrid_search: bool, **kwargs) -> Knowledge:
+    knowledge = Knowledge(
+        collection_name="hybrid",
+        sources=[StringKnowledgeSource(content=fact) for fact in FACTS],
+        embedder={"provider": "custom", "config": {"embedder": LengthEmbedder()}},
+        hybrid_search=hybrid_search,
+        **kwargs,
+    )
+    knowledge.add_sources()
+    return knowledge
+
+
+def test_bm25_ranks_documents_with_rare_terms_first():
+    index = LexicalIndex()
+    index.add(
+        {
+            "a": "the disk is full",
+            "b": "the disk is fine and the disk is fast",
+            "c": "ERR_4711 means the disk is full",
+        }
+    )
+
+    assert [doc_id for doc_id, _ in index.search("err_4711 disk")][0] == "c"
+    assert [doc_id for doc_id, _ in index.search("fast")] == ["b"]
+    assert index.search("missing") == []
+
+
+def test_index_is_persisted_and_updated_incrementally(tmp_path):
+    index = LexicalIndex(str(tmp_path / "lexical"), merge_factor=2)
+    index.add({"a": "alpha", "b": "beta"})
+    index.flush()
+    index.add({"c": "gamma alpha"})
+    index.flush()
+    index.remove(["a"])
+    index.flush()
+
+    reopened = LexicalIndex(str(tmp_path / "lexical"), merge_factor=2)
+    assert len(reopened) == 2
+    assert [doc_id for doc_id, _ in reopened.search("alpha")] == ["c"]
+
+    # Merging the segments drops the removed documents
+    reopened.add({"d": "delta"})
+    reopened.flush()
+    assert len(list((tmp_path / "lexical").glob("segment_*"))) == 1
+    assert sorted(doc_id for doc_id, _ in reopened.search("alpha beta delta")) == [
+        "b",
+        "c",
+        "d",
+    ]
+
+
+def test_segments_are_merged_by_size_tiers(tmp_path):
+    texts = {f"doc{i}": f"word{i % 3} shared word{i}" for i in range(7)}
+    index = LexicalIndex(str(tmp_path / "lexical"), merge_factor=2)
+    for doc_id, text in texts.items():
+        index.add({doc_id: text})
+        index.flush()
+    index.remove(["doc1"])
+    index.flush()
+
+    # Seven single-document flushes leave segments of 4, 2 and 1 documents
+    assert sorted(len(segment.doc_ids) for segment in index._segments.values()) == [
+        1,
+        2,
+        4,
+    ]
+    in_memory = LexicalIndex()
+    in_memory.add({k: v for k, v in texts.items() if k != "doc1"})
+    for query in ("word1 shared", "word2", "word6"):
+        assert index.search(query) == pytest.approx(in_memory.search(query))
+
+
+def test_ingesting_a_source_writes_a_single_segment():
+    content = " ".join(f"Fact {i} is boring." for i in range(600))
+    knowledge = Knowledge(
+        collection_name="segments",
+        sources=[StringKnowledgeSource(content=content, chunk_size=20, chunk_overlap=0)],
+        embedder={"provider": "custom", "config": {"embedder": LengthEmbedder()}},
+        hybrid_search=True,
+    )
+    knowledge.add_sources()
+
+    index = knowledge.storage._lexical_index
+    assert len(index) > 256
+    assert len(index._segments) == 1
+
+
+def test_in_memory_index_builds_pending_documents_once(monkeypatch):
+    from crewai.knowledge.storage import lexical_index
+
+    builds = []
+    build = lexical_index._Segment.build.__func__
+    monkeypatch.setattr(
+        lexical_index._Segment,
+        "build",
+        classmethod(lambda cls, documents: builds.append(1) or build(cls, documents)),
+    )
+    index = LexicalIndex()
+    index.add({"a": "alpha", "b": "beta"})
+
+    index.search("alpha")
+    index.search("beta")
+    assert len(builds) == 1
+
+    index.flush()
+    index.add({"c": "alpha gamma"})
+    index.flush()
+    assert len(builds) == 2
+    assert len(index._segments) == 2
+    assert [doc_id for doc_id, _ in index.search("alpha")] == ["a", "c"]
+    index.search("gamma")
+    assert len(builds) == 2
+
+
+def test_reciprocal_rank_fusion_favours_ids_ranked_by_both():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+    assert [doc_id for doc_id, _ in fused][:2] == ["c", "a"]
+    assert len(fused) == 4
+
+
+def test_hybrid_search_finds_exact_identifiers():
+    dense = _knowledge(hybrid_search=False).query(["ERR_4711"], results_limit=1)
+    hybrid = _knowledge(hybrid_search=True).query(["ERR_4711"], results_limit=1)
+
+    assert "ERR_4711" not in dense[0]["context"]
+    assert hybrid[0]["context"] == "Disk full raises ERR_4711 during ingestion."
+
+
+def test_hybrid_results_keep_the_vector_relevance():
+    queries = ["ERR_4711", "fact"]
+    dense = {
+        result["id"]: result["relevance"]
+        for result in _knowledge(hybrid_search=False).query(
+            queries, results_limit=len(FACTS)
+        )
+    }
+
+    hybrid = _knowledge(hybrid_search=True).query(queries, results_limit=3)
+
+    assert "Disk full raises ERR_4711 during ingestion." in [
+        result["context"] for result in hybrid
+    ]
+    for result in hybrid:
+        assert result["relevance"] == pytest.approx(dense[result["id"]])
+
+
+def test_lexical_matches_ignore_the_score_threshold():
+    results = _knowledge(hybrid_search=True).query(
+        ["ERR_4711"], results_limit=1, score_threshold=float("inf")
+    )
+
+    assert results[0]["context"] == "Disk full raises ERR_4711 during ingestion."
+    assert results[0]["relevance"] == 0.0
+
+
+def test_reranker_reorders_the_fused_results():
+    calls: List[str] = []
+
+    def reranker(query, results):
+        calls.append(query)
+        return sorted(results, key=lambda result: result["context"])
+
+    results = _knowledge(hybrid_search=True, reranker=reranker).query(
+        ["ERR_4711 fact"], results_limit=2
+    )
+
+    assert calls == ["ERR_4711 fact"]
+    assert [result["context"] for result in results] == [
+        "Disk full raises ERR_4711 during ingestion.",
+        "Fact number 0 is boring.",
+    ]
+
+
+def test_existing_collections_are_indexed_when_hybrid_search_is_enabled():
+    _knowledge(hybrid_search=False)
+
+    knowledge = _knowledge(hybrid_search=True)
+
+    assert len(knowledge.storage._lexical_index) == len(FACTS)
+
+
+@pytest.mark.parametrize("removed", [1, 3])
+def test_removed_chunks_leave_the_index(removed):
+    knowledge = _knowledge(hybrid_search=True)
+    ids = knowledge.storage.collection.get()["ids"][:removed]
+
+    knowledge.storage._delete_unused_chunks(set(ids), {})
+
+    assert len(knowledge.storage._lexical_index) == len(FACTS) - removed
@@ -0,0 +1,241 @@
+"""Test incremental ingestion of knowledge sources."""
+
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+def _knowledge(sources, embedder):
+    knowledge = Knowledge(
+        collection_name="ingestion",
+        sources=sources,
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+    )
+    knowledge.add_sources()
+    return knowledge
+
+
+def _collection_size(knowledge):
+    return knowledge.storage.collection.count()
+
+
+def test_unchanged_sources_are_not_embedded_again(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("The sky is blue. " * 20)
+
+    _knowledge(
+        [
+            TextFileKnowledgeSource(file_paths=[path], chunk_size=100, chunk_overlap=0),
+            StringKnowledgeSource(content="Water is wet."),
+        ],
+        embedder,
+    )
+    embedded = len(embedder.embedded)
+    knowledge = _knowledge(
+        [
+            TextFileKnowledgeSource(file_paths=[path], chunk_size=100, chunk_overlap=0),
+            StringKnowledgeSource(content="Water is wet."),
+        ],
+        embedder,
+    )
+
+    assert embedded > 0
+    assert len(embedder.embedded) == embedded
+    assert _collection_size(knowledge) > 0
+
+
+def test_only_changed_chunks_are_embedded(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("a" * 100 + "b" * 100)
+    _knowledge(
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=100, chunk_overlap=0)],
+        embedder,
+    )
+
+    path.write_text("a" * 100 + "c" * 100)
+    embedder.embedded.clear()
+    knowledge = _knowledge(
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=100, chunk_overlap=0)],
+        embedder,
+    )
+
+    assert embedder.embedded == ["c" * 100]
+    documents = knowledge.storage.collection.get()["documents"]
+    assert sorted(documents) == ["a" * 100, "c" * 100]
+
+
+def test_chunks_of_deleted_files_are_removed(embedder, tmp_path):
+    kept, deleted = tmp_path / "kept.txt", tmp_path / "deleted.txt"
+    kept.write_text("kept")
+    deleted.write_text("deleted")
+    _knowledge(
+        [
+            TextFileKnowledgeSource(file_paths=[kept]),
+            TextFileKnowledgeSource(file_paths=[deleted]),
+        ],
+        embedder,
+    )
+
+    deleted.unlink()
+    knowledge = _knowledge([TextFileKnowledgeSource(file_paths=[kept])], embedder)
+
+    assert knowledge.storage.collection.get()["documents"] == ["kept"]
+
+
+def test_sources_missing_from_the_collection_are_embedded_again(embedder):
+    knowledge = _knowledge([StringKnowledgeSource(content="Water is wet.")], embedder)
+    collection = knowledge.storage.collection
+    collection.delete(ids=collection.get()["ids"])
+    embedder.embedded.clear()
+
+    knowledge = _knowledge([StringKnowledgeSource(content="Water is wet.")], embedder)
+
+    assert embedder.embedded == ["Water is wet."]
+    assert _collection_size(knowledge) == 1
+
+
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(10, 0), (40, 15), (7, 6)])
+def test_streamed_chunks_match_chunking_the_whole_text(chunk_size, chunk_overlap):
+    text = "Water is wet. Fire is hot!\n\nIce is cold.\nSteam rises. " * 6
+    source = StringKnowledgeSource(
+        content=text, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+    pieces = [text[i : i + 4] for i in range(0, len(text), 4)]
+
+    assert list(source._chunk_stream(pieces)) == source._chunk_text(text)
+
+
+def test_file_sources_are_read_lazily(embedder, tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("name,color\nAlice,blue\nBob,red\n")
+
+    source = CSVKnowledgeSource(file_paths=[path], chunk_size=24, chunk_overlap=0)
+
+    assert source._content is None
+    assert list(source.iter_documents()) == [
+        "name color\n",
+        "Alice blue\n",
+        "Bob red\n",
+    ]
+    knowledge = _knowledge([source], embedder)
+    assert embedder.embedded == ["name color\nAlice blue", "name color\nBob red"]
+    assert _collection_size(knowledge) == 2
+    assert source._content is None
+    assert source.content == {path: "name color\nAlice blue\nBob red\n"}
+
+
+def test_sources_overriding_add_read_the_loaded_content(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("The sky is blue.")
+
+    class UppercaseTextSource(TextFileKnowledgeSource):
+        def add(self) -> None:
+            self._add_chunks(text.upper() for text in self.content.values())
+
+    knowledge = _knowledge([UppercaseTextSource(file_paths=[path])], embedder)
+
+    assert embedder.embedded == ["THE SKY IS BLUE."]
+    assert _collection_size(knowledge) == 1
+
+
+def test_sources_only_loading_content_are_added(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("unused")
+
+    class NotesSource(BaseFileKnowledgeSource):
+        def load_content(self) -> Dict[Path, str]:
+            return {path: "Ice is cold."}
+
+    source = NotesSource(file_paths=[path])
+    assert source._content == {path: "Ice is cold."}
+
+    knowledge = _knowledge([source], embedder)
+
+    assert embedder.embedded == ["Ice is cold."]
+    assert _collection_size(knowledge) == 1
+
+
+def test_parallel_ingestion_matches_sequential_ingestion(embedder, tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"doc_{index}.txt"
+        path.write_text(f"Document {index}. " * 30)
+        paths.append(path)
+    sources = [
+        TextFileKnowledgeSource(
+            file_paths=paths[:2], chunk_size=100, chunk_overlap=10
+        ),
+        StringKnowledgeSource(content="Water is wet."),
+        TextFileKnowledgeSource(
+            file_paths=paths[2:], chunk_size=100, chunk_overlap=10
+        ),
+    ]
+
+    knowledge = Knowledge(
+        collection_name="parallel",
+        sources=sources,
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+        ingestion_workers=2,
+    )
+    knowledge.add_sources()
+
+    expected = [chunk for source in sources for chunk in source.iter_chunks()]
+    assert sorted(embedder.embedded) == sorted(set(expected))
+    stats = knowledge.ingestion_stats
+    assert stats.documents == 4
+    assert stats.chunks == len(expected)
+    assert stats.embeddings == len(set(expected))
+    assert stats.documents_per_second > 0
+
+
+def test_unchanged_files_are_not_read_to_be_fingerprinted(embedder, tmp_path):
+    path = tmp_path / "facts.txt"
+    path.write_text("The sky is blue.")
+    _knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+
+    with patch(
+        "crewai.knowledge.source.base_knowledge_source._file_digest"
+    ) as file_digest:
+        _knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+        file_digest.assert_not_called()
+
+        path.write_text("The sky is grey.")
+        file_digest.return_value = "changed"
+        _knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+        file_digest.assert_called_once()
+
+
+def test_knowledge_sharing_a_collection_keeps_the_other_sources(embedder):
+    _knowledge([StringKnowledgeSource(content="Water is wet.")], embedder)
+
+    knowledge = _knowledge([StringKnowledgeSource(content="Fire is hot.")], embedder)
+
+    assert sorted(knowledge.storage.collection.get()["documents"]) == [
+        "Fire is hot.",
+        "Water is wet.",
+    ]
+    _knowledge([StringKnowledgeSource(content="Water is wet.")], embedder)
+    assert embedder.embedded == ["Water is wet.", "Fire is hot."]
@@ -0,0 +1,172 @@
+"""Test the memory-mapped, quantized knowledge storage."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.storage.mmap_knowledge_storage import MmapKnowledgeStorage
+
+TOPICS = ["cats", "dogs", "birds", "fish"]
+
+
+class TopicEmbedder(EmbeddingFunction):
+    """Embeds texts by the topics they mention, plus a little noise."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        vectors = []
+        for text in input:
+            seed = sum(map(ord, text))
+            noise = np.random.default_rng(seed).normal(0, 0.05, len(TOPICS))
+            topics = np.array([float(topic in text) for topic in TOPICS])
+            vectors.append((topics + noise).tolist())
+        return vectors
+
+
+EMBEDDER = {"provider": "custom", "config": {"embedder": TopicEmbedder()}}
+DOCUMENTS = [f"Note {i} about {TOPICS[i % 4]}." for i in range(40)]
+
+
+def _storage(tmp_path, **kwargs) -> MmapKnowledgeStorage:
+    return MmapKnowledgeStorage(
+        embedder=EMBEDDER, path=str(tmp_path / "index"), **kwargs
+    )
+
+
+@pytest.mark.parametrize("quantization", ["none", "float16", "int8"])
+def test_search_finds_the_closest_documents(tmp_path, quantization):
+    storage = _storage(tmp_path, quantization=quantization, block_size=16)
+    storage.save(DOCUMENTS)
+
+    results = storage.search(["dogs"], limit=5)
+
+    assert len(results) == 5
+    assert all("dogs" in result["context"] for result in results)
+    assert results == sorted(results, key=lambda r: r["score"], reverse=True)
+
+
+def test_quantized_scores_are_rescored_exactly(tmp_path):
+    exact = _storage(tmp_path / "exact", quantization="none")
+    quantized = _storage(tmp_path / "quantized", quantization="int8")
+    exact.save(DOCUMENTS)
+    quantized.save(DOCUMENTS)
+
+    expected = exact.search(["fish"], limit=3)
+    results = quantized.search(["fish"], limit=3)
+
+    assert [r["id"] for r in results] == [r["id"] for r in expected]
+    assert [r["score"] for r in results] == pytest.approx(
+        [r["score"] for r in expected], abs=1e-6
+    )
+    assert (tmp_path / "quantized" / "index" / "vectors.bin").stat().st_size == (
+        len(DOCUMENTS) * len(TOPICS)
+    )
+
+
+def test_read_only_readers_see_appended_documents(tmp_path):
+    writer = _storage(tmp_path, batch_size=7)
+    reader = _storage(tmp_path, read_only=True)
+    assert reader.search(["cats"]) == []
+
+    writer.save(DOCUMENTS)
+    writer.save(DOCUMENTS[:3])
+
+    assert reader.count == len(DOCUMENTS)
+    assert "cats" in reader.search(["cats"], limit=1)[0]["context"]
+    with pytest.raises(PermissionError):
+        reader.save(["Another note about cats."])
+
+
+def test_unfinished_writes_are_dropped_when_reopened(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save(DOCUMENTS[:4])
+    with open(tmp_path / "index" / "documents.jsonl", "ab") as f:
+        f.write(b'{"id": "partial"')
+
+    reopened = _storage(tmp_path)
+    reopened.save(DOCUMENTS[4:8])
+
+    assert reopened.count == 8
+    assert {r["context"] for r in reopened.search(["birds"], limit=2)} == {
+        DOCUMENTS[2],
+        DOCUMENTS[6],
+    }
+
+
+def test_filter_and_score_threshold(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save(DOCUMENTS, [{"even": i % 2 == 0} for i in range(len(DOCUMENTS))])
+
+    results = storage.search(["cats"], limit=40, filter={"even": True})
+
+    assert len(results) == 10
+    assert all(result["metadata"]["even"] for result in results)
+    close = storage.search(["cats"], limit=40, score_threshold=0.99)
+    assert 0 < len(close) < 10
+    assert all(result["score"] >= 0.99 for result in close)
+
+
+def test_filtered_search_ranks_more_candidates_in_rounds(tmp_path):
+    storage = _storage(tmp_path)
+    documents = [f"Note {i} about {TOPICS[i % 4]}." for i in range(400)]
+    storage.save(documents, [{"group": i % 50} for i in range(len(documents))])
+    storage.search(["cats"])  # Maps the files
+
+    sizes = []
+    candidates = storage._candidates
+
+    def spy(queries, size):
+        sizes.append(size)
+        return candidates(queries, size)
+
+    with (
+        patch.object(storage, "_candidates", side_effect=spy),
+        patch("builtins.open", side_effect=AssertionError("documents reopened")),
+    ):
+        results = storage.search(["cats"], limit=2, filter={"group": 0})
+
+    assert len(results) == 2
+    assert all("cats" in result["context"] for result in results)
+    assert all(result["metadata"]["group"] == 0 for result in results)
+    assert sizes == [8 * 4**round for round in range(len(sizes))]
+    assert len(sizes) > 1
+    assert sizes[-1] < len(documents)
+
+
+def test_knowledge_uses_the_storage(tmp_path):
+    storage = _storage(tmp_path)
+    knowledge = Knowledge(
+        collection_name="mmap",
+        sources=[StringKnowledgeSource(content="Parrots are birds.")],
+        storage=storage,
+    )
+    knowledge.add_sources()
+
+    assert knowledge.query(["birds"])[0]["context"] == "Parrots are birds."
+    knowledge.reset()
+    assert storage.count == 0
+
+
+def test_sources_are_saved_in_batches(tmp_path):
+    storage = _storage(tmp_path, batch_size=16)
+    source = StringKnowledgeSource(
+        content=" ".join(DOCUMENTS), chunk_size=20, chunk_overlap=0
+    )
+    source.storage = storage
+    sizes = []
+    save = storage.save
+
+    def spy(documents, metadata=None):
+        sizes.append(len(documents))
+        return save(documents, metadata)
+
+    with patch.object(storage, "save", side_effect=spy):
+        source.add()
+
+    assert len(sizes) > 1
+    assert all(size == 16 for size in sizes[:-1])
+    assert 0 < sizes[-1] <= 16
+    assert storage.count == sum(sizes)
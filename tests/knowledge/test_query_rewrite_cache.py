@@ -0,0 +1,101 @@
+"""Test the caching of rewritten knowledge search queries."""
+
+from unittest.mock import patch
+
+import pytest
+
+from crewai import LLM, Agent
+from crewai.knowledge.knowledge_config import KnowledgeConfig
+from crewai.knowledge.utils.query_rewrite_cache import (
+    QueryRewriteCache,
+    get_query_rewrite_cache,
+)
+
+
+def _agent(**config) -> Agent:
+    return Agent(
+        role="Information Agent",
+        goal="Provide information based on knowledge sources",
+        backstory="I have access to knowledge sources",
+        llm=LLM(model="gpt-4o-mini"),
+        knowledge_config=KnowledgeConfig(**config),
+    )
+
+
+def test_identical_prompts_are_rewritten_once():
+    agent = _agent()
+
+    with patch.object(agent.llm, "call", return_value="capital France") as call:
+        first = agent._get_knowledge_search_query("What is the capital of France?")
+        second = agent._get_knowledge_search_query("What is the capital of France?")
+        agent._get_knowledge_search_query("What is the capital of Spain?")
+
+    assert first == second == "capital France"
+    assert call.call_count == 2
+
+
+def test_queries_are_not_shared_between_llms():
+    agent = _agent()
+    other = _agent()
+    other.llm = LLM(model="gpt-4o")
+
+    with patch.object(agent.llm, "call", return_value="a") as call:
+        agent._get_knowledge_search_query("Prompt")
+    with patch.object(other.llm, "call", return_value="b") as other_call:
+        assert other._get_knowledge_search_query("Prompt") == "b"
+
+    call.assert_called_once()
+    other_call.assert_called_once()
+
+
+def test_caching_can_be_disabled():
+    agent = _agent(cache_search_query=False)
+
+    with patch.object(agent.llm, "call", return_value="query") as call:
+        agent._get_knowledge_search_query("Prompt")
+        agent._get_knowledge_search_query("Prompt")
+
+    assert call.call_count == 2
+
+
+def test_short_prompts_are_searched_without_rewriting():
+    agent = _agent(direct_query_max_length=20)
+
+    with patch.object(agent.llm, "call", return_value="query") as call:
+        assert agent._get_knowledge_search_query("Capital of France") == (
+            "Capital of France"
+        )
+        agent._get_knowledge_search_query("What is the capital of France?")
+
+    call.assert_called_once()
+
+
+def test_persisted_queries_survive_a_new_process(tmp_path):
+    path = str(tmp_path / "queries.db")
+    key = QueryRewriteCache.key(LLM(model="gpt-4o-mini"), "system", "prompt")
+    QueryRewriteCache(path=path).put(key, "query")
+
+    assert QueryRewriteCache(path=path).get(key) == "query"
+    assert QueryRewriteCache().get(key) is None
+
+
+@pytest.mark.parametrize("persist", [False, True])
+def test_least_recently_used_queries_are_evicted(tmp_path, persist):
+    path = str(tmp_path / "queries.db") if persist else None
+    cache = QueryRewriteCache(path=path, max_entries=2, touch_interval=0)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert [cache.get(key) for key in "abc"] == ["1", None, "3"]
+
+
+def test_agent_copy_keeps_the_rewrite_options():
+    agent = _agent(cache_search_query=False, direct_query_max_length=500)
+
+    config = agent.copy().knowledge_config
+
+    assert config.cache_search_query is False
+    assert config.direct_query_max_length == 500
+    assert get_query_rewrite_cache() is get_query_rewrite_cache()
@@ -0,0 +1,142 @@
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock
+
+from crewai.memory import ShortTermMemory, memory_context
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.memory.storage.query_embeddings import (
+    embed_query,
+    shared_query_embeddings,
+)
+
+
+def _memory(results):
+    memory = MagicMock()
+    memory.search.return_value = results
+    return memory
+
+
+def test_build_context_queries_all_stores_and_records_timings():
+    ltm = _memory([{"metadata": {"suggestions": ["Be concise"]}}])
+    stm = _memory([{"context": "recent insight"}])
+    em = _memory([{"context": "entity"}])
+    exm = _memory([{"context": "external"}])
+    task = MagicMock(description="Research AI")
+
+    contextual_memory = ContextualMemory(stm, ltm, em, exm, task=task)
+    context = contextual_memory.build_context_for_task(task, "")
+
+    assert context == (
+        "Historical Data:\n- Be concise\n"
+        "Recent Insights:\n- recent insight\n"
+        "Entities:\n- entity\n"
+        "External memories:\n- external"
+    )
+    assert set(contextual_memory.retrieval_times_ms) == {
+        "long_term_memory",
+        "short_term_memory",
+        "entity_memory",
+        "external_memory",
+    }
+
+
+def test_build_context_skips_stores_exceeding_timeout():
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_search(*args, **kwargs):
+        release.wait(5)
+        finished.set()
+        return []
+
+    stm = _memory([{"context": "recent insight"}])
+    em = MagicMock()
+    em.search.side_effect = slow_search
+    task = MagicMock(description="Research AI")
+
+    contextual_memory = ContextualMemory(stm, None, em, None, task=task, timeout=0.2)
+    start = time.time()
+    context = contextual_memory.build_context_for_task(task, "")
+    times = contextual_memory.retrieval_times_ms
+    release.set()
+    assert finished.wait(5)
+    time.sleep(0.05)
+
+    assert time.time() - start < 2
+    assert context == "Recent Insights:\n- recent insight"
+    assert set(times) == {"short_term_memory"}
+    assert set(contextual_memory.retrieval_times_ms) == {"short_term_memory"}
+
+
+def test_embed_query_is_shared_across_threads_within_scope():
+    calls = []
+
+    def embed(text):
+        calls.append(text)
+        time.sleep(0.05)
+        return [0.1, 0.2]
+
+    with shared_query_embeddings():
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(embed_query, "openai", "query", embed),
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        embed_query("other-embedder", "query", embed)
+
+    embed_query("openai", "query", embed)
+
+    # One embedding for the three threads, one for the other embedder and
+    # one outside the scope
+    assert calls == ["query", "query", "query"]
+
+
+def test_memory_context_is_isolated_between_concurrent_tasks():
+    memory = ShortTermMemory(storage=MagicMock())
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def run(agent, task):
+        with memory_context(agent=agent, task=task):
+            barrier.wait(timeout=5)
+            seen[agent] = (memory.agent, memory.task)
+
+    threads = [
+        threading.Thread(target=run, args=(name, f"{name} task"))
+        for name in ("researcher", "writer")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {
+        "researcher": ("researcher", "researcher task"),
+        "writer": ("writer", "writer task"),
+    }
+    assert memory.agent is None and memory.task is None
+
+
+def test_build_context_does_not_mutate_shared_memories():
+    stm = ShortTermMemory(storage=MagicMock())
+    seen = []
+    stm.storage.search.side_effect = lambda *args, **kwargs: (
+        seen.append((stm.agent, stm.task)) or []
+    )
+    agent = MagicMock()
+    task = MagicMock(description="Research AI")
+
+    contextual_memory = ContextualMemory(
+        stm, None, None, None, agent=agent, task=task
+    )
+    contextual_memory.build_context_for_task(task, "")
+
+    assert seen == [(agent, task)]
+    assert stm.agent is None and stm.task is None
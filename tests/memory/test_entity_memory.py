@@ -0,0 +1,127 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.memory_events import (
+    MemorySaveCompletedEvent,
+    MemorySaveFailedEvent,
+)
+from crewai.memory.entity.entity_memory import EntityMemory
+from crewai.memory.entity.entity_memory_item import EntityMemoryItem, entity_id
+from crewai.memory.storage.in_memory_vector_storage import InMemoryVectorStorage
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.batches.append(list(input))
+        return [
+            np.array([float("acme" in text.lower()), 1.0], dtype=np.float32)
+            for text in input
+        ]
+
+
+def _entity(name, type, description):
+    return EntityMemoryItem(
+        name=name, type=type, description=description, relationships=""
+    )
+
+
+def test_entity_id_is_stable_across_spelling_variations():
+    assert entity_id("ACME  Corp", "Organization") == entity_id(
+        " acme corp", "organization "
+    )
+    assert entity_id("ACME Corp", "Organization") != entity_id("ACME Corp", "Person")
+
+
+def test_save_upserts_entities_in_one_embedding_batch():
+    embedder = CountingEmbedder()
+    storage = InMemoryVectorStorage(
+        type="entities",
+        embedder_config={"provider": "custom", "config": {"embedder": embedder}},
+    )
+    memory = EntityMemory(storage=storage)
+
+    memory.save(
+        [
+            _entity("ACME Corp", "Organization", "A company"),
+            _entity("Jane", "Person", "CEO of ACME"),
+            _entity("acme corp", "organization", "A rocket company"),
+        ]
+    )
+    memory.save(_entity("Jane", "Person", "Founder of ACME"))
+
+    assert len(embedder.batches) == 2
+    assert len(embedder.batches[0]) == 2
+    assert storage.count() == 2
+    contexts = {r["context"] for r in storage.search("acme", score_threshold=0)}
+    assert contexts == {
+        "acme corp(organization): A rocket company",
+        "Jane(Person): Founder of ACME",
+    }
+
+
+def test_save_reports_the_entities_the_storage_failed_to_save():
+    class FailingEmbedder(EmbeddingFunction):
+        def __call__(self, input: Documents) -> Embeddings:
+            raise RuntimeError("embedding service down")
+
+    storage = InMemoryVectorStorage(
+        type="entities",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": FailingEmbedder()},
+        },
+    )
+    memory = EntityMemory(storage=storage)
+    completed = []
+    failed = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MemorySaveCompletedEvent)
+        def on_completed(source, event):
+            completed.append(event)
+
+        @crewai_event_bus.on(MemorySaveFailedEvent)
+        def on_failed(source, event):
+            failed.append(event)
+
+        with pytest.raises(Exception, match="Partial save: 2 failed out of 2"):
+            memory.save(
+                [
+                    _entity("ACME Corp", "Organization", "A company"),
+                    _entity("Jane", "Person", "CEO of ACME"),
+                ]
+            )
+
+    assert storage.count() == 0
+    assert completed[0].metadata == {
+        "entity_count": 0,
+        "errors": [
+            "ACME Corp: embedding service down",
+            "Jane: embedding service down",
+        ],
+    }
+    assert failed[0].metadata == {"entity_count": 2, "saved": 0}
+
+
+def test_search_returns_one_result_per_entity():
+    storage = MagicMock()
+    storage.search.return_value = [
+        {"context": "ACME(org): new", "metadata": {"entity_id": "acme"}},
+        {"context": "ACME(org): old", "metadata": {"entity_id": "acme"}},
+        {"context": "Jane(person)", "metadata": {"entity_id": "jane"}},
+        {"context": "Bob(person)", "metadata": {}},
+    ]
+    memory = EntityMemory(storage=storage)
+
+    results = memory.search("acme", limit=2)
+
+    storage.search.assert_called_once_with(query="acme", limit=4, score_threshold=0.35)
+    assert [r["context"] for r in results] == ["ACME(org): new", "Jane(person)"]
@@ -0,0 +1,167 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.crew import Crew
+from crewai.memory.storage.in_memory_vector_storage import InMemoryVectorStorage
+
+VOCABULARY = ["python", "rust", "memory", "agent", "weather"]
+
+
+class KeywordEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls += 1
+        return [
+            np.array(
+                [float(word in text.lower()) for word in VOCABULARY] + [0.1],
+                dtype=np.float32,
+            )
+            for text in input
+        ]
+
+
+@pytest.fixture
+def embedder():
+    return KeywordEmbedder()
+
+
+def _storage(embedder, **kwargs):
+    return InMemoryVectorStorage(
+        type="short_term",
+        embedder_config={"provider": "custom", "config": {"embedder": embedder}},
+        **kwargs,
+    )
+
+
+def test_search_returns_most_similar_entries_first(embedder):
+    storage = _storage(embedder)
+    storage.save("Python agents share memory", {"agent": "researcher"})
+    storage.save("Rust memory is fast", {"agent": "writer"})
+    storage.save("The weather is nice", {"agent": "writer"})
+
+    results = storage.search("python memory", limit=2, score_threshold=0.1)
+
+    assert [r["context"] for r in results] == [
+        "Python agents share memory",
+        "Rust memory is fast",
+    ]
+    assert results[0]["metadata"] == {"agent": "researcher"}
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_search_applies_threshold_and_metadata_filter(embedder):
+    storage = _storage(embedder)
+    for index in range(100):
+        storage.save(f"rust note {index}", {"agent": "writer"})
+    storage.save("python memory", {"agent": "researcher"})
+
+    assert storage.count() == 101
+    assert storage.search("python memory", limit=3, score_threshold=0.9) == [
+        {
+            "id": storage.search("python memory", limit=1)[0]["id"],
+            "metadata": {"agent": "researcher"},
+            "context": "python memory",
+            "score": pytest.approx(1.0),
+        }
+    ]
+    filtered = storage.search(
+        "python", limit=5, filter={"agent": "writer"}, score_threshold=0.0
+    )
+    assert len(filtered) == 5
+    assert all(r["metadata"] == {"agent": "writer"} for r in filtered)
+
+
+def test_persisted_storage_is_memory_mapped_on_reload(embedder, tmp_path):
+    storage = _storage(embedder, path=str(tmp_path))
+    storage.save("python memory", {"agent": "researcher"})
+
+    reloaded = _storage(embedder, path=str(tmp_path))
+    assert isinstance(reloaded._matrix, np.memmap)
+    assert reloaded.search("python memory", score_threshold=0.5)[0]["context"] == (
+        "python memory"
+    )
+
+    reloaded.save("rust", {})
+    assert reloaded.count() == 2
+    assert _storage(embedder, path=str(tmp_path)).count() == 2
+
+    reloaded.reset()
+    assert reloaded.search("python memory") == []
+    assert _storage(embedder, path=str(tmp_path)).count() == 0
+
+
+def test_persisted_saves_append_to_the_files(embedder, tmp_path):
+    storage = _storage(embedder, path=str(tmp_path))
+    vectors_path = tmp_path / "short_term.f32"
+    row_size = 4 * (len(VOCABULARY) + 1)
+
+    storage.save_many(["python", "rust"], [{}, {}], ids=["a", "b"])
+    with patch.object(storage, "_rewrite") as rewrite:
+        storage.save_many(["python memory"], [{"v": 2}], ids=["a"])
+        storage.save("agent", {})
+    rewrite.assert_not_called()
+    assert vectors_path.stat().st_size == 4 * row_size
+
+    reloaded = _storage(embedder, path=str(tmp_path))
+    assert reloaded.count() == 3
+    assert [r.document for r in reloaded._records] == ["python memory", "rust", "agent"]
+    assert reloaded.search("python memory", score_threshold=0.9)[0]["metadata"] == {
+        "v": 2
+    }
+    # Replaced entries are compacted away once loaded
+    assert vectors_path.stat().st_size == 3 * row_size
+
+
+def test_persisted_storage_drops_an_interrupted_save(embedder, tmp_path):
+    storage = _storage(embedder, path=str(tmp_path))
+    storage.save_many(["python", "rust"], [{}, {}])
+    with open(tmp_path / "short_term.f32", "ab") as f:
+        f.write(np.ones(len(VOCABULARY) + 1, dtype=np.float32).tobytes())
+    with open(tmp_path / "short_term.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"id": "c", "docu')
+
+    reloaded = _storage(embedder, path=str(tmp_path))
+
+    assert reloaded.count() == 2
+    reloaded.save("agent", {})
+    assert _storage(embedder, path=str(tmp_path)).count() == 3
+
+
+def test_crew_uses_in_process_storage_for_short_term_and_entity_memory(embedder):
+    agent = MagicMock(role="Researcher")
+    crew = Crew.model_construct(
+        agents=[agent],
+        memory_in_process=True,
+        embedder={"provider": "custom", "config": {"embedder": embedder}},
+        short_term_memory=None,
+        entity_memory=None,
+    )
+    crew._long_term_memory = MagicMock()
+    crew._short_term_memory = None
+    crew._initialize_default_memories()
+
+    assert isinstance(crew._short_term_memory.storage, InMemoryVectorStorage)
+    assert isinstance(crew._entity_memory.storage, InMemoryVectorStorage)
+    assert crew._entity_memory.storage.type == "entities"
+
+
+def test_repeated_searches_are_served_from_cache_until_a_write(embedder):
+    storage = _storage(embedder)
+    storage.save("python memory", {})
+    calls = embedder.calls
+
+    storage.search("python", score_threshold=0.1)
+    storage.search("python", score_threshold=0.1)
+    assert embedder.calls == calls + 1
+
+    storage.save("rust", {})
+    assert len(storage.search("python rust", score_threshold=0.1)) == 2
+    assert storage.search("python", score_threshold=0.1)[0]["context"] == (
+        "python memory"
+    )
+    assert embedder.calls == calls + 4
@@ -158,3 +158,25 @@ def test_save_and_search(long_term_memory):
     assert find["metadata"]["quality"] == 0.5
     assert find["metadata"]["task"] == "test_task"
     assert find["metadata"]["expected_output"] == "test_output"
+
+
+def test_crew_limits_the_long_term_memories_kept_per_task():
+    from unittest.mock import MagicMock, patch
+
+    from crewai import Crew
+
+    crew = Crew.model_construct(
+        agents=[MagicMock(role="Researcher")],
+        entity_memory=MagicMock(),
+        long_term_memory_max_entries_per_task=5,
+    )
+    crew._long_term_memory = None
+    crew._short_term_memory = MagicMock()
+
+    with patch(
+        "crewai.memory.long_term.long_term_memory.LTMSQLiteStorage"
+    ) as storage_class:
+        crew._initialize_default_memories()
+
+    storage_class.assert_called_once_with(db_path=None, max_entries_per_task=5)
+    assert crew._long_term_memory.storage is storage_class.return_value
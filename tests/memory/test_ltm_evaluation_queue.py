@@ -0,0 +1,115 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.agents.agent_builder.base_agent_executor_mixin import (
+    CrewAgentExecutorMixin,
+)
+from crewai.memory.long_term.evaluation_queue import LongTermMemoryEvaluationQueue
+from crewai.utilities.evaluators.task_evaluator import TaskEvaluation
+
+
+def _evaluation(quality: float) -> TaskEvaluation:
+    return TaskEvaluation(suggestions=["Be concise"], quality=quality, entities=[])
+
+
+@pytest.fixture
+def evaluation_queue():
+    queue = LongTermMemoryEvaluationQueue(batch_size=3, max_wait_seconds=5)
+    yield queue
+    queue.close()
+
+
+def test_evaluation_queue_batches_tasks_of_the_same_agent(evaluation_queue):
+    agent = MagicMock()
+    saved = []
+
+    with patch(
+        "crewai.memory.long_term.evaluation_queue.TaskEvaluator"
+    ) as evaluator_mock:
+        evaluator_mock.return_value.evaluate_batch.side_effect = lambda pairs: [
+            _evaluation(index) for index, _ in enumerate(pairs)
+        ]
+        for output in ("first", "second", "third"):
+            evaluation_queue.submit(agent, MagicMock(), output, saved.append)
+        evaluation_queue.flush()
+
+    assert evaluator_mock.return_value.evaluate_batch.call_count == 1
+    (pairs,) = evaluator_mock.return_value.evaluate_batch.call_args.args
+    assert [output for _, output in pairs] == ["first", "second", "third"]
+    assert [evaluation.quality for evaluation in saved] == [0, 1, 2]
+    assert evaluation_queue.pending == 0
+
+
+def test_evaluation_queue_flush_does_not_wait_for_a_full_batch(evaluation_queue):
+    saved = []
+
+    with patch(
+        "crewai.memory.long_term.evaluation_queue.TaskEvaluator"
+    ) as evaluator_mock:
+        evaluator_mock.return_value.evaluate_batch.return_value = [_evaluation(8)]
+        evaluation_queue.submit(MagicMock(), MagicMock(), "output", saved.append)
+        done = threading.Event()
+        threading.Thread(
+            target=lambda: (evaluation_queue.flush(), done.set()), daemon=True
+        ).start()
+
+        # The batch waits up to five seconds to fill unless it is flushed
+        assert done.wait(timeout=2)
+
+    assert len(saved) == 1
+
+
+def test_evaluation_queue_survives_evaluation_errors(evaluation_queue):
+    saved = []
+
+    with patch(
+        "crewai.memory.long_term.evaluation_queue.TaskEvaluator"
+    ) as evaluator_mock:
+        evaluator_mock.return_value.evaluate_batch.side_effect = [
+            RuntimeError("LLM unavailable"),
+            [_evaluation(7)],
+        ]
+        evaluation_queue.submit(MagicMock(), MagicMock(), "failed", saved.append)
+        evaluation_queue.flush()
+        evaluation_queue.submit(MagicMock(), MagicMock(), "saved", saved.append)
+        evaluation_queue.flush()
+
+    assert [evaluation.quality for evaluation in saved] == [7]
+
+
+def _executor(crew):
+    executor = CrewAgentExecutorMixin()
+    executor.crew = crew
+    executor.agent = MagicMock(role="Researcher")
+    executor.task = MagicMock(description="Research", expected_output="Notes")
+    return executor
+
+
+def test_create_long_term_memory_submits_to_the_evaluation_queue():
+    crew = MagicMock(memory_evaluation_sample_rate=1.0)
+    executor = _executor(crew)
+    agent, task = executor.agent, executor.task
+
+    executor._create_long_term_memory(MagicMock(text="output"))
+
+    crew._ltm_evaluation_queue.submit.assert_called_once()
+    args = crew._ltm_evaluation_queue.submit.call_args.args
+    assert args[:3] == (agent, task, "output")
+
+    # The evaluation is saved for the submitted task, not the current one
+    executor.task = MagicMock(description="Next task")
+    args[3](_evaluation(9))
+    saved = crew._long_term_memory.save.call_args.args[0]
+    assert saved.task == "Research"
+    assert saved.quality == 9
+
+
+def test_create_long_term_memory_skips_tasks_outside_the_sample():
+    crew = MagicMock(memory_evaluation_sample_rate=0.0)
+
+    _executor(crew)._create_long_term_memory(MagicMock(text="output"))
+
+    crew._ltm_evaluation_queue.submit.assert_not_called()
+    crew._long_term_memory.save.assert_not_called()
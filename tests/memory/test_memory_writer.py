@@ -0,0 +1,111 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.agents.agent_builder.base_agent_executor_mixin import (
+    CrewAgentExecutorMixin,
+)
+from crewai.memory import ShortTermMemory
+from crewai.memory.memory_writer import MemoryWriter
+
+
+@pytest.fixture
+def writer():
+    memory_writer = MemoryWriter(max_queue_size=2)
+    yield memory_writer
+    memory_writer.close()
+
+
+def test_memory_writer_runs_jobs_in_order_and_flushes(writer):
+    saved = []
+
+    for value in range(5):
+        writer.submit(saved.append, value)
+    writer.flush()
+
+    assert saved == [0, 1, 2, 3, 4]
+
+
+def test_memory_writer_applies_backpressure_when_full(writer):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_save():
+        started.set()
+        release.wait()
+
+    writer.submit(slow_save)
+    started.wait()
+    writer.submit(lambda: None)
+    writer.submit(lambda: None)
+
+    blocked_submit = threading.Thread(target=writer.submit, args=(lambda: None,))
+    blocked_submit.start()
+    blocked_submit.join(timeout=0.2)
+    assert blocked_submit.is_alive()
+
+    release.set()
+    blocked_submit.join(timeout=5)
+    assert not blocked_submit.is_alive()
+    writer.flush()
+    assert writer.pending == 0
+
+
+def test_memory_writer_keeps_running_after_failed_job(writer):
+    saved = []
+
+    def failing_save():
+        raise RuntimeError("storage unavailable")
+
+    writer.submit(failing_save)
+    writer.submit(saved.append, "next")
+    writer.flush()
+
+    assert saved == ["next"]
+
+
+def test_create_memories_is_queued_on_crew_writer():
+    writer = MemoryWriter()
+    executor = CrewAgentExecutorMixin()
+    executor.crew = MagicMock(_memory_writer=writer)
+    executor.agent = MagicMock()
+    executor.task = MagicMock()
+    executor._create_short_term_memory = MagicMock()
+    executor._create_long_term_memory = MagicMock()
+    executor._create_external_memory = MagicMock()
+    output = MagicMock()
+
+    release = threading.Event()
+    writer.submit(release.wait)
+    executor._create_memories(output)
+    executor._create_long_term_memory.assert_not_called()
+
+    release.set()
+    writer.flush()
+    executor._create_short_term_memory.assert_called_once_with(output)
+    executor._create_long_term_memory.assert_called_once_with(output)
+    executor._create_external_memory.assert_called_once_with(output)
+    writer.close()
+
+
+def test_queued_memory_saves_keep_the_executor_context():
+    writer = MemoryWriter()
+    memory = ShortTermMemory(storage=MagicMock())
+    executor = CrewAgentExecutorMixin()
+    executor.crew = MagicMock(_memory_writer=writer)
+    executor.agent = MagicMock()
+    executor.task = MagicMock()
+    seen = []
+    executor._create_short_term_memory = lambda output: seen.append(
+        (memory.agent, memory.task)
+    )
+    executor._create_long_term_memory = MagicMock()
+    executor._create_external_memory = MagicMock()
+
+    executor._create_memories(MagicMock())
+    writer.flush()
+    writer.close()
+
+    assert seen == [(executor.agent, executor.task)]
+    assert memory.agent is None
@@ -0,0 +1,134 @@
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai import Agent, Crew, Task
+from crewai.memory.retention import (
+    MemoryRetentionPolicy,
+    RetentionEntry,
+    importance_from_metadata,
+    retention_score,
+    select_entries_to_remove,
+)
+from crewai.memory.storage.in_memory_vector_storage import InMemoryVectorStorage
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+
+DAY = 86400.0
+NOW = 1_000 * DAY
+
+
+class KeywordEmbedder(EmbeddingFunction):
+    def __call__(self, input: Documents) -> Embeddings:
+        return [
+            np.array(
+                [float(word in text.lower()) for word in ("python", "rust", "go")],
+                dtype=np.float32,
+            )
+            for text in input
+        ]
+
+
+def test_retention_score_halves_every_half_life():
+    policy = MemoryRetentionPolicy(recency_half_life_days=10)
+    entry = RetentionEntry(id=1, saved_at=NOW - 20 * DAY, importance=0.8)
+
+    assert retention_score(entry, policy, NOW) == 0.2
+    assert importance_from_metadata({"quality": 7}) == 0.7
+    assert importance_from_metadata({}) == 1.0
+
+
+def test_select_entries_applies_ttl_dedupe_score_and_max_entries():
+    entries = [
+        RetentionEntry(id="expired", saved_at=NOW - 40 * DAY),
+        RetentionEntry(id="old-copy", saved_at=NOW - 2 * DAY, document="Acme(org)"),
+        RetentionEntry(id="new-copy", saved_at=NOW - 1 * DAY, document="Acme(org)"),
+        RetentionEntry(id="near-a", saved_at=NOW - 3 * DAY, embedding=[1.0, 0.01]),
+        RetentionEntry(id="near-b", saved_at=NOW, embedding=[1.0, 0.0]),
+        RetentionEntry(id="faded", saved_at=NOW - 5 * DAY, importance=0.05),
+        RetentionEntry(id="recent", saved_at=NOW, embedding=[0.0, 1.0]),
+        RetentionEntry(id="legacy"),
+    ]
+    policy = MemoryRetentionPolicy(
+        ttl_days=30, min_retention_score=0.1, max_entries=3
+    )
+
+    removed = select_entries_to_remove(entries, policy, now=NOW)
+
+    assert removed == ["expired", "old-copy", "near-a", "faded", "new-copy"]
+
+
+def test_near_duplicates_are_found_among_many_entries():
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((2000, 64))
+    entries = [
+        RetentionEntry(id=f"new-{i}", saved_at=NOW, embedding=vector.tolist())
+        for i, vector in enumerate(vectors)
+    ]
+    entries += [
+        RetentionEntry(
+            id=f"old-{i}",
+            saved_at=NOW - DAY,
+            embedding=(vectors[i] + rng.normal(0, 0.01, 64)).tolist(),
+        )
+        for i in range(0, 2000, 10)
+    ]
+
+    removed = select_entries_to_remove(entries, MemoryRetentionPolicy(), now=NOW)
+
+    assert removed == [f"old-{i}" for i in range(0, 2000, 10)]
+
+
+def test_in_memory_storage_merges_repeated_entities():
+    storage = InMemoryVectorStorage(
+        type="entities",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": KeywordEmbedder()},
+        },
+    )
+    for _ in range(3):
+        storage.save("Python(language): a programming language", {})
+    storage.save("Rust(language): a systems language", {})
+
+    assert storage.apply_retention(MemoryRetentionPolicy()) == 2
+    assert storage.count() == 2
+    assert [r["context"] for r in storage.search("python", score_threshold=0.5)] == [
+        "Python(language): a programming language"
+    ]
+
+
+def test_ltm_storage_applies_ttl_and_drops_duplicates(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    now = time.time()
+    storage.save("research", {"suggestions": ["a"]}, str(now - 90 * DAY), 9)
+    storage.save("research", {"suggestions": ["b"]}, str(now - 2 * DAY), 9)
+    storage.save("research", {"suggestions": ["b"]}, str(now - DAY), 9)
+
+    assert storage.apply_retention(MemoryRetentionPolicy(ttl_days=30)) == 2
+    assert storage.load("research", 10) == [
+        {"metadata": {"suggestions": ["b"]}, "datetime": str(now - DAY), "score": 9}
+    ]
+
+
+def test_crew_compacts_memories_in_background_once_per_interval():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    storage = MagicMock()
+    storage.apply_retention.return_value = 1
+    short_term_memory = MagicMock(storage=storage)
+    crew = Crew(
+        agents=[agent],
+        tasks=[Task(description="Research", expected_output="Notes", agent=agent)],
+        memory_retention=MemoryRetentionPolicy(compaction_interval_seconds=3600),
+    )
+    crew._short_term_memory = short_term_memory
+
+    crew._schedule_memory_compaction()
+    crew._schedule_memory_compaction()
+
+    deadline = time.time() + 5
+    while not storage.apply_retention.called and time.time() < deadline:
+        time.sleep(0.01)
+    storage.apply_retention.assert_called_once_with(crew.memory_retention)
+    assert crew.compact_memories() == {"short": 1}
@@ -368,6 +368,77 @@ class TestChromaDBClient:
                 collection_name="test_collection", documents=[]
             )
 
+    def test_ingest_streams_documents_in_batches(self, mock_chromadb_client):
+        """Test that ingest embeds and upserts a generator batch by batch."""
+        mock_collection = Mock()
+        mock_chromadb_client.get_collection.return_value = mock_collection
+        consumed = []
+        consumed_at_upsert = []
+        mock_collection.upsert.side_effect = lambda **_: consumed_at_upsert.append(
+            len(consumed)
+        )
+
+        def records():
+            for i in range(5):
+                consumed.append(i)
+                yield {"doc_id": f"doc-{i}", "content": f"Document {i}"}
+
+        client = ChromaDBClient(
+            client=mock_chromadb_client,
+            embedding_function=lambda texts: [[float(len(t))] for t in texts],
+        )
+        stats = client.ingest(
+            collection_name="test_collection", documents=records(), batch_size=2
+        )
+
+        assert stats["documents"] == 5
+        assert stats["batches"] == 3
+        calls = mock_collection.upsert.call_args_list
+        assert [call.kwargs["ids"] for call in calls] == [
+            ["doc-0", "doc-1"],
+            ["doc-2", "doc-3"],
+            ["doc-4"],
+        ]
+        assert calls[0].kwargs["embeddings"] == [[10.0], [10.0]]
+        # No batch is read more than two batches ahead of the upserts
+        assert all(count <= 6 for count in consumed_at_upsert)
+
+    @pytest.mark.asyncio
+    async def test_aingest_consumes_async_iterables(self, mock_async_chromadb_client):
+        """Test that aingest embeds and upserts an async generator."""
+        mock_collection = AsyncMock()
+        mock_async_chromadb_client.get_collection = AsyncMock(
+            return_value=mock_collection
+        )
+
+        async def records():
+            for i in range(3):
+                yield {"content": f"Document {i}"}
+
+        client = ChromaDBClient(
+            client=mock_async_chromadb_client,
+            embedding_function=lambda texts: [[1.0] for _ in texts],
+        )
+        stats = await client.aingest(
+            collection_name="test_collection", documents=records(), batch_size=2
+        )
+
+        assert (stats["documents"], stats["batches"]) == (3, 2)
+        calls = mock_collection.upsert.call_args_list
+        assert [call.kwargs["documents"] for call in calls] == [
+            ["Document 0", "Document 1"],
+            ["Document 2"],
+        ]
+
+    def test_ingest_rejects_async_iterables(self, client):
+        """Test that the sync ingest points to aingest for async iterables."""
+
+        async def records():
+            yield {"content": "Document"}
+
+        with pytest.raises(TypeError, match="aingest"):
+            client.ingest(collection_name="test_collection", documents=records())
+
     def test_search(self, client, mock_chromadb_client):
         """Test that search queries the collection correctly."""
         mock_collection = Mock()
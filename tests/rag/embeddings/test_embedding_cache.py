@@ -0,0 +1,146 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from crewai.rag.embeddings.cache import (
+    CachedEmbeddingFunction,
+    CachedTextEmbeddingFunction,
+    EmbeddingCache,
+    embedder_namespace,
+)
+from crewai.rag.embeddings.configurator import EmbeddingConfigurator
+
+
+def _embed(texts):
+    return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return EmbeddingCache(max_entries=3)
+    return EmbeddingCache(
+        path=str(tmp_path / "cache.db"), max_entries=3, touch_interval=0
+    )
+
+
+def test_cached_embedding_function_only_embeds_missing_texts(cache):
+    embed = MagicMock(side_effect=_embed)
+    embedding_function = CachedEmbeddingFunction(embed, cache=cache, namespace="test")
+
+    first = embedding_function(["a", "bb"])
+    second = embedding_function(["bb", "ccc", "ccc"])
+
+    assert np.allclose(first, [[1, 1, 0.5], [2, 1, 0.5]])
+    assert np.allclose(second, [[2, 1, 0.5], [3, 1, 0.5], [3, 1, 0.5]])
+    assert [call.args[0] for call in embed.call_args_list] == [["a", "bb"], ["ccc"]]
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert cache.hit_rate == pytest.approx(0.2)
+
+
+def test_embedding_cache_evicts_least_recently_used(cache):
+    keys = [cache.key("test", text) for text in ("a", "b", "c", "d")]
+    cache.put_many(keys[:3], [[1.0], [2.0], [3.0]])
+    cache.get_many(keys[:1])
+    cache.put_many(keys[3:], [[4.0]])
+
+    found = cache.get_many(keys)
+
+    assert found[0] is not None and found[3] is not None
+    assert sum(vector is not None for vector in found) == 3
+
+
+def test_embedding_cache_separates_embedders(cache):
+    embed = MagicMock(side_effect=_embed)
+    CachedEmbeddingFunction(embed, cache=cache, namespace="openai|small|")(["a"])
+    CachedEmbeddingFunction(embed, cache=cache, namespace="openai|large|")(["a"])
+
+    assert embed.call_count == 2
+
+
+def test_embedding_cache_persists_float16_vectors(tmp_path):
+    path = str(tmp_path / "cache.db")
+    key = EmbeddingCache.key("test", "text")
+    EmbeddingCache(path=path, dtype="float16").put_many([key], [[0.25, 0.5]])
+
+    (vector,) = EmbeddingCache(path=path, dtype="float16").get_many([key])
+    (other_dtype,) = EmbeddingCache(path=path).get_many([key])
+
+    assert vector.dtype == np.float16
+    assert np.allclose(vector, [0.25, 0.5])
+    assert other_dtype is None
+
+
+def test_cached_text_embedding_function(cache):
+    embed = MagicMock(side_effect=lambda text: [float(len(text)), 0.0])
+    embedding_function = CachedTextEmbeddingFunction(
+        embed, cache=cache, namespace="test"
+    )
+
+    assert embedding_function("abc") == [3.0, 0.0]
+    assert embedding_function("abc") == [3.0, 0.0]
+    embed.assert_called_once_with("abc")
+
+
+class _BatchEmbedder:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, text):
+        raise AssertionError("texts should be embedded in batches")
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.0] for text in texts]
+
+
+def test_cached_text_embedding_function_embeds_missing_texts_in_one_batch(cache):
+    embedder = _BatchEmbedder()
+    embedding_function = CachedTextEmbeddingFunction(
+        embedder, cache=cache, namespace="test"
+    )
+
+    assert embedding_function.embed_batch(["a", "bb"]) == [[1.0, 0.0], [2.0, 0.0]]
+    assert embedding_function.embed_batch(["bb", "ccc", "dddd"]) == [
+        [2.0, 0.0],
+        [3.0, 0.0],
+        [4.0, 0.0],
+    ]
+    assert embedder.batches == [["a", "bb"], ["ccc", "dddd"]]
+    assert cache.hits == 1
+
+
+def test_cached_text_embedding_function_batches_plain_functions_text_by_text(cache):
+    embed = MagicMock(side_effect=lambda text: [float(len(text)), 0.0])
+    embedding_function = CachedTextEmbeddingFunction(
+        embed, cache=cache, namespace="test"
+    )
+
+    assert embedding_function.embed_batch(["a", "bb", "a"]) == [
+        [1.0, 0.0],
+        [2.0, 0.0],
+        [1.0, 0.0],
+    ]
+    assert [call.args[0] for call in embed.call_args_list] == ["a", "bb"]
+
+
+def test_configure_embedder_wraps_the_embedder_with_a_cache(tmp_path):
+    path = str(tmp_path / "cache.db")
+    embedder_config = {
+        "provider": "openai",
+        "config": {"api_key": "fake", "model": "text-embedding-3-small"},
+        "cache": {"path": path},
+    }
+
+    embedding_function = EmbeddingConfigurator().configure_embedder(embedder_config)
+
+    assert isinstance(embedding_function, CachedEmbeddingFunction)
+    assert embedding_function.cache.path == path
+    assert embedding_function.namespace == embedder_namespace(
+        None, embedder_config
+    )
+    assert (
+        EmbeddingConfigurator().configure_embedder(embedder_config).cache
+        is embedding_function.cache
+    )
@@ -1,15 +1,43 @@
 """Tests for QdrantClient implementation."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from qdrant_client import AsyncQdrantClient, QdrantClient as SyncQdrantClient
 
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.rag_events import RagDocumentsAddProgressEvent
 from crewai.rag.core.exceptions import ClientMethodMismatchError
+from crewai.rag.embeddings.cache import CachedTextEmbeddingFunction, EmbeddingCache
 from crewai.rag.qdrant.client import QdrantClient
 from crewai.rag.types import BaseRecord
 
 
+class BatchEmbedder:
+    """Embedding function recording the batches of texts it embeds."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def __call__(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return [[float(text.split()[-1]), 1.0] for text in texts]
+
+
+class AsyncBatchEmbedder(BatchEmbedder):
+    """Async embedding function recording the batches of texts it embeds."""
+
+    async def __call__(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return BatchEmbedder.embed_batch(self, texts)
+
+
 @pytest.fixture
 def mock_qdrant_client():
     """Create a mock Qdrant client."""
@@ -360,6 +388,133 @@ class TestQdrantClient:
         point = call_args.kwargs["points"][0]
         assert point.id == "custom-id-123"
 
+    def test_add_documents_in_batches(self, mock_qdrant_client):
+        """Test that add_documents embeds and upserts documents batch by batch."""
+        mock_qdrant_client.collection_exists.return_value = True
+        embedder = BatchEmbedder()
+        client = QdrantClient(
+            client=mock_qdrant_client, embedding_function=embedder, batch_size=2
+        )
+        documents: list[BaseRecord] = [{"content": f"doc {i}"} for i in range(5)]
+        progress = []
+
+        with crewai_event_bus.scoped_handlers():
+
+            @crewai_event_bus.on(RagDocumentsAddProgressEvent)
+            def on_progress(source, event):
+                progress.append((event.added, event.total))
+
+            client.add_documents(collection_name="test_collection", documents=documents)
+
+        assert embedder.batches == [["doc 0", "doc 1"], ["doc 2", "doc 3"], ["doc 4"]]
+        calls = mock_qdrant_client.upsert.call_args_list
+        assert [len(call.kwargs["points"]) for call in calls] == [2, 2, 1]
+        assert [call.kwargs["wait"] for call in calls] == [False, False, True]
+        assert calls[2].kwargs["points"][0].vector == [4.0, 1.0]
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+
+    def test_add_documents_in_batches_through_the_embedding_cache(
+        self, mock_qdrant_client
+    ):
+        """Test that cached embedders embed the documents missing from the cache in batches."""
+        mock_qdrant_client.collection_exists.return_value = True
+        embedder = BatchEmbedder()
+        client = QdrantClient(
+            client=mock_qdrant_client,
+            embedding_function=CachedTextEmbeddingFunction(
+                embedder, cache=EmbeddingCache(), namespace="test"
+            ),
+            batch_size=3,
+        )
+
+        client.add_documents(
+            collection_name="test_collection",
+            documents=[{"content": f"doc {i}"} for i in range(3)],
+        )
+        client.add_documents(
+            collection_name="test_collection",
+            documents=[{"content": f"doc {i}"} for i in range(1, 5)],
+        )
+
+        assert embedder.batches == [["doc 0", "doc 1", "doc 2"], ["doc 3"], ["doc 4"]]
+        calls = mock_qdrant_client.upsert.call_args_list
+        assert [len(call.kwargs["points"]) for call in calls] == [3, 3, 1]
+        assert [point.vector for point in calls[1].kwargs["points"]] == [
+            [1.0, 1.0],
+            [2.0, 1.0],
+            [3.0, 1.0],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aadd_documents_with_async_batch_embedder(
+        self, mock_async_qdrant_client
+    ):
+        """Test that aadd_documents awaits the batches of async embedders."""
+        mock_async_qdrant_client.collection_exists = AsyncMock(return_value=True)
+        mock_async_qdrant_client.upsert = AsyncMock()
+        embedder = AsyncBatchEmbedder()
+        client = QdrantClient(
+            client=mock_async_qdrant_client, embedding_function=embedder, batch_size=2
+        )
+        documents: list[BaseRecord] = [{"content": f"doc {i}"} for i in range(3)]
+
+        await client.aadd_documents(
+            collection_name="test_collection", documents=documents
+        )
+
+        assert embedder.batches == [["doc 0", "doc 1"], ["doc 2"]]
+        calls = mock_async_qdrant_client.upsert.call_args_list
+        assert calls[1].kwargs["points"][0].vector == [2.0, 1.0]
+
+    def test_add_documents_rejects_async_batch_embedder(self, mock_qdrant_client):
+        """Test that add_documents refuses async embedders, batching or not."""
+        mock_qdrant_client.collection_exists.return_value = True
+        client = QdrantClient(
+            client=mock_qdrant_client, embedding_function=AsyncBatchEmbedder()
+        )
+
+        with pytest.raises(TypeError, match="Use aadd_documents"):
+            client.add_documents(
+                collection_name="test_collection", documents=[{"content": "doc 0"}]
+            )
+
+    @pytest.mark.asyncio
+    async def test_aadd_documents_limits_concurrent_embeddings(
+        self, mock_async_qdrant_client
+    ):
+        """Test that aadd_documents embeds texts concurrently, within limits."""
+        mock_async_qdrant_client.collection_exists = AsyncMock(return_value=True)
+        mock_async_qdrant_client.upsert = AsyncMock()
+        running = 0
+        peak = 0
+
+        async def embed(text: str) -> list[float]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [float(len(text))]
+
+        client = QdrantClient(
+            client=mock_async_qdrant_client,
+            embedding_function=embed,
+            batch_size=4,
+            embedding_concurrency=3,
+        )
+        documents: list[BaseRecord] = [{"content": "x" * i} for i in range(10)]
+
+        await client.aadd_documents(
+            collection_name="test_collection", documents=documents
+        )
+
+        assert peak == 3
+        calls = mock_async_qdrant_client.upsert.call_args_list
+        assert [len(call.kwargs["points"]) for call in calls] == [4, 4, 2]
+        assert [call.kwargs["wait"] for call in calls] == [False, False, True]
+        vectors = [point.vector for call in calls for point in call.kwargs["points"]]
+        assert vectors == [[float(i)] for i in range(10)]
+
     @pytest.mark.asyncio
     async def test_aadd_documents_empty_list(
         self, async_client, mock_async_qdrant_client
@@ -412,6 +567,52 @@ class TestQdrantClient:
                 collection_name="test_collection", documents=documents
             )
 
+    def test_ingest_streams_documents(self, mock_qdrant_client):
+        """Test that ingest upserts a generator batch by batch."""
+        mock_qdrant_client.collection_exists.return_value = True
+        client = QdrantClient(
+            client=mock_qdrant_client, embedding_function=BatchEmbedder()
+        )
+
+        stats = client.ingest(
+            collection_name="test_collection",
+            documents=({"content": f"doc {i}"} for i in range(4)),
+            batch_size=2,
+        )
+
+        assert (stats["documents"], stats["batches"]) == (4, 2)
+        calls = mock_qdrant_client.upsert.call_args_list
+        assert [call.kwargs["wait"] for call in calls] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_aingest_consumes_async_iterables(self, mock_async_qdrant_client):
+        """Test that aingest upserts an async generator batch by batch."""
+        mock_async_qdrant_client.collection_exists = AsyncMock(return_value=True)
+        mock_async_qdrant_client.upsert = AsyncMock()
+        client = QdrantClient(
+            client=mock_async_qdrant_client, embedding_function=BatchEmbedder()
+        )
+        progress = []
+
+        async def records():
+            for i in range(5):
+                yield {"content": f"doc {i}"}
+
+        with crewai_event_bus.scoped_handlers():
+
+            @crewai_event_bus.on(RagDocumentsAddProgressEvent)
+            def on_progress(source, event):
+                progress.append((event.added, event.total))
+
+            stats = await client.aingest(
+                collection_name="test_collection", documents=records(), batch_size=2
+            )
+
+        assert (stats["documents"], stats["batches"]) == (5, 3)
+        calls = mock_async_qdrant_client.upsert.call_args_list
+        assert [call.kwargs["wait"] for call in calls] == [False, False, True]
+        assert progress == [(2, None), (4, None), (5, None)]
+
     def test_search(self, client, mock_qdrant_client):
         """Test that search returns matching documents."""
         mock_qdrant_client.collection_exists.return_value = True
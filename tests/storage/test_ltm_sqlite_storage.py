@@ -0,0 +1,78 @@
+import sqlite3
+import threading
+
+import pytest
+
+from crewai.memory.retention import MemoryRetentionPolicy
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "ltm.db")
+
+
+def _memory(task, datetime, score=1.0):
+    return {
+        "task_description": task,
+        "metadata": {"suggestions": [f"{task} at {datetime}"]},
+        "datetime": datetime,
+        "score": score,
+    }
+
+
+def test_load_uses_task_index_and_bound_limit(db_path):
+    storage = LTMSQLiteStorage(db_path=db_path)
+    storage.save_many([_memory("research", str(i)) for i in range(5)])
+    storage.save("write", {"suggestions": []}, "9", 1.0)
+
+    results = storage.load("research", 2)
+    assert [r["datetime"] for r in results] == ["4", "3"]
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+            "WHERE task_description = ? ORDER BY datetime DESC, score ASC LIMIT ?",
+            ("research", 2),
+        ).fetchall()
+    assert "idx_long_term_memories_task" in str(plan)
+    assert "TEMP B-TREE" not in str(plan)
+
+
+def test_apply_retention_keeps_latest_memories_per_task(db_path):
+    LTMSQLiteStorage(db_path=db_path).save_many(
+        [_memory("research", str(i)) for i in range(4)]
+        + [_memory("write", str(i)) for i in range(2)]
+    )
+    storage = LTMSQLiteStorage(db_path=db_path, max_entries_per_task=2)
+
+    policy = MemoryRetentionPolicy(deduplicate=False)
+    assert storage.apply_retention(policy) == 2
+    assert [r["datetime"] for r in storage.load("research", 10)] == ["3", "2"]
+    assert len(storage.load("write", 10)) == 2
+
+
+def test_max_entries_per_task_prunes_on_save(db_path):
+    storage = LTMSQLiteStorage(db_path=db_path, max_entries_per_task=3)
+    for i in range(5):
+        storage.save("research", {"suggestions": []}, str(i), 1.0)
+
+    assert [r["datetime"] for r in storage.load("research", 10)] == ["4", "3", "2"]
+
+
+def test_concurrent_saves_from_many_threads(db_path):
+    storage = LTMSQLiteStorage(db_path=db_path)
+
+    def save(worker):
+        for i in range(20):
+            storage.save(f"task {worker}", {"suggestions": []}, str(i), 1.0)
+
+    threads = [threading.Thread(target=save, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(len(storage.load(f"task {worker}", 50)) == 20 for worker in range(8))
+    assert len(storage._pool._idle) <= storage._pool.max_idle
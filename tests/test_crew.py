@@ -2,13 +2,17 @@
 
 import hashlib
 import json
+import threading
+import time
 from concurrent.futures import Future
 from unittest import mock
 from unittest.mock import ANY, MagicMock, patch
 from collections import defaultdict
 
+import numpy as np
 import pydantic_core
 import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
 
 from crewai.agent import Agent
 from crewai.agents import CacheHandler
@@ -20,6 +24,7 @@ from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSourc
 from crewai.llm import LLM
 from crewai.memory.contextual.contextual_memory import ContextualMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_writer import MemoryWriter
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.process import Process
 from crewai.task import Task
@@ -34,6 +39,7 @@ from crewai.events.types.crew_events import (
     CrewTrainCompletedEvent,
     CrewTrainStartedEvent,
 )
+from crewai.utilities.evaluators.task_evaluator import Entity, TaskEvaluation
 from crewai.utilities.rpm_controller import RPMController
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
 
@@ -1836,6 +1842,131 @@ def test_hierarchical_kickoff_usage_metrics_include_manager(researcher):
         crew.usage_metrics.successful_requests
         == researcher_metrics.successful_requests + manager_metrics.successful_requests
     )
+    assert crew.agent_usage_metrics == {
+        str(researcher.id): researcher_metrics,
+        str(manager.id): manager_metrics,
+    }
+
+
+def test_agent_usage_metrics_keep_agents_sharing_a_role_apart():
+    first = Agent(role="Writer", goal="Write", backstory="Writes")
+    second = Agent(role="Writer", goal="Write", backstory="Writes")
+    first._token_process.sum_prompt_tokens(10)
+    second._token_process.sum_prompt_tokens(20)
+    crew = Crew(
+        agents=[first, second],
+        tasks=[
+            Task(description="Write", expected_output="Text", agent=first),
+            Task(description="Edit", expected_output="Text", agent=second),
+        ],
+    )
+
+    crew.calculate_usage_metrics()
+
+    assert crew.usage_metrics.prompt_tokens == 30
+    assert {
+        agent_id: metrics.prompt_tokens
+        for agent_id, metrics in crew.agent_usage_metrics.items()
+    } == {str(first.id): 10, str(second.id): 20}
+
+
+def test_memory_write_behind_flushes_on_kickoff(researcher):
+    task = Task(
+        description="Say hello",
+        expected_output="Hello",
+        agent=researcher,
+    )
+    crew = Crew(agents=[researcher], tasks=[task], memory_write_behind=True)
+    assert isinstance(crew._memory_writer, MemoryWriter)
+
+    with (
+        patch.object(
+            Task,
+            "execute_sync",
+            return_value=TaskOutput(
+                description="dummy", raw="Hello", agent=researcher.role
+            ),
+        ),
+        patch.object(MemoryWriter, "flush") as flush,
+    ):
+        crew.kickoff()
+
+    flush.assert_called_once()
+
+
+def test_memory_flush_waits_for_evaluations_queued_by_the_writer(researcher):
+    crew = Crew(
+        agents=[researcher],
+        tasks=[
+            Task(description="Say hello", expected_output="Hello", agent=researcher)
+        ],
+        memory_write_behind=True,
+        memory_evaluation_batch_size=4,
+    )
+    saved = []
+
+    def save_in_the_background():
+        time.sleep(0.2)
+        crew._ltm_evaluation_queue.submit(
+            researcher, MagicMock(), "Hello", saved.append
+        )
+
+    with patch(
+        "crewai.memory.long_term.evaluation_queue.TaskEvaluator"
+    ) as evaluator_mock:
+        evaluator_mock.return_value.evaluate_batch.return_value = [
+            TaskEvaluation(suggestions=[], quality=8, entities=[])
+        ]
+        crew._memory_writer.submit(save_in_the_background)
+        crew._flush_memory_writes()
+        crew._close_memory_writers()
+
+    assert len(saved) == 1
+    assert crew._ltm_evaluation_queue.pending == 0
+
+
+def test_kickoff_stops_the_background_memory_threads(researcher):
+    def memory_threads():
+        return {
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith(("crewai-memory-writer", "crewai-ltm"))
+        }
+
+    existing_threads = memory_threads()
+    crew = Crew(
+        agents=[researcher],
+        tasks=[
+            Task(description="Say hello", expected_output="Hello", agent=researcher)
+        ],
+        memory_write_behind=True,
+        memory_evaluation_batch_size=4,
+    )
+
+    with (
+        patch(
+            "crewai.memory.long_term.evaluation_queue.TaskEvaluator"
+        ) as evaluator_mock,
+        patch.object(
+            Task,
+            "execute_sync",
+            return_value=TaskOutput(
+                description="dummy", raw="Hello", agent=researcher.role
+            ),
+        ),
+    ):
+        evaluator_mock.return_value.evaluate_batch.return_value = [
+            TaskEvaluation(suggestions=[], quality=8, entities=[])
+        ]
+        for copy in [crew, crew.copy()]:
+            copy._memory_writer.submit(lambda: None)
+            copy._ltm_evaluation_queue.submit(
+                researcher, MagicMock(), "Hello", lambda evaluation: None
+            )
+            assert memory_threads() - existing_threads
+            copy.kickoff()
+
+    assert memory_threads() <= existing_threads
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
@@ -2476,8 +2607,39 @@ def test_using_contextual_memory():
         contextual_mem.assert_called_once()
 
 
-@pytest.mark.vcr(filter_headers=["authorization"])
-def test_memory_events_are_emitted():
+def test_memory_events_are_emitted(monkeypatch, tmp_path):
+    monkeypatch.setenv("CREWAI_STORAGE_DIR", str(tmp_path))
+
+    class RecordingEmbedder(EmbeddingFunction):
+        def __init__(self):
+            self.batches = []
+
+        def __call__(self, input: Documents) -> Embeddings:
+            self.batches.append(list(input))
+            return [
+                np.array([float(len(text)), 1.0, 0.5, 0.25], dtype=np.float32)
+                for text in input
+            ]
+
+    embedder = RecordingEmbedder()
+    evaluation = TaskEvaluation(
+        suggestions=["Use everyday objects to explain numbers."],
+        quality=8,
+        entities=[
+            Entity(
+                name="Counting",
+                type="Concept",
+                description="Saying numbers in order to find how many things there are.",
+                relationships=["Addition"],
+            ),
+            Entity(
+                name="Addition",
+                type="Concept",
+                description="Putting groups of things together.",
+                relationships=["Counting"],
+            ),
+        ],
+    )
     events = defaultdict(list)
 
     with crewai_event_bus.scoped_handlers():
@@ -2531,10 +2693,30 @@ def test_memory_events_are_emitted():
             agents=[math_researcher],
             tasks=[task1],
             memory=True,
+            embedder={"provider": "custom", "config": {"embedder": embedder}},
         )
 
-        crew.kickoff()
+        with (
+            patch.object(
+                LLM,
+                "call",
+                return_value=(
+                    "Thought: I now can give a great answer\n"
+                    "Final Answer: Counting apples teaches numbers and addition."
+                ),
+            ),
+            patch(
+                "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+            ) as evaluator_mock,
+        ):
+            evaluator_mock.return_value.evaluate.return_value = evaluation
+            crew.kickoff()
 
+    # The two entities are embedded in a single batch
+    assert [
+        "Counting(Concept): Saying numbers in order to find how many things there are.",
+        "Addition(Concept): Putting groups of things together.",
+    ] in embedder.batches
     assert len(events["MemorySaveStartedEvent"]) == 3
     assert len(events["MemorySaveCompletedEvent"]) == 3
     assert len(events["MemorySaveFailedEvent"]) == 0
@@ -3957,6 +4139,39 @@ def test_multimodal_flag_adds_multimodal_tools():
         assert len(used_tools) == 1, "Should only have the AddImageTool"
 
 
+def test_max_tool_output_tokens_adds_read_tool_output_tool():
+    from crewai.tools.agent_tools.read_tool_output_tool import ReadToolOutputTool
+
+    agent = Agent(
+        role="Researcher",
+        goal="Read large documents.",
+        backstory="You're an agent that reads large documents.",
+        max_tool_output_tokens=500,
+    )
+    task = Task(
+        description="Summarize the document.",
+        expected_output="A summary.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task], process=Process.sequential)
+
+    mock_task_output = TaskOutput(
+        description="Mock description", raw="mocked output", agent="mocked agent"
+    )
+
+    with patch.object(
+        Task, "execute_sync", return_value=mock_task_output
+    ) as mock_execute_sync:
+        crew.kickoff()
+
+        _, kwargs = mock_execute_sync.call_args
+        used_tools = kwargs["tools"]
+
+        assert len(used_tools) == 1
+        assert isinstance(used_tools[0], ReadToolOutputTool)
+        assert used_tools[0].store is agent._tool_output_store
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_multimodal_agent_image_tool_handling():
     """
@@ -494,6 +494,57 @@ def test_anthropic_message_formatting(anthropic_llm, system_message, user_messag
     assert formatted[0] == system_message
 
 
+def test_anthropic_prompt_caching_marks_cache_breakpoints(anthropic_llm):
+    messages = [
+        {"role": "system", "content": "static instructions"},
+        {"role": "user", "content": "task"},
+        {"role": "assistant", "content": "thought"},
+    ]
+    agent = MagicMock(prompt_caching=True)
+
+    with patch("litellm.completion") as mocked_completion:
+        mock_message = MagicMock()
+        mock_message.content = "Test response"
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=mock_message)]
+        mocked_completion.return_value = mock_response
+
+        anthropic_llm.call(messages, from_agent=agent)
+
+    sent = mocked_completion.call_args.kwargs["messages"]
+    cache_marker = {"type": "ephemeral"}
+    assert sent[0] == {"role": "user", "content": "."}
+    assert sent[1]["content"][0]["text"] == "static instructions"
+    assert sent[1]["content"][0]["cache_control"] == cache_marker
+    assert sent[2] == {"role": "user", "content": "task"}
+    assert sent[3]["content"][0]["cache_control"] == cache_marker
+    # The caller's messages are left as plain strings
+    assert messages[0]["content"] == "static instructions"
+
+
+def test_streaming_react_response_stops_after_complete_action():
+    llm = LLM(model="gpt-4o", stream=True, stop=["\nObservation:"])
+    chunks = [
+        "Thought: look it up\nAction: search\nAction Input: ",
+        '{"query": ',
+        '"weather"}',
+        "\nObservation: made up",
+        "\nFinal Answer: made up",
+    ]
+    consumed = []
+
+    def stream():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield {"choices": [{"delta": {"content": chunk}}]}
+
+    with patch("litellm.completion", return_value=stream()):
+        result = llm.call("question", from_agent=MagicMock())
+
+    assert result == 'Thought: look it up\nAction: search\nAction Input: {"query": "weather"}'
+    assert len(consumed) == 3
+
+
 def test_deepseek_r1_with_open_router():
     if not os.getenv("OPEN_ROUTER_API_KEY"):
         pytest.skip("OPEN_ROUTER_API_KEY not set; skipping test.")
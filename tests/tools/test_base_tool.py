@@ -231,3 +231,55 @@ def test_max_usage_count_is_respected():
     crew.kickoff()
     assert tool.max_usage_count == 5
     assert tool.current_usage_count == 5
+
+
+class LookupTool(BaseTool):
+    name: str = "Lookup"
+    description: str = "Looks up a key"
+    batch_calls: list = []
+
+    def _run(self, key: str) -> str:
+        return f"value-{key}"
+
+    def _run_batch(self, args_list: list) -> list:
+        self.batch_calls.append([args["key"] for args in args_list])
+        return [f"value-{args['key']}" for args in args_list]
+
+
+def test_run_batch_defaults_to_running_each_argument_set():
+    @tool("Echo")
+    def echo(text: str) -> str:
+        """Echo the input."""
+        return text
+
+    assert not echo.supports_batch
+    assert echo.run_batch([{"text": "a"}, {"text": "b"}]) == ["a", "b"]
+    assert echo.current_usage_count == 2
+    assert echo.to_structured_tool().batch_func is None
+
+
+def test_run_batch_uses_native_batch_implementation():
+    lookup = LookupTool(batch_calls=[])
+
+    assert lookup.supports_batch
+    assert "Tool Batching:" in lookup.description
+    assert lookup.run_batch([{"key": "a"}, {"key": "b"}]) == ["value-a", "value-b"]
+    assert lookup.batch_calls == [["a", "b"]]
+
+    structured = lookup.to_structured_tool()
+    assert structured.invoke_batch([{"key": "c"}, {"key": "d"}]) == [
+        "value-c",
+        "value-d",
+    ]
+    assert lookup.batch_calls == [["a", "b"], ["c", "d"]]
+    assert structured.current_usage_count == 4
+    assert lookup.current_usage_count == 4
+
+
+def test_invoke_batch_respects_max_usage_count():
+    lookup = LookupTool(batch_calls=[], max_usage_count=2)
+    structured = lookup.to_structured_tool()
+
+    with pytest.raises(Exception, match="batch of 3 was requested"):
+        structured.invoke_batch([{"key": "a"}, {"key": "b"}, {"key": "c"}])
+    assert lookup.batch_calls == []
@@ -732,3 +732,255 @@ def test_tool_usage_finished_event_with_cached_result():
     assert isinstance(event.started_at, datetime.datetime)
     assert isinstance(event.finished_at, datetime.datetime)
     assert event.type == "tool_usage_finished"
+
+
+def test_tool_usage_bounds_large_streamed_output():
+    from crewai.tools.agent_tools.read_tool_output_tool import ReadToolOutputTool
+    from crewai.tools.tool_calling import ToolCalling
+
+    class StreamingTool(BaseTool):
+        name: str = "Streaming Tool"
+        description: str = "Streams a large payload"
+
+        def _run(self) -> str:
+            return (f"line {i}\n" for i in range(500))
+
+    agent = Agent(
+        role="Reader",
+        goal="Read large payloads",
+        backstory="You read large payloads.",
+        max_tool_output_tokens=50,
+    )
+    tool = StreamingTool().to_structured_tool()
+    action = MagicMock()
+    action.tool = tool.name
+    action.tool_input = "{}"
+
+    tool_usage = ToolUsage(
+        tools_handler=None,
+        tools=[tool],
+        task=None,
+        function_calling_llm=None,
+        agent=agent,
+        action=action,
+    )
+    result = tool_usage.use(ToolCalling(tool_name=tool.name, arguments={}), "")
+
+    full_output = "".join(f"line {i}\n" for i in range(500))
+    assert result.startswith(full_output[:200])
+    assert full_output[200:400] not in result
+    assert "[Output truncated: page 1 of" in result
+
+    (read_tool,) = agent.get_tool_output_tools()
+    assert isinstance(read_tool, ReadToolOutputTool)
+    output_id = result.split("id: ")[1].split(".")[0]
+    second_page = read_tool.run(output_id=output_id, page=2)
+    assert second_page.startswith(full_output[200:400])
+    assert "page 2 of" in second_page
+    for page in (0, -1):
+        assert read_tool.run(output_id=output_id, page=page).startswith(
+            f"Page {page} is not valid"
+        )
+
+    pages = [
+        agent._tool_output_store.read(output_id, page)
+        for page in range(1, agent._tool_output_store.page_count(output_id) + 1)
+    ]
+    assert "".join(pages) == full_output
+
+
+def test_consume_tool_output_stops_reading_at_max_chars():
+    from crewai.tools.tool_output import consume_tool_output
+
+    read = []
+
+    def stream():
+        try:
+            for i in range(1_000):
+                read.append(i)
+                yield "x" * 10
+        finally:
+            read.append("closed")
+
+    result = consume_tool_output(stream(), max_chars=25, note=" [cut at {max_chars}]")
+    assert result == "x" * 25 + " [cut at 25]"
+    assert read == [0, 1, 2, "closed"]
+    assert consume_tool_output(iter(["a", "b"]), max_chars=2, note="cut") == "ab"
+    assert consume_tool_output(iter(["a", "b"])) == "ab"
+    assert consume_tool_output(["a", "b"], max_chars=1) == ["a", "b"]
+
+
+def test_tool_usage_marks_streamed_output_cut_at_the_store_limit():
+    from crewai.tools.tool_calling import ToolCalling
+    from crewai.tools.tool_output import ToolOutputStore
+
+    class EndlessTool(BaseTool):
+        name: str = "Endless Tool"
+        description: str = "Streams without end"
+
+        def _run(self) -> str:
+            return ("line\n" for _ in iter(int, 1))
+
+    agent = Agent(
+        role="Reader",
+        goal="Read large payloads",
+        backstory="You read large payloads.",
+        max_tool_output_tokens=50,
+    )
+    agent._tool_output_store = ToolOutputStore(page_tokens=50, max_chars=1_000)
+    tool = EndlessTool().to_structured_tool()
+    action = MagicMock()
+    action.tool = tool.name
+    action.tool_input = "{}"
+
+    tool_usage = ToolUsage(
+        tools_handler=None,
+        tools=[tool],
+        task=None,
+        function_calling_llm=None,
+        agent=agent,
+        action=action,
+    )
+    result = tool_usage.use(ToolCalling(tool_name=tool.name, arguments={}), "")
+
+    output_id = result.split("id: ")[1].split(".")[0]
+    store = agent._tool_output_store
+    last_page = store.read(output_id, store.page_count(output_id))
+    assert last_page.endswith(
+        "[The tool output was cut after 1000 characters. The rest of it was not "
+        "read and cannot be paged through.]"
+    )
+
+
+def test_tool_output_store_evicts_the_least_recently_used_outputs():
+    from crewai.tools.tool_output import ToolOutputStore
+
+    store = ToolOutputStore(page_tokens=10, max_outputs=2, max_chars=250)
+    first, second = store.add("a" * 100), store.add("b" * 100)
+    assert store.read(first) is not None
+
+    third = store.add("c" * 100)
+    assert store.page_count(second) == 0
+    assert store.read(first) == "a" * 40
+    assert store.read(third) == "c" * 40
+
+    largest = store.add("d" * 300)
+    assert store.page_count(first) == store.page_count(third) == 0
+    assert store.page_count(largest) == 8
+
+
+def test_tool_usage_keeps_output_unbounded_by_default():
+    from crewai.tools.tool_calling import ToolCalling
+
+    class LargeTool(BaseTool):
+        name: str = "Large Tool"
+        description: str = "Returns a large payload"
+
+        def _run(self) -> str:
+            return "x" * 10_000
+
+    agent = Agent(role="Reader", goal="Read", backstory="You read.")
+    tool = LargeTool().to_structured_tool()
+    action = MagicMock()
+    action.tool = tool.name
+    action.tool_input = "{}"
+
+    tool_usage = ToolUsage(
+        tools_handler=None,
+        tools=[tool],
+        task=None,
+        function_calling_llm=None,
+        agent=agent,
+        action=action,
+    )
+    result = tool_usage.use(ToolCalling(tool_name=tool.name, arguments={}), "")
+
+    assert result == "x" * 10_000
+    assert agent.get_tool_output_tools() == []
+
+
+def test_tool_usage_runs_list_input_as_batch_with_per_element_cache():
+    from crewai.agents.cache.cache_handler import CacheHandler
+    from crewai.agents.tools_handler import ToolsHandler
+
+    class LookupTool(BaseTool):
+        name: str = "Lookup"
+        description: str = "Looks up a key"
+        batch_calls: list = []
+
+        def _run(self, key: str) -> str:
+            return f"value-{key}"
+
+        def _run_batch(self, args_list: list) -> list:
+            self.batch_calls.append([args["key"] for args in args_list])
+            return [f"value-{args['key']}" for args in args_list]
+
+    lookup = LookupTool(batch_calls=[])
+    tool = lookup.to_structured_tool()
+    cache = CacheHandler()
+    cache.add(tool="Lookup", input={"key": "b"}, output="cached-b")
+
+    action = MagicMock()
+    action.tool = "Lookup"
+    action.tool_input = '[{"key": "a"}, {"key": "b"}, {"key": "c"}]'
+
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(cache=cache),
+        tools=[tool],
+        task=None,
+        function_calling_llm=None,
+        agent=None,
+        action=action,
+    )
+    calling = tool_usage.parse_tool_calling(action.tool_input)
+    assert calling.batch_arguments == [{"key": "a"}, {"key": "b"}, {"key": "c"}]
+
+    result = tool_usage.use(calling, action.tool_input)
+
+    assert lookup.batch_calls == [["a", "c"]]
+    assert 'Result 1 for input {"key": "a"}:\nvalue-a' in result
+    assert 'Result 2 for input {"key": "b"}:\ncached-b' in result
+    assert 'Result 3 for input {"key": "c"}:\nvalue-c' in result
+    assert cache.read(tool="Lookup", input={"key": "c"}) == "value-c"
+    assert cache.read(tool="Lookup", input=calling.arguments) is None
+
+
+def test_tool_usage_counts_batch_uses_per_input_and_checks_the_limit_first():
+    from crewai.agents.cache.cache_handler import CacheHandler
+    from crewai.agents.tools_handler import ToolsHandler
+
+    class LookupTool(BaseTool):
+        name: str = "Lookup"
+        description: str = "Looks up a key"
+
+        def _run(self, key: str) -> str:
+            return f"value-{key}"
+
+    tool = LookupTool(max_usage_count=3).to_structured_tool()
+    cache = CacheHandler()
+    cache.add(tool="Lookup", input={"key": "a"}, output="cached-a")
+    cache.add(tool="Lookup", input={"key": "b"}, output="cached-b")
+
+    def use(tool_input):
+        action = MagicMock()
+        action.tool = "Lookup"
+        action.tool_input = tool_input
+        tool_usage = ToolUsage(
+            tools_handler=ToolsHandler(cache=cache),
+            tools=[tool],
+            task=None,
+            function_calling_llm=None,
+            agent=None,
+            action=action,
+        )
+        return tool_usage.use(tool_usage.parse_tool_calling(tool_input), tool_input)
+
+    use('[{"key": "a"}, {"key": "b"}]')
+    assert tool.current_usage_count == 2
+
+    with patch.object(tool, "func") as func:
+        result = use('[{"key": "a"}, {"key": "b"}, {"key": "c"}]')
+
+    func.assert_not_called()
+    assert "can only be used 1 more times" in result
+    assert tool.current_usage_count == 2
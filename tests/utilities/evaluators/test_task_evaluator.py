@@ -101,3 +101,54 @@ def test_training_converter_fallback_mechanism(convert_field_by_field_mock, to_p
     assert result == expected_result
     to_pydantic_mock.assert_called_once()
     convert_field_by_field_mock.assert_called_once()
+
+
+@patch("crewai.utilities.evaluators.task_evaluator.Converter")
+def test_evaluate_batch_uses_a_single_llm_call(converter_mock):
+    from crewai.utilities.evaluators.task_evaluator import (
+        TaskEvaluation,
+        TaskEvaluations,
+    )
+
+    original_agent = MagicMock()
+    original_agent.llm.supports_function_calling.return_value = True
+    evaluations = [
+        TaskEvaluation(suggestions=["a"], quality=7.0, entities=[]),
+        TaskEvaluation(suggestions=["b"], quality=9.0, entities=[]),
+    ]
+    converter_mock.return_value.to_pydantic.return_value = TaskEvaluations(
+        evaluations=evaluations
+    )
+    tasks = [
+        MagicMock(description="Task one", expected_output="One"),
+        MagicMock(description="Task two", expected_output="Two"),
+    ]
+
+    result = TaskEvaluator(original_agent=original_agent).evaluate_batch(
+        [(tasks[0], "first"), (tasks[1], "second")]
+    )
+
+    assert result == evaluations
+    converter_mock.assert_called_once()
+    text = converter_mock.call_args.kwargs["text"]
+    assert "Task 1:" in text and "Task two" in text and "second" in text
+
+
+@patch("crewai.utilities.evaluators.task_evaluator.Converter")
+def test_evaluate_batch_falls_back_to_single_evaluations(converter_mock):
+    from crewai.utilities.evaluators.task_evaluator import TaskEvaluations
+
+    original_agent = MagicMock()
+    original_agent.llm.supports_function_calling.return_value = True
+    converter_mock.return_value.to_pydantic.return_value = TaskEvaluations(
+        evaluations=[]
+    )
+    evaluator = TaskEvaluator(original_agent=original_agent)
+
+    with patch.object(evaluator, "evaluate", return_value="evaluated") as evaluate:
+        result = evaluator.evaluate_batch(
+            [(MagicMock(), "first"), (MagicMock(), "second")]
+        )
+
+    assert result == ["evaluated", "evaluated"]
+    assert evaluate.call_count == 2
@@ -0,0 +1,77 @@
+import pytest
+
+from crewai.utilities.search_cache import SearchCache
+
+
+def test_search_results_are_memoized_until_invalidated():
+    cache = SearchCache()
+    calls = []
+
+    def search():
+        calls.append(1)
+        return [{"context": "result", "metadata": {"source": "a"}}]
+
+    first = cache.get_or_search("query", 3, 0.35, {"source": "a"}, search)
+    first[0]["metadata"]["source"] = "mutated"
+    second = cache.get_or_search("query", 3, 0.35, {"source": "a"}, search)
+
+    assert len(calls) == 1
+    assert second == [{"context": "result", "metadata": {"source": "a"}}]
+
+    cache.get_or_search("query", 5, 0.35, {"source": "a"}, search)
+    cache.get_or_search(["query"], 3, 0.35, None, search)
+    assert len(calls) == 3
+
+    cache.invalidate()
+    cache.get_or_search("query", 3, 0.35, {"source": "a"}, search)
+    assert len(calls) == 4
+    assert cache.version == 1
+
+
+def test_failed_searches_and_results_racing_a_write_are_not_cached():
+    cache = SearchCache()
+
+    def failing_search():
+        raise RuntimeError("vector db unavailable")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_search("query", 3, 0.35, None, failing_search)
+
+    def search_during_write():
+        cache.invalidate()
+        return ["stale"]
+
+    assert cache.get_or_search("query", 3, 0.35, None, search_during_write) == [
+        "stale"
+    ]
+    assert cache.get_or_search("query", 3, 0.35, None, lambda: ["fresh"]) == [
+        "fresh"
+    ]
+
+
+def test_least_recently_used_results_are_evicted():
+    cache = SearchCache(maxsize=2)
+    for query in ("a", "b", "a", "c"):
+        cache.get_or_search(query, 3, 0.35, None, lambda: [query])
+
+    calls = []
+    cache.get_or_search("a", 3, 0.35, None, lambda: calls.append("a") or [])
+    cache.get_or_search("b", 3, 0.35, None, lambda: calls.append("b") or [])
+
+    assert calls == ["b"]
+
+
+def test_caches_sharing_a_namespace_are_invalidated_together():
+    agent_cache = SearchCache(namespace="knowledge/crew")
+    crew_cache = SearchCache(namespace="knowledge/crew")
+    other_cache = SearchCache(namespace="knowledge/other")
+    for cache in (agent_cache, crew_cache, other_cache):
+        cache.get_or_search("query", 3, 0.35, None, lambda: ["old"])
+
+    crew_cache.invalidate()
+
+    assert not agent_cache.contains("query", 3, 0.35, None)
+    assert agent_cache.get_or_search("query", 3, 0.35, None, lambda: ["new"]) == [
+        "new"
+    ]
+    assert other_cache.contains("query", 3, 0.35, None)
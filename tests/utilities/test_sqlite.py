@@ -0,0 +1,41 @@
+from crewai.utilities.sqlite import LRUStore
+
+
+def _last_used(store, key):
+    with store._pool.connection() as conn:
+        return conn.execute(
+            "SELECT last_used FROM entries WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+
+def _count(store):
+    with store._pool.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def test_hits_only_write_their_use_time_once_per_interval(tmp_path):
+    store = LRUStore("entries", path=str(tmp_path / "lru.db"), touch_interval=60)
+    store.put_many([("a", "1")])
+    stored = _last_used(store, "a")
+
+    assert store.get_many(["a", "b"]) == ["1", None]
+    assert _last_used(store, "a") == stored
+
+    store.touch_interval = 0
+    store.get_many(["a"])
+    assert _last_used(store, "a") > stored
+
+
+def test_entries_are_evicted_past_the_high_water_mark(tmp_path):
+    store = LRUStore(
+        "entries", path=str(tmp_path / "lru.db"), max_entries=10, touch_interval=0
+    )
+    for i in range(11):
+        store.put_many([(str(i), str(i))])
+    assert _count(store) == 11
+
+    store.get_many(["0"])
+    store.put_many([("11", "11")])
+
+    assert _count(store) == 10
+    assert store.get_many(["0", "1", "2", "3", "11"]) == ["0", None, None, "3", "11"]